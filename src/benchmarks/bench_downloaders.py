@@ -0,0 +1,124 @@
+"""
+이미지 다운로더 처리량 비교: 스레드 풀(requests) vs asyncio(aiohttp).
+
+    cd src
+    python benchmarks/bench_downloaders.py --images 2000 --latency 0.2 --threads 16 --concurrency 200
+
+로컬 http.server 를 CDN 대신 띄우고 (응답마다 --latency 초 지연, --size KB 본문),
+같은 이미지 목록을 두 백엔드의 download_chapter_images 로 받아 images/s 를 비교합니다.
+이어서 엔진과 같은 경로(DownloadScheduler)로 asyncio 다운로더를 스레드 기본 한도와 asyncio 기본 한도로 각각 돌려,
+전체/호스트별 한도가 처리량을 얼마나 막는지 보여 줍니다 (로컬 서버는 호스트가 하나뿐이라 호스트별 한도가 곧 동시 요청 수).
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.models import ImageItem  # noqa: E402
+from core.downloader import ImageDownloader  # noqa: E402
+from core.async_downloader import AsyncImageDownloader, aiohttp  # noqa: E402
+from core.download_scheduler import (DownloadScheduler, DEFAULT_IMAGE_CONCURRENCY, DEFAULT_PER_HOST,  # noqa: E402
+                                     ASYNC_IMAGE_CONCURRENCY, ASYNC_PER_HOST)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # 동시 연결 수백 개를 받도록
+
+    def __init__(self, latency: float, body: bytes):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.latency = latency
+        self.body = body
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: 연결 풀 재사용을 측정
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_once(name: str, downloader, base_url: str, args) -> float:
+    return _timed(name, downloader, base_url, args, downloader.download_chapter_images)
+
+
+def run_scheduled(name: str, downloader, base_url: str, args, max_concurrent: int, per_host: int) -> float:
+    """엔진처럼 공유 다운로드 풀(DownloadScheduler)을 거쳐 받습니다."""
+    scheduler = DownloadScheduler(downloader, max_concurrent=max_concurrent, per_host=per_host)
+    scheduler.start()
+
+    def download(images, download_dir, referer):
+        return scheduler.submit(images, download_dir, referer).result()
+
+    try:
+        return _timed(name, downloader, base_url, args, download)
+    finally:
+        scheduler.shutdown()
+
+
+def _timed(name: str, downloader, base_url: str, args, download) -> float:
+    images = [ImageItem(url=f"{base_url}/img/{i}.jpg", filename=f"{i:05d}.jpg") for i in range(args.images)]
+    download_dir = tempfile.mkdtemp(prefix="bench_dl_")
+    try:
+        started = time.time()
+        success, total = download(images, download_dir, base_url)
+        elapsed = time.time() - started
+    finally:
+        downloader.close()
+        shutil.rmtree(download_dir, ignore_errors=True)
+    rate = success / elapsed if elapsed > 0 else 0.0
+    print(f"{name:>30}: {success}/{total} images in {elapsed:.1f}s ({rate:.0f} images/s, "
+          f"{rate * args.size / 1024:.1f} MB/s)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare images/s of the thread-pool and asyncio image downloaders")
+    parser.add_argument("--images", type=int, default=1000, help="Number of images to download per run")
+    parser.add_argument("--size", type=int, default=200, help="Image size in KB")
+    parser.add_argument("--latency", type=float, default=0.2, help="Server delay per response in seconds (CDN round trip)")
+    parser.add_argument("--threads", type=int, default=16, help="Thread-pool size of the requests downloader")
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent requests of the asyncio downloader")
+    args = parser.parse_args()
+    if aiohttp is None:
+        print("aiohttp is not installed (pip install aiohttp).")
+        return
+
+    server = StandInServer(args.latency, os.urandom(args.size * 1024))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Benchmark: {args.images} images of {args.size}KB, {args.latency * 1000:.0f}ms latency ({base_url})")
+    try:
+        threaded = run_once(f"threads ({args.threads})", ImageDownloader(max_threads=args.threads), base_url, args)
+        same = run_once(f"asyncio ({args.threads})", AsyncImageDownloader(max_threads=args.threads), base_url, args)
+        wide = run_once(f"asyncio ({args.concurrency})", AsyncImageDownloader(max_threads=args.concurrency), base_url, args)
+        thread_caps = run_scheduled(f"scheduler, thread caps ({DEFAULT_IMAGE_CONCURRENCY}/{DEFAULT_PER_HOST})",
+                                    AsyncImageDownloader(max_threads=args.concurrency), base_url, args,
+                                    DEFAULT_IMAGE_CONCURRENCY, DEFAULT_PER_HOST)
+        async_caps = run_scheduled(f"scheduler, async caps ({ASYNC_IMAGE_CONCURRENCY}/{ASYNC_PER_HOST})",
+                                   AsyncImageDownloader(max_threads=args.concurrency), base_url, args,
+                                   ASYNC_IMAGE_CONCURRENCY, ASYNC_PER_HOST)
+    finally:
+        server.shutdown()
+    if threaded > 0:
+        print(f"Speedup at equal concurrency: {same / threaded:.2f}x, at --concurrency: {wide / threaded:.2f}x")
+    if thread_caps > 0:
+        print(f"asyncio through the scheduler: async caps vs thread caps {async_caps / thread_caps:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+탭 모드 브라우저 단계 처리량 비교: driver_lock + switch_to.window vs 탭별 DevTools 세션.
+
+    cd src
+    python benchmarks/bench_tab_sessions.py https://manatoki.net/comic/123 --episodes 20 --threads 4
+
+목록 페이지에서 에피소드 URL을 한 번 받아 두고, 같은 에피소드들을 두 방식으로 처리합니다.
+이미지 다운로드와 DB 기록은 하지 않고 (이동/대기/스크롤/파싱만) episodes/min 을 비교합니다.
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine import CrawlerEngine, BROWSER_MODE_TABS  # noqa: E402
+from core.work_queue import EpisodeQueue, EpisodeTask, SeriesJob  # noqa: E402
+
+
+class BrowserPhaseEngine(CrawlerEngine):
+    """다운로드 단계로 넘기지 않고 파싱된 에피소드 수만 세는 엔진"""
+
+    def _enqueue_download(self, item) -> bool:
+        return True
+
+
+def run_once(episode_urls: list, job: SeriesJob, args, tab_sessions: bool) -> float:
+    engine = BrowserPhaseEngine(
+        download_path=job.download_path,
+        num_download_threads=args.threads,
+        headless=args.headless,
+        browser_mode=BROWSER_MODE_TABS,
+        image_discovery=args.discovery,
+        persist_session=False,
+        tab_sessions=tab_sessions,
+    )
+    try:
+        engine._init_driver()
+        # 첫 방문(캡챠/캐시)의 영향을 줄이기 위해 목록 페이지를 한 번 열어 둡니다.
+        engine._get_episode_list(job.target_url)
+        work_queue = EpisodeQueue([EpisodeTask(url, job=job) for url in episode_urls], max_retries=0)
+        started = time.time()
+        engine._run_workers(work_queue, max_workers=args.threads)
+        elapsed = time.time() - started
+        parsed = len(engine.discovery_times)
+    finally:
+        engine.stop()
+    rate = parsed * 60 / elapsed if elapsed > 0 else 0.0
+    print(f"{'tab sessions' if tab_sessions else 'shared lock':>12}: {parsed}/{len(episode_urls)} episodes in {elapsed:.1f}s ({rate:.1f} episodes/min)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare episodes/min of lock-based tabs vs per-tab DevTools sessions")
+    parser.add_argument("url", help="Series list URL")
+    parser.add_argument("--episodes", type=int, default=20, help="Number of episodes to process per run")
+    parser.add_argument("--threads", type=int, default=4, help="Number of worker tabs")
+    parser.add_argument("--discovery", choices=["scroll", "dom"], default="scroll", help="Image discovery mode")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    lister = CrawlerEngine(download_path="", headless=args.headless, persist_session=False)
+    try:
+        lister._init_driver()
+        episode_urls, title = lister._get_episode_list(args.url)
+    finally:
+        lister.stop()
+    if not episode_urls:
+        print("No episodes found.")
+        return
+    episode_urls = episode_urls[:args.episodes]
+    job = SeriesJob(target_url=args.url, list_url=args.url, list_title=title, download_path=tempfile.mkdtemp(prefix="bench_"), referer=args.url)
+
+    print(f"Benchmark: {len(episode_urls)} episodes, {args.threads} tabs, {args.discovery} discovery")
+    locked = run_once(episode_urls, job, args, tab_sessions=False)
+    sessions = run_once(episode_urls, job, args, tab_sessions=True)
+    if locked > 0:
+        print(f"Speedup: {sessions / locked:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import os
+import time
+import asyncio
+import threading
+import mimetypes
+import concurrent.futures
+
+import requests
+
+from utils.logger import logger
+from data.models import ImageItem
+from core.downloader import ImageDownloader
+from core.concurrency import (FAILURE_THROTTLE, FAILURE_TIMEOUT, FAILURE_ERROR, FAILURE_FORBIDDEN, FAILURE_NOT_FOUND,
+                              NON_CONGESTION_FAILURES)
+
+try:
+    import aiohttp
+except ImportError:  # 선택 의존성: 없으면 스레드 다운로더를 씁니다 (create_downloader)
+    aiohttp = None
+
+DEFAULT_ASYNC_CONCURRENCY = 200
+CHUNK_SIZE = 64 * 1024
+# requests 세션의 Retry(total=5, backoff_factor=1, 429/5xx) 와 같은 정책
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 1.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REQUEST_TIMEOUT = 30
+STOP_POLL = 0.2
+
+
+class _RetriesExhausted(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status} after {RETRY_TOTAL} retries")
+        self.status = status
+
+
+class AsyncImageDownloader(ImageDownloader):
+    """
+    asyncio + aiohttp 로 이미지를 받는 ImageDownloader.
+
+    전용 스레드 하나에서 이벤트 루프와 연결 풀(aiohttp.ClientSession)을 돌리므로,
+    요청마다 스레드를 쓰지 않고 수백 개의 이미지 요청을 동시에 처리합니다.
+    페이지 HTML(fetch_html)과 쿠키/User-Agent 는 부모의 requests 세션을 그대로 씁니다.
+    download_chapter_images / download_image 는 스레드 다운로더와 같은 계약(블로킹, 같은 반환값)이고,
+    DownloadScheduler 는 submit_image() 로 스레드를 막지 않고 넘깁니다.
+    """
+
+    def __init__(self, max_threads=DEFAULT_ASYNC_CONCURRENCY, host_limits=None):
+        """:param max_threads: 동시 요청 수 (연결 풀 크기). 스레드 다운로더와 인자 이름을 맞췄습니다."""
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is not installed")
+        super().__init__(max_threads=max_threads, host_limits=host_limits)
+        self._loop = None
+        self._client = None
+        self._closed = False
+        self._loop_lock = threading.Lock()
+
+    def close(self):
+        """남은 요청(백오프/호스트 한도 대기 포함)을 취소해 각 Future 를 실패로 끝낸 뒤 루프를 멈춥니다. 닫은 뒤에는 다시 쓸 수 없습니다."""
+        with self._loop_lock:
+            self._closed = True
+            loop, self._loop = self._loop, None
+        if loop:
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_pending(), loop).result(timeout=10)
+            except Exception as e:
+                logger.warning(f"Failed to close async image downloader cleanly: {e}")
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+        super().close()
+
+    def submit_image(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> concurrent.futures.Future:
+        """이미지 하나를 이벤트 루프에 넘기고 Future[bool] 을 바로 반환합니다."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._download_image_async(image_item, download_dir, referer, stop_event), loop)
+
+    def download_image(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
+        return self.submit_image(image_item, download_dir, referer, stop_event).result()
+
+    def download_chapter_images(self, images: list[ImageItem], download_dir: str, referer: str, stop_event=None):
+        if not os.path.exists(download_dir):
+            os.makedirs(download_dir)
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._download_all(images, download_dir, referer, stop_event), loop)
+        return future.result(), len(images)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._closed:
+                raise RuntimeError("AsyncImageDownloader is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=self._run_loop, args=(loop,), name="async-image-download", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _get_client(self):
+        """Assumes running on the LOOP thread."""
+        if self._client is None or self._client.closed:
+            # 쿠키는 requests 세션의 것을 요청마다 헤더로 붙이므로 aiohttp 쪽 쿠키 저장소는 쓰지 않습니다.
+            connector = aiohttp.TCPConnector(limit=self.max_threads, ttl_dns_cache=300)
+            self._client = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar(),
+                                                 timeout=aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT,
+                                                                               sock_read=REQUEST_TIMEOUT))
+        return self._client
+
+    async def _cancel_pending(self):
+        """Assumes running on the LOOP thread."""
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _download_all(self, images: list, download_dir: str, referer: str, stop_event=None) -> int:
+        semaphore = asyncio.Semaphore(self.max_threads)
+
+        async def bounded(image_item):
+            async with semaphore:
+                return await self._download_image_async(image_item, download_dir, referer, stop_event)
+
+        results = await asyncio.gather(*(bounded(image_item) for image_item in images))
+        return sum(1 for ok in results if ok)
+
+    async def _download_image_async(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
+        """download_image 와 같은 규칙: 실패하면 image_item.error 에 실패 종류를 남깁니다."""
+        try:
+            return await self._download_one(image_item, download_dir, referer, stop_event)
+        except asyncio.CancelledError:
+            # close() 가 취소: 취소된 Future 대신 실패(False)로 끝내 DownloadScheduler 의 에피소드가 완료되게 합니다.
+            image_item.error = FAILURE_ERROR
+            return False
+
+    async def _download_one(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
+        image_item.error = ""
+        if image_item.filename and os.path.exists(os.path.join(download_dir, image_item.filename)):
+            return True
+        if not image_item.url:
+            image_item.error = FAILURE_NOT_FOUND
+            return False
+        limit = self.host_limits.for_url(image_item.url) if self.host_limits else None
+        if limit:
+            while not limit.try_acquire():
+                if stop_event and stop_event.is_set():
+                    image_item.error = FAILURE_ERROR
+                    return False
+                await asyncio.sleep(STOP_POLL)
+        started = time.time()
+        try:
+            result = await self._fetch_to_file(image_item, download_dir, referer, stop_event)
+        except Exception as e:
+            logger.error(f"Failed to download {image_item.url}: {type(e).__name__}: {e}")
+            image_item.error = self._classify_async_failure(e)
+            if limit and image_item.error not in NON_CONGESTION_FAILURES:
+                limit.record_failure(image_item.error)
+            return False
+        finally:
+            if limit:
+                limit.release()
+        if limit and result:
+            limit.record_success(time.time() - started)
+        if not result:
+            image_item.error = FAILURE_ERROR
+        return result
+
+    @staticmethod
+    def _classify_async_failure(error: Exception) -> str:
+        if isinstance(error, asyncio.TimeoutError):
+            return FAILURE_TIMEOUT
+        status = getattr(error, "status", None)
+        if isinstance(error, _RetriesExhausted) or status in (429, 503):
+            return FAILURE_THROTTLE
+        if status in (401, 403):
+            return FAILURE_FORBIDDEN
+        if status in (404, 410):
+            return FAILURE_NOT_FOUND
+        return FAILURE_ERROR
+
+    def _request_headers(self, url: str, referer: str) -> dict:
+        headers = {'Referer': referer, 'User-Agent': self.session.headers.get('User-Agent', '')}
+        # 브라우저에서 옮겨 온 쿠키를 requests 와 같은 도메인/경로 규칙으로 고릅니다.
+        cookie = requests.cookies.get_cookie_header(self.session.cookies, requests.Request('GET', url))
+        if cookie:
+            headers['Cookie'] = cookie
+        return headers
+
+    async def _fetch_to_file(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
+        if stop_event and stop_event.is_set():
+            return False
+        client = await self._get_client()
+        img_url = image_item.url
+        headers = self._request_headers(img_url, referer)
+        for attempt in range(RETRY_TOTAL + 1):
+            async with client.get(img_url, headers=headers) as response:
+                if response.status in RETRY_STATUSES:
+                    if attempt == RETRY_TOTAL:
+                        raise _RetriesExhausted(response.status)
+                    await response.release()
+                    if not await self._backoff(attempt, stop_event):
+                        return False
+                    continue
+                response.raise_for_status()
+                return await self._save_response(response, image_item, download_dir, stop_event)
+        return False
+
+    @staticmethod
+    async def _backoff(attempt: int, stop_event=None) -> bool:
+        """재시도 전 대기 (urllib3 Retry 와 같은 지수 백오프). 그 사이 중지되면 False."""
+        deadline = time.time() + RETRY_BACKOFF * (2 ** attempt)
+        while time.time() < deadline:
+            if stop_event and stop_event.is_set():
+                return False
+            await asyncio.sleep(min(STOP_POLL, max(0.0, deadline - time.time())))
+        return True
+
+    @staticmethod
+    async def _save_response(response, image_item: ImageItem, download_dir: str, stop_event=None) -> bool:
+        """
+        본문은 메모리에 모은 뒤 파일 쓰기만 스레드 풀(run_in_executor)에서 합니다.
+        이벤트 루프 스레드에서 디스크 I/O 를 하면 그동안 다른 모든 전송이 멈추기 때문입니다.
+        """
+        if not image_item.filename:
+            content_type = response.headers.get('Content-Type')
+            ext = mimetypes.guess_extension(content_type) if content_type else None
+            image_item.filename = os.path.basename(image_item.url) + (ext or os.path.splitext(image_item.url)[1] or ".jpg")
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            if stop_event and stop_event.is_set():
+                return False
+            body.extend(chunk)
+        filepath = os.path.join(download_dir, image_item.filename)
+        await asyncio.get_running_loop().run_in_executor(None, _write_file, filepath, bytes(body))
+        return True
+
+
+def _write_file(filepath: str, data: bytes):
+    # .part 에 쓴 뒤 rename: 중간에 죽어도 최종 이름의 파일은 항상 완성본
+    part_path = filepath + ".part"
+    with open(part_path, 'wb') as f:
+        f.write(data)
+    os.replace(part_path, filepath)
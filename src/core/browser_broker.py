@@ -0,0 +1,250 @@
+import json
+import secrets
+import threading
+from multiprocessing.connection import Listener, Client
+
+from seleniumbase import Driver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from utils.logger import logger
+
+DEFAULT_BROKER_PORT = 47291
+# 브로커가 유휴 상태로 들고 있는 최대 브라우저 수 (넘으면 반납 시 종료)
+MAX_IDLE_BROWSERS = 8
+
+
+def _options_key(driver_kwargs: dict) -> str:
+    """같은 옵션(headless, 프로필 경로 등)으로 띄운 브라우저끼리만 재사용합니다."""
+    return json.dumps(driver_kwargs, sort_keys=True, default=str)
+
+
+class BrowserBroker:
+    """
+    엔진 실행보다 오래 사는 브라우저 풀.
+    엔진은 브라우저를 빌려(lease) 쓰고 끝나면 반납(release)하므로, 다음 작업은
+    Chrome/undetected-chromedriver 기동 없이 바로 시작합니다.
+    """
+
+    def __init__(self, max_idle: int = MAX_IDLE_BROWSERS):
+        self.max_idle = max_idle
+        self._idle = []  # (options_key, driver)
+        self._leased = {}  # id(driver) -> options_key
+        self._lock = threading.Lock()
+
+    def lease(self, driver_kwargs: dict):
+        key = _options_key(driver_kwargs)
+        while True:
+            with self._lock:
+                match = next((item for item in self._idle if item[0] == key), None)
+                if match:
+                    self._idle.remove(match)
+            if not match:
+                break
+            driver = match[1]
+            if self._is_alive(driver):
+                logger.info("Broker: reusing a warm browser.")
+                with self._lock:
+                    self._leased[id(driver)] = key
+                return driver
+            self._quit(driver)
+
+        logger.info("Broker: launching a new browser.")
+        driver = Driver(**driver_kwargs)
+        with self._lock:
+            self._leased[id(driver)] = key
+        return driver
+
+    def release(self, driver):
+        """브라우저를 초기 상태(탭 1개, about:blank)로 되돌려 유휴 목록에 넣습니다. 쿠키는 유지됩니다."""
+        with self._lock:
+            key = self._leased.pop(id(driver), None)
+        if key is None:
+            self._quit(driver)
+            return
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            driver.get("about:blank")
+            if json.loads(key).get("log_cdp_events"):
+                # 이전 작업의 performance 로그가 다음 작업의 이미지 회수에 섞이지 않도록 비웁니다.
+                driver.get_log("performance")
+        except Exception as e:
+            logger.warning(f"Broker: dropping a browser that could not be reset: {e}")
+            self._quit(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((key, driver))
+                return
+        self._quit(driver)
+
+    def retire(self, driver):
+        """재사용하지 않고 종료합니다 (메모리가 불어난 브라우저 재시작 등)."""
+        with self._lock:
+            self._leased.pop(id(driver), None)
+        self._quit(driver)
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, driver in idle:
+            self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+class BrokerServer:
+    """
+    BrowserBroker 를 별도 프로세스(main.py --broker)로 띄워 CLI 실행 사이에서도 브라우저를 유지합니다.
+    클라이언트에는 WebDriver 세션 주소만 넘겨주고, 클라이언트는 그 세션에 붙어서 사용합니다.
+    """
+
+    def __init__(self, port: int, authkey: bytes):
+        self.address = ('127.0.0.1', port)
+        self.authkey = authkey
+        self.broker = BrowserBroker()
+        self._drivers = {}  # lease_id -> driver
+        self._lock = threading.Lock()
+
+    def serve_forever(self):
+        logger.info(f"Browser broker listening on {self.address[0]}:{self.address[1]}")
+        with Listener(self.address, authkey=self.authkey) as listener:
+            try:
+                while True:
+                    conn = listener.accept()
+                    threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+            finally:
+                self.broker.shutdown()
+
+    def _handle(self, conn):
+        # 연결이 끊기면 (클라이언트 크래시 포함) 그 연결이 빌린 브라우저를 모두 반납합니다.
+        leases = set()
+        try:
+            while True:
+                command, payload = conn.recv()
+                if command == "lease":
+                    driver = self.broker.lease(payload)
+                    lease_id = secrets.token_hex(8)
+                    with self._lock:
+                        self._drivers[lease_id] = driver
+                    leases.add(lease_id)
+                    conn.send({
+                        "lease_id": lease_id,
+                        "executor_url": _executor_url(driver),
+                        "session_id": driver.session_id,
+                        # debuggerAddress 등: 탭별 CDP 세션, 워치독의 탭 닫기, 메모리 측정이 이 값으로 브라우저를 찾습니다.
+                        "capabilities": dict(driver.capabilities),
+                    })
+                elif command in ("release", "retire"):
+                    leases.discard(payload)
+                    self._release(payload, retire=command == "retire")
+                    conn.send(True)
+        except (EOFError, OSError):
+            pass
+        except Exception as e:
+            logger.error(f"Broker connection error: {e}")
+        finally:
+            for lease_id in leases:
+                self._release(lease_id)
+            conn.close()
+
+    def _release(self, lease_id: str, retire: bool = False):
+        with self._lock:
+            driver = self._drivers.pop(lease_id, None)
+        if driver:
+            if retire:
+                self.broker.retire(driver)
+            else:
+                self.broker.release(driver)
+
+
+class RemoteBroker:
+    """다른 프로세스의 BrokerServer 에서 브라우저를 빌려 기존 WebDriver 세션에 붙습니다."""
+
+    def __init__(self, port: int, authkey: bytes):
+        self._conn = Client(('127.0.0.1', port), authkey=authkey)
+        self._leases = {}  # id(driver) -> lease_id
+        self._lock = threading.Lock()
+
+    def lease(self, driver_kwargs: dict):
+        with self._lock:
+            self._conn.send(("lease", driver_kwargs))
+            info = self._conn.recv()
+        driver = AttachedDriver(info["executor_url"], info["session_id"], info.get("capabilities"))
+        self._leases[id(driver)] = info["lease_id"]
+        return driver
+
+    def release(self, driver):
+        self._send_lease_command("release", driver)
+
+    def retire(self, driver):
+        self._send_lease_command("retire", driver)
+
+    def _send_lease_command(self, command: str, driver):
+        lease_id = self._leases.pop(id(driver), None)
+        if lease_id is None:
+            return
+        with self._lock:
+            self._conn.send((command, lease_id))
+            self._conn.recv()
+
+    def shutdown(self):
+        self._conn.close()
+
+
+class AttachedDriver(RemoteWebDriver):
+    """이미 실행 중인 chromedriver 세션에 붙는 드라이버 (새 세션을 만들지 않음)"""
+
+    def __init__(self, executor_url: str, session_id: str, capabilities: dict = None):
+        """:param capabilities: 브로커 프로세스의 원래 세션 capabilities (goog:chromeOptions.debuggerAddress 포함)"""
+        self._attach_session_id = session_id
+        self._attach_capabilities = capabilities or {}
+        executor = ChromiumRemoteConnection(remote_server_addr=executor_url, vendor_prefix="goog", browser_name="chrome")
+        super().__init__(command_executor=executor, options=ChromeOptions())
+
+    def start_session(self, capabilities, *args, **kwargs):
+        self.session_id = self._attach_session_id
+        self.caps = self._attach_capabilities
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        # 브라우저는 브로커 소유이므로 여기서는 종료하지 않습니다 (반납은 RemoteBroker.release).
+        pass
+
+
+def _executor_url(driver) -> str:
+    executor = driver.command_executor
+    url = getattr(executor, "_url", None)
+    if url:
+        return url
+    return executor._client_config.remote_server_addr
+
+
+def broker_authkey(db) -> bytes:
+    """브로커와 클라이언트가 공유하는 인증 키 (같은 DB를 쓰는 프로세스끼리만 접속 가능)"""
+    key = db.get_config("BROKER_AUTHKEY")
+    if not key:
+        key = secrets.token_hex(16)
+        db.set_config("BROKER_AUTHKEY", key)
+    return key.encode()
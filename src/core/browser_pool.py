@@ -0,0 +1,108 @@
+import time
+import threading
+import concurrent.futures
+from contextlib import contextmanager
+
+from utils.logger import logger
+
+
+class BrowserSlot:
+    """
+    워커 하나가 사용하는 브라우저 컨텍스트 (드라이버 + 탭 핸들 + 락).
+
+    - 탭 모드: 여러 슬롯이 하나의 드라이버와 driver_lock 을 공유하고, 작업 전에 자기 탭으로 전환합니다.
+    - 탭 모드 + CDP 세션: 탭마다 전용 DevTools 세션(cdp_tab)이 있어 공유 락과 탭 전환 없이 동시에 동작합니다.
+    - 풀 모드: 슬롯마다 전용 드라이버(브라우저 프로세스)를 소유하므로 락 경합이 없습니다.
+    """
+
+    def __init__(self, driver, lock: threading.Lock, tab_handle: str = None, owns_driver: bool = False):
+        self.driver = driver
+        self.lock = lock
+        self.tab_handle = tab_handle
+        self.owns_driver = owns_driver
+        self.cdp_tab = None
+        self.busy_since = None  # 락을 잡고 브라우저 명령을 실행 중인 시각 (워치독이 멈춤 판단에 사용)
+
+    @property
+    def exclusive(self) -> bool:
+        """다른 워커와 락을 공유하지 않는 슬롯인지 (대기를 잘게 나눌 필요가 없음)"""
+        return self.owns_driver or self.cdp_tab is not None
+
+    @contextmanager
+    def session(self, webdriver: bool = False):
+        """
+        슬롯의 락을 잡고 (필요하면 탭을 전환한 뒤) 드라이버를 넘겨줍니다.
+        CDP 세션이 있으면 그 세션을 넘겨주고, webdriver=True 면 항상 Selenium 드라이버를 넘겨줍니다.
+        """
+        cdp_tab = self.cdp_tab
+        if cdp_tab and not webdriver:
+            with cdp_tab.lock:
+                self.busy_since = time.time()
+                try:
+                    yield cdp_tab
+                finally:
+                    self.busy_since = None
+            return
+        with self.lock:
+            self.busy_since = time.time()
+            try:
+                if self.tab_handle:
+                    self.driver.switch_to.window(self.tab_handle)
+                yield self.driver
+            finally:
+                self.busy_since = None
+
+    def detach_cdp(self):
+        if self.cdp_tab:
+            self.cdp_tab.close()
+            self.cdp_tab = None
+
+
+class DriverPool:
+    """워커마다 독립된 브라우저 프로세스를 띄우는 드라이버 풀"""
+
+    def __init__(self, size: int, launcher, closer=None):
+        """
+        :param launcher: callable(index) -> driver (프로필 경로 등 브라우저별 설정은 호출자가 결정)
+        :param closer: callable(driver) (기본값: driver.quit, 브로커 사용 시 반납)
+        """
+        self.size = max(1, size)
+        self.launcher = launcher
+        self.closer = closer
+        self.slots = []
+
+    def start(self) -> list:
+        """드라이버를 병렬로 기동합니다 (브라우저 기동은 수 초씩 걸리므로)."""
+        logger.info(f"Launching browser pool ({self.size} browsers)...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self.launcher, i) for i in range(self.size)]
+            for future in futures:
+                try:
+                    driver = future.result()
+                    self.slots.append(BrowserSlot(driver, threading.Lock(), owns_driver=True))
+                except Exception as e:
+                    logger.error(f"Failed to launch pooled browser: {e}")
+        logger.info(f"Browser pool ready: {len(self.slots)}/{self.size}")
+        return self.slots
+
+    def replace(self, slot: BrowserSlot) -> BrowserSlot:
+        """응답하지 않는 슬롯의 브라우저를 닫고 같은 자리(같은 프로필)에 새로 띄웁니다."""
+        index = self.slots.index(slot)
+        self._close_driver(slot.driver)
+        new_slot = BrowserSlot(self.launcher(index), threading.Lock(), owns_driver=True)
+        self.slots[index] = new_slot
+        return new_slot
+
+    def close(self):
+        for slot in self.slots:
+            self._close_driver(slot.driver)
+        self.slots = []
+
+    def _close_driver(self, driver):
+        try:
+            if self.closer:
+                self.closer(driver)
+            else:
+                driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,128 @@
+import threading
+from contextlib import contextmanager
+
+from utils.logger import logger
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성: 없으면 에피소드 수 기준으로만 재시작
+    psutil = None
+
+MB = 1024 * 1024
+DEFAULT_RECYCLE_EPISODES = 300
+# 프로세스 트리를 훑는 비용이 있으므로 에피소드 몇 개마다 한 번씩만 메모리를 확인
+RSS_CHECK_EVERY = 10
+
+
+def browser_rss(driver):
+    """chromedriver 와 그 자식 프로세스(Chrome 브라우저/렌더러/GPU)의 RSS 합계 (bytes). 알 수 없으면 None."""
+    if psutil is None:
+        return None
+    process = getattr(getattr(driver, "service", None), "process", None)
+    try:
+        if process is not None:
+            root = psutil.Process(process.pid)
+        else:
+            # 브로커에서 빌린 브라우저: 이 프로세스가 띄우지 않았으므로 디버깅 포트로 브라우저 프로세스를 찾습니다.
+            root = _browser_process(driver)
+            if root is None:
+                return None
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for proc in processes:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def _browser_process(driver):
+    """capabilities 의 debuggerAddress 포트로 띄운 Chrome 브라우저(메인) 프로세스. 없으면 None."""
+    address = (driver.capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+    if not address:
+        return None
+    flag = f"--remote-debugging-port={address.rsplit(':', 1)[-1]}"
+    for proc in psutil.process_iter(["cmdline"]):
+        cmdline = proc.info.get("cmdline") or []
+        # 렌더러/GPU 등 자식 프로세스는 --type= 을 가지므로 제외
+        if flag in cmdline and not any(arg.startswith("--type=") for arg in cmdline):
+            return proc
+    return None
+
+
+class QuiesceGate:
+    """
+    브라우저 작업(에피소드 하나, 목록 페이지 하나) 단위로 드나드는 문.
+    quiesce() 를 잡으면 새 작업이 들어오지 못하고, 이미 들어와 있던 작업이 모두 끝날 때까지 기다립니다.
+    quiesce() 는 entered() 밖에서만 호출해야 합니다.
+    """
+
+    def __init__(self):
+        self._active = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def entered(self):
+        with self._cond:
+            while self._closed:
+                self._cond.wait(0.5)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def quiesce(self):
+        with self._cond:
+            while self._closed:
+                # 다른 스레드의 재시작이 진행 중
+                self._cond.wait(0.5)
+            self._closed = True
+            while self._active:
+                self._cond.wait(0.5)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._closed = False
+                self._cond.notify_all()
+
+
+class BrowserRecycler:
+    """
+    브라우저별 처리 에피소드 수와 메모리(RSS)를 추적해 재시작할 때를 알려 줍니다.
+    긴 배치에서 지연 로딩 이미지, 떨어져 나간 DOM, 렌더러 누수로 Chrome 메모리가 계속 늘어나는 것을 막습니다.
+    """
+
+    def __init__(self, max_episodes: int = DEFAULT_RECYCLE_EPISODES, max_rss_mb: int = 0):
+        self.max_episodes = max_episodes
+        self.max_rss = max_rss_mb * MB if max_rss_mb else 0
+        if self.max_rss and psutil is None:
+            logger.warning("psutil is not installed: browser memory ceiling disabled, recycling by episode count only.")
+            self.max_rss = 0
+        self._counts = {}  # id(driver) -> 처리한 에피소드 수
+        self._lock = threading.Lock()
+
+    def record(self, driver):
+        """에피소드 하나를 끝낸 브라우저를 기록하고, 재시작해야 하면 이유(문자열)를 반환합니다."""
+        with self._lock:
+            count = self._counts.get(id(driver), 0) + 1
+            self._counts[id(driver)] = count
+        if self.max_episodes and count >= self.max_episodes:
+            return f"{count} episodes"
+        if self.max_rss and count % RSS_CHECK_EVERY == 0:
+            rss = browser_rss(driver)
+            if rss and rss > self.max_rss:
+                return f"RSS {rss / MB:.0f}MB"
+        return None
+
+    def forget(self, driver):
+        with self._lock:
+            self._counts.pop(id(driver), None)
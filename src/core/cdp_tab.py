@@ -0,0 +1,131 @@
+import json
+import itertools
+import threading
+import urllib.request
+
+import websocket
+
+from utils.logger import logger
+
+# PAGE_DOWN 과 같은 양만큼 스크롤 (CDP 세션에는 포커스가 없어 키 입력 대신 사용)
+SCROLL_PAGE_JS = "window.scrollBy(0, Math.round(window.innerHeight * 0.875));"
+
+
+class CdpError(RuntimeError):
+    pass
+
+
+class CdpTab:
+    """
+    워커 탭 하나에 직접 연결한 DevTools(CDP) 세션.
+    Selenium 은 "현재 창"이 하나뿐이라 탭마다 switch_to.window 를 공유 락 안에서 해야 하지만,
+    탭별 웹소켓 세션은 서로 독립적이므로 여러 탭에서 이동/스크립트 실행/DOM 읽기를 동시에 할 수 있습니다.
+
+    엔진이 워커 탭에서 쓰는 WebDriver 메서드(execute_script, execute_async_script, page_source,
+    current_url, execute_cdp_cmd)만 같은 이름으로 제공합니다. 캡챠 처리처럼 요소 조작이 필요한
+    작업은 여전히 Selenium 드라이버(BrowserSlot.session(webdriver=True))로 합니다.
+    """
+
+    def __init__(self, ws_url: str, command_timeout: float = 35):
+        self.command_timeout = command_timeout
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # Chrome 111+ 는 Origin 헤더가 있는 웹소켓 연결을 거부하므로 보내지 않습니다.
+        self._ws = websocket.create_connection(ws_url, timeout=command_timeout, suppress_origin=True)
+        self._send_lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, driver, tab_handle: str, command_timeout: float = 35) -> 'CdpTab':
+        """chromedriver 가 띄운 브라우저의 디버깅 포트에서 tab_handle(= target id) 에 해당하는 탭을 찾아 연결합니다."""
+        _, targets = _list_targets(driver)
+        for target in targets:
+            if target.get("id", "").upper() == tab_handle.upper() and target.get("webSocketDebuggerUrl"):
+                tab = cls(target["webSocketDebuggerUrl"], command_timeout=command_timeout)
+                tab._keep_rendering()
+                return tab
+        raise CdpError(f"no DevTools target for tab {tab_handle}")
+
+    def _keep_rendering(self):
+        # 백그라운드 탭도 포커스를 가진 것처럼 동작시켜 지연 로딩/스크롤 이벤트가 멈추지 않도록 합니다.
+        for method, params in (("Emulation.setFocusEmulationEnabled", {"enabled": True}),
+                               ("Page.setWebLifecycleState", {"state": "active"})):
+            try:
+                self.execute_cdp_cmd(method, params)
+            except CdpError as e:
+                logger.debug(f"CDP {method} not supported: {e}")
+
+    def execute_cdp_cmd(self, method: str, params: dict = None) -> dict:
+        message_id = next(self._ids)
+        with self._send_lock:
+            self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+            while True:
+                message = json.loads(self._ws.recv())
+                # 도메인을 enable 하지 않으므로 이벤트는 거의 없지만, 응답이 아닌 메시지는 건너뜁니다.
+                if message.get("id") != message_id:
+                    continue
+                if "error" in message:
+                    raise CdpError(f"{method}: {message['error'].get('message')}")
+                return message.get("result", {})
+
+    def _evaluate(self, expression: str, await_promise: bool = False):
+        result = self.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": await_promise,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            description = details.get("exception", {}).get("description") or details.get("text")
+            raise CdpError(f"script error: {description}")
+        return result.get("result", {}).get("value")
+
+    def execute_script(self, script: str, *args):
+        return self._evaluate(f"(function() {{ {script}\n}}).apply(null, {json.dumps(list(args))})")
+
+    def execute_async_script(self, script: str, *args):
+        """WebDriver 와 같이 마지막 인자로 넘긴 콜백이 호출될 때까지 기다립니다."""
+        expression = (
+            "new Promise((resolve) => { "
+            f"(function() {{ {script}\n}}).apply(null, {json.dumps(list(args))}.concat([resolve])); "
+            "})"
+        )
+        return self._evaluate(expression, await_promise=True)
+
+    @property
+    def page_source(self) -> str:
+        return self._evaluate("document.documentElement.outerHTML")
+
+    @property
+    def current_url(self) -> str:
+        return self._evaluate("location.href")
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+def _list_targets(driver):
+    address = (driver.capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+    if not address:
+        raise CdpError("browser does not expose a debugger address")
+    with urllib.request.urlopen(f"http://{address}/json/list", timeout=5) as response:
+        return address, json.loads(response.read().decode("utf-8"))
+
+
+def close_targets(driver, tab_handle: str = None) -> int:
+    """
+    디버깅 포트의 HTTP 엔드포인트로 탭을 닫습니다 (tab_handle 이 없으면 모든 페이지 탭).
+    WebDriver 명령이 멈춰 드라이버 락을 잡고 있어도 동작하며, 멈춘 명령은 오류로 끝납니다.
+    """
+    address, targets = _list_targets(driver)
+    closed = 0
+    for target in targets:
+        if target.get("type") != "page":
+            continue
+        if tab_handle and target.get("id", "").upper() != tab_handle.upper():
+            continue
+        with urllib.request.urlopen(f"http://{address}/json/close/{target['id']}", timeout=5):
+            closed += 1
+    return closed
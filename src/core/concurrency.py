@@ -0,0 +1,142 @@
+import time
+import threading
+from urllib.parse import urlparse
+
+from utils.logger import logger
+
+# 실패 종류 (record_failure 의 kind)
+FAILURE_THROTTLE = "throttle"  # 429 / 503 (서버가 속도 제한)
+FAILURE_TIMEOUT = "timeout"
+FAILURE_ERROR = "error"  # 그 밖의 5xx / 연결 오류
+FAILURE_CAPTCHA = "captcha"  # 캡챠 페이지 (요청이 너무 잦다는 신호)
+FAILURE_FORBIDDEN = "forbidden"  # 403 (Referer/세션 만료 등)
+FAILURE_NOT_FOUND = "not_found"  # 404/410 (서버에서 사라진 이미지)
+FAILURE_PARSE_EMPTY = "parse_empty"  # 페이지에서 이미지를 찾지 못함
+
+# 다시 시도해도 소용없는 실패 (그 밖의 실패는 실행 끝의 재시도 단계에서 다시 시도)
+PERMANENT_FAILURES = {FAILURE_NOT_FOUND}
+# 혼잡 신호가 아니므로 자동 조절 한도를 줄이지 않는 실패
+NON_CONGESTION_FAILURES = {FAILURE_FORBIDDEN, FAILURE_NOT_FOUND}
+
+# 평균 지연이 기준 지연의 몇 배를 넘으면 혼잡으로 보고 늘리지 않고 1씩 줄입니다.
+LATENCY_CONGESTION_FACTOR = 2.5
+# 연속 감소를 막는 최소 간격 (한 번의 폭주로 여러 요청이 동시에 실패해도 한 번만 줄임)
+DECREASE_COOLDOWN = 5.0
+LATENCY_SMOOTHING = 0.2
+
+DEFAULT_MAX_IMAGE_REQUESTS = 8
+
+
+class AdaptiveLimit:
+    """
+    AIMD(Additive Increase / Multiplicative Decrease) 로 조절되는 동시 실행 한도.
+
+    - 현재 한도만큼 성공하면 (한 "라운드") 한도를 1 늘립니다.
+    - 속도 제한(429/503), 타임아웃, 캡챠, 오류가 나면 한도를 절반으로 줄입니다 (cooldown 동안은 한 번만).
+    - 지연 시간이 기준치보다 크게 늘면 더 늘리지 않고 1 줄입니다.
+    acquire()/release() 로 세마포어처럼 쓰며, 한도가 줄면 이미 실행 중인 작업이 끝날 때까지 새 작업이 기다립니다.
+    """
+
+    def __init__(self, name: str, initial: int, minimum: int = 1, maximum: int = None):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or initial)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.in_flight = 0
+        self._successes = 0
+        self._latency = None  # 지수 이동 평균
+        self._baseline = None  # 지금까지 본 가장 낮은 평균 지연
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, stop_event: threading.Event = None) -> bool:
+        """자리가 날 때까지 기다립니다. 중지되면 False."""
+        with self._cond:
+            while self.in_flight >= self.limit:
+                if stop_event and stop_event.is_set():
+                    return False
+                self._cond.wait(0.5)
+            self.in_flight += 1
+            return True
+
+    def try_acquire(self) -> bool:
+        """기다리지 않는 acquire (asyncio 다운로더가 이벤트 루프를 막지 않도록)"""
+        with self._cond:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def record_success(self, latency: float = None):
+        with self._cond:
+            if latency is not None:
+                self._latency = latency if self._latency is None else (
+                    (1 - LATENCY_SMOOTHING) * self._latency + LATENCY_SMOOTHING * latency)
+                self._baseline = self._latency if self._baseline is None else min(self._baseline, self._latency)
+                if self._latency > self._baseline * LATENCY_CONGESTION_FACTOR:
+                    self._decrease(self.limit - 1, "latency")
+                    return
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self._set_limit(self.limit + 1, "healthy")
+
+    def record_failure(self, kind: str = FAILURE_ERROR):
+        with self._cond:
+            self._decrease(self.limit // 2, kind)
+
+    def _decrease(self, new_limit: int, reason: str):
+        """Assumes LOCK is HELD."""
+        now = time.time()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        # 느려진 상태를 새 기준으로 삼지 않도록 평균만 기준치로 되돌립니다.
+        self._latency = self._baseline
+        self._set_limit(new_limit, reason)
+
+    def _set_limit(self, new_limit: int, reason: str):
+        """Assumes LOCK is HELD."""
+        new_limit = min(max(new_limit, self.minimum), self.maximum)
+        self._successes = 0
+        if new_limit != self.limit:
+            logger.info(f"Adaptive {self.name}: {self.limit} -> {new_limit} ({reason})")
+            self.limit = new_limit
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "maximum": self.maximum,
+                "in_flight": self.in_flight,
+                "latency": self._latency,
+            }
+
+
+class HostLimits:
+    """이미지 서버(호스트)별 AdaptiveLimit. 한 CDN 이 느려져도 다른 호스트의 한도는 그대로 둡니다."""
+
+    def __init__(self, initial: int, maximum: int = DEFAULT_MAX_IMAGE_REQUESTS):
+        self.initial = initial
+        self.maximum = max(initial, maximum)
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> AdaptiveLimit:
+        host = urlparse(url).netloc or "default"
+        with self._lock:
+            limit = self._limits.get(host)
+            if limit is None:
+                limit = AdaptiveLimit(f"images@{host}", self.initial, maximum=self.maximum)
+                self._limits[host] = limit
+            return limit
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            limits = dict(self._limits)
+        return {host: limit.snapshot() for host, limit in limits.items()}
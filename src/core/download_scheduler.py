@@ -0,0 +1,242 @@
+import os
+import heapq
+import itertools
+import threading
+import concurrent.futures
+from collections import deque
+from urllib.parse import urlparse
+
+from utils.logger import logger
+from core.concurrency import FAILURE_ERROR
+from core.work_queue import PRIORITY_URGENT, PRIORITY_NORMAL
+
+DEFAULT_IMAGE_CONCURRENCY = 8
+DEFAULT_PER_HOST = 4
+# asyncio 다운로더의 기본값: 요청마다 스레드를 쓰지 않으므로 연결 풀 크기(DEFAULT_ASYNC_CONCURRENCY)까지 엽니다.
+# 이미지는 대개 CDN 호스트 하나에서 오므로 호스트별 한도가 곧 실제 동시 요청 수입니다.
+ASYNC_IMAGE_CONCURRENCY = 200
+ASYNC_PER_HOST = 200
+# 대기열 상한 = 동시 요청 수 x 이 값 (이미지 수). 넘으면 submit() 이 기다려 브라우저 워커를 늦춥니다.
+QUEUE_IMAGES_PER_SLOT = 20
+
+
+class _EpisodeBatch:
+    """에피소드 하나의 이미지 묶음. 마지막 이미지가 끝나면 future 에 (성공 수, 전체 수)를 넣습니다."""
+
+    def __init__(self, images: list, download_dir: str, referer: str, cancel, on_start=None):
+        self.images = images
+        self.download_dir = download_dir
+        self.referer = referer
+        self.cancel = cancel
+        self.on_start = on_start
+        self.started = False
+        self.remaining = len(images)
+        self.successes = 0
+        self.future = concurrent.futures.Future()
+        self.lock = threading.Lock()
+
+
+class DownloadScheduler:
+    """
+    엔진 전체가 공유하는 이미지 다운로드 풀.
+
+    에피소드마다 스레드 풀을 만들고 가장 느린 이미지를 기다리는 대신, 오래 사는 스레드들이
+    모든 에피소드의 이미지를 하나의 대기열에서 가져갑니다.
+    - 전체 동시 요청 수: max_concurrent (스레드 수)
+    - 호스트별 동시 요청 수: per_host (downloader.host_limits 가 있으면 그 자동 조절 한도)
+    - 대기열이 max_pending 장을 넘으면 submit() 이 자리가 날 때까지 기다립니다 (backpressure).
+    - 호스트별 대기열은 에피소드 priority 순이라, "지금 받기" 에피소드의 이미지는 밀린 이미지보다 먼저 나갑니다.
+    에피소드 완료는 submit() 이 돌려주는 Future 로 알립니다.
+
+    downloader 에 submit_image() 가 있으면 (asyncio 다운로더) 스레드 하나가 이미지를 넘기기만 하고
+    완료 콜백에서 자리를 돌려받으므로, max_concurrent 를 수백으로 잡아도 스레드가 늘지 않습니다.
+    """
+
+    def __init__(self, downloader, max_concurrent: int = DEFAULT_IMAGE_CONCURRENCY, per_host: int = DEFAULT_PER_HOST,
+                 max_pending: int = None):
+        self.downloader = downloader
+        self.max_concurrent = max(1, max_concurrent)
+        self.per_host = max(1, per_host)
+        self.max_pending = max_pending or self.max_concurrent * QUEUE_IMAGES_PER_SLOT
+        self._pending = {}  # host -> heap[(priority, seq, batch, image)]
+        self._seq = itertools.count()
+        self._hosts = deque()  # 라운드 로빈 순서
+        self._pending_count = 0
+        self._active = {}  # host -> 진행 중인 요청 수
+        self._closed = False
+        self._threads = []
+        self._cond = threading.Condition()
+        self._dispatch_only = hasattr(downloader, "submit_image")
+
+    def start(self):
+        with self._cond:
+            self._closed = False
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            for i in range(len(self._threads), 1 if self._dispatch_only else self.max_concurrent):
+                thread = threading.Thread(target=self._loop, name=f"image-download-{i+1}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def shutdown(self, wait: bool = True):
+        """남은 이미지는 받지 않고 실패로 끝냅니다 (각 Future 는 완료됨)."""
+        with self._cond:
+            self._closed = True
+            dropped = [job[2:] for jobs in self._pending.values() for job in jobs]
+            self._pending.clear()
+            self._hosts.clear()
+            self._pending_count = 0
+            self._cond.notify_all()
+            threads = list(self._threads)
+        for batch, image in dropped:
+            image.error = FAILURE_ERROR
+            self._finish_image(batch, False)
+        if wait:
+            for thread in threads:
+                thread.join(timeout=5)
+
+    def submit(self, images: list, download_dir: str, referer: str, cancel=None, stop_event=None, block: bool = True,
+               priority: int = PRIORITY_NORMAL, on_start=None):
+        """
+        에피소드의 이미지들을 대기열에 넣고 Future[(성공 수, 전체 수)] 를 반환합니다.
+        cancel 이 set 되면 (엔진 중지/워치독 취소) 남은 이미지는 받지 않고 실패로 끝냅니다.
+        대기열이 가득 차면 자리가 날 때까지 기다리며, 그 사이 stop_event 가 set 되면 None 을 반환합니다.
+        block=False 면 상한을 넘겨서라도 바로 넣습니다 (다운로드 스레드 안에서 다시 넣을 때).
+        priority 가 작을수록 먼저 받고, PRIORITY_URGENT 는 대기열 상한도 기다리지 않습니다.
+        on_start 는 에피소드의 첫 이미지를 실제로 받기 시작할 때 한 번 호출됩니다 (대기열에서 기다린 시간 제외).
+        """
+        batch = _EpisodeBatch(images, download_dir, referer, cancel, on_start)
+        if not images:
+            batch.future.set_result((0, 0))
+            return batch.future
+        if not os.path.exists(download_dir):
+            os.makedirs(download_dir, exist_ok=True)
+        with self._cond:
+            # 대기열이 비어 있으면 상한보다 큰 에피소드도 받아야 멈추지 않습니다.
+            while block and priority > PRIORITY_URGENT and self._pending_count and self._pending_count + len(images) > self.max_pending:
+                if self._closed or (stop_event and stop_event.is_set()):
+                    return None
+                self._cond.wait(0.5)
+            if self._closed:
+                return None
+            for image in images:
+                host = urlparse(image.url).netloc or "default"
+                if host not in self._pending:
+                    self._pending[host] = []
+                    self._hosts.append(host)
+                heapq.heappush(self._pending[host], (priority, next(self._seq), batch, image))
+            self._pending_count += len(images)
+            self._cond.notify_all()
+        return batch.future
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "pending": self._pending_count,
+                "max_pending": self.max_pending,
+                "active": sum(self._active.values()),
+                "max_concurrent": self.max_concurrent,
+            }
+
+    def _host_capacity(self, host: str, image) -> int:
+        host_limits = self.downloader.host_limits
+        if host_limits:
+            return host_limits.for_url(image.url).limit
+        return self.per_host
+
+    def _next_job(self):
+        """
+        Assumes LOCK is HELD. 자리가 남은 호스트 중 맨 앞 이미지의 priority 가 가장 작은 곳을 고르고,
+        같으면 라운드 로빈 순서로 다음 이미지를 꺼냅니다.
+        """
+        chosen = None
+        for host in self._hosts:
+            jobs = self._pending[host]
+            if self._active.get(host, 0) >= self._host_capacity(host, jobs[0][3]):
+                continue
+            if chosen is None or jobs[0][0] < self._pending[chosen][0][0]:
+                chosen = host
+        if chosen is None:
+            return None
+        self._hosts.remove(chosen)
+        jobs = self._pending[chosen]
+        _, _, batch, image = heapq.heappop(jobs)
+        first, batch.started = not batch.started, True
+        if jobs:
+            self._hosts.append(chosen)
+        else:
+            del self._pending[chosen]
+        self._pending_count -= 1
+        self._active[chosen] = self._active.get(chosen, 0) + 1
+        self._cond.notify_all()
+        return chosen, batch, image, first
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                job = self._next_slot()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._cond.wait(0.5)
+                    job = self._next_slot()
+            host, batch, image, first = job
+            if first and batch.on_start is not None:
+                batch.on_start()
+            if self._dispatch_only and not (batch.cancel is not None and batch.cancel.is_set()):
+                self._dispatch(host, batch, image)
+                continue
+            try:
+                if batch.cancel is not None and batch.cancel.is_set():
+                    image.error = FAILURE_ERROR
+                    ok = False
+                else:
+                    ok = self.downloader.download_image(image, batch.download_dir, batch.referer, batch.cancel)
+            except Exception as e:
+                logger.error(f"Image download failed unexpectedly {image.url}: {e}")
+                image.error = FAILURE_ERROR
+                ok = False
+            finally:
+                with self._cond:
+                    self._active[host] -= 1
+                    self._cond.notify_all()
+            self._finish_image(batch, ok)
+
+    def _next_slot(self):
+        """Assumes LOCK is HELD. 전체 동시 요청 수가 차 있으면 None."""
+        if self._dispatch_only and sum(self._active.values()) >= self.max_concurrent:
+            return None
+        return self._next_job()
+
+    def _dispatch(self, host: str, batch: _EpisodeBatch, image):
+        try:
+            future = self.downloader.submit_image(image, batch.download_dir, batch.referer, batch.cancel)
+        except Exception as e:
+            logger.error(f"Image download failed unexpectedly {image.url}: {e}")
+            image.error = FAILURE_ERROR
+            self._image_done(host, batch, None)
+            return
+        future.add_done_callback(lambda done: self._image_done(host, batch, done, image))
+
+    def _image_done(self, host: str, batch: _EpisodeBatch, future, image=None):
+        ok = False
+        if future is not None:
+            try:
+                ok = future.result()
+            except Exception as e:
+                logger.error(f"Image download failed unexpectedly {image.url}: {e}")
+                image.error = FAILURE_ERROR
+        with self._cond:
+            self._active[host] -= 1
+            self._cond.notify_all()
+        self._finish_image(batch, ok)
+
+    @staticmethod
+    def _finish_image(batch: _EpisodeBatch, ok: bool):
+        with batch.lock:
+            if ok:
+                batch.successes += 1
+            batch.remaining -= 1
+            done = batch.remaining == 0
+        if done:
+            batch.future.set_result((batch.successes, len(batch.images)))
+
@@ -1,15 +1,35 @@
 import os
+import time
 import requests
 import mimetypes
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.logger import logger
 from data.models import ImageItem
+from core.concurrency import (FAILURE_THROTTLE, FAILURE_TIMEOUT, FAILURE_ERROR, FAILURE_FORBIDDEN, FAILURE_NOT_FOUND,
+                              NON_CONGESTION_FAILURES)
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+DOWNLOADER_THREADS = "threads"
+DOWNLOADER_ASYNC = "asyncio"
+DOWNLOADER_BACKENDS = (DOWNLOADER_THREADS, DOWNLOADER_ASYNC)
+
+
+def create_downloader(backend: str = DOWNLOADER_THREADS, **kwargs):
+    """DOWNLOADER_BACKEND 설정에 맞는 다운로더. asyncio 백엔드에 aiohttp 가 없으면 스레드 다운로더로 대신합니다."""
+    if backend == DOWNLOADER_ASYNC:
+        from core.async_downloader import AsyncImageDownloader, aiohttp
+        if aiohttp is not None:
+            return AsyncImageDownloader(**kwargs)
+        logger.warning("aiohttp is not installed: using the thread-pool image downloader.")
+    return ImageDownloader(**kwargs)
+
+
 class ImageDownloader:
-    def __init__(self, max_threads=4):
+    def __init__(self, max_threads=4, host_limits=None):
+        """:param host_limits: HostLimits 를 주면 호스트별 동시 요청 수를 응답에 따라 자동 조절합니다."""
         self.max_threads = max_threads
+        self.host_limits = host_limits
         self.session = self._create_session()
 
     def _create_session(self):
@@ -20,43 +40,116 @@ class ImageDownloader:
         session.mount('http://', adapter)
         return session
 
+    def close(self):
+        self.session.close()
+
+    def import_browser_session(self, cookies: list, user_agent: str = None):
+        """브라우저(캡챠를 통과한 세션)의 쿠키와 User-Agent 를 requests 세션으로 옮깁니다."""
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/'),
+            )
+
+    def fetch_html(self, url: str, referer: str = None, timeout: int = 30):
+        """페이지 HTML을 브라우저 없이 가져옵니다. (최종 URL, HTML)을 반환합니다."""
+        headers = {'Referer': referer} if referer else {}
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            # charset 이 없는 text/html 은 requests 가 latin-1 로 가정하므로 본문으로 추정
+            response.encoding = response.apparent_encoding
+        return response.url, response.text
+
     def download_image(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
-        try:
-            if stop_event and stop_event.is_set():
-                return False
-
-            # Simple extension check or use mimetypes
-            img_url = image_item.url
-            if not img_url: 
-                return False
-
-            headers = {'Referer': referer}
-            response = self.session.get(img_url, headers=headers, stream=True, timeout=30)
-            response.raise_for_status()
-
-            if not image_item.filename:
-                # Determine filename from URL or header
-                content_type = response.headers.get('Content-Type')
-                ext = mimetypes.guess_extension(content_type) or os.path.splitext(img_url)[1] or ".jpg"
-                # This assumes caller handles naming index, but if not provided, use hash or random?
-                # Better to let caller provide filename. if not:
-                image_item.filename = os.path.basename(img_url) + ext
-
-            filepath = os.path.join(download_dir, image_item.filename)
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if stop_event and stop_event.is_set():
-                        f.close()
-                        os.remove(filepath) # clean up partial
-                        return False
-                    f.write(chunk)
+        """실패하면 image_item.error 에 실패 종류를 남깁니다."""
+        image_item.error = ""
+        if image_item.filename and os.path.exists(os.path.join(download_dir, image_item.filename)):
+            # 완성된 파일만 최종 이름으로 존재하므로 (중단된 실행에서 받은 것) 다시 받지 않습니다.
             return True
-
+        if not image_item.url:
+            image_item.error = FAILURE_NOT_FOUND
+            return False
+        limit = self.host_limits.for_url(image_item.url) if self.host_limits else None
+        if limit and not limit.acquire(stop_event):
+            image_item.error = FAILURE_ERROR
+            return False
+        started = time.time()
+        try:
+            result = self._download_image(image_item, download_dir, referer, stop_event)
         except Exception as e:
             logger.error(f"Failed to download {image_item.url}: {e}")
+            image_item.error = self._classify_failure(e)
+            if limit and image_item.error not in NON_CONGESTION_FAILURES:
+                limit.record_failure(image_item.error)
+            return False
+        finally:
+            if limit:
+                limit.release()
+        if limit and result:
+            limit.record_success(time.time() - started)
+        if not result:
+            # 중지/취소로 끝난 경우
+            image_item.error = FAILURE_ERROR
+        return result
+
+    @staticmethod
+    def _classify_failure(error: Exception) -> str:
+        if isinstance(error, requests.Timeout):
+            return FAILURE_TIMEOUT
+        if isinstance(error, requests.exceptions.RetryError):
+            # Retry 어댑터가 429/5xx 를 다 소진한 경우
+            return FAILURE_THROTTLE
+        response = getattr(error, 'response', None)
+        if response is not None:
+            if response.status_code in (429, 503):
+                return FAILURE_THROTTLE
+            if response.status_code in (401, 403):
+                return FAILURE_FORBIDDEN
+            if response.status_code in (404, 410):
+                return FAILURE_NOT_FOUND
+        return FAILURE_ERROR
+
+    def _download_image(self, image_item: ImageItem, download_dir: str, referer: str, stop_event=None) -> bool:
+        """예외는 호출자(download_image)가 기록합니다."""
+        if stop_event and stop_event.is_set():
             return False
 
+        # Simple extension check or use mimetypes
+        img_url = image_item.url
+        if not img_url: 
+            return False
+
+        headers = {'Referer': referer}
+        response = self.session.get(img_url, headers=headers, stream=True, timeout=30)
+        response.raise_for_status()
+
+        if not image_item.filename:
+            # Determine filename from URL or header
+            content_type = response.headers.get('Content-Type')
+            ext = mimetypes.guess_extension(content_type) or os.path.splitext(img_url)[1] or ".jpg"
+            # This assumes caller handles naming index, but if not provided, use hash or random?
+            # Better to let caller provide filename. if not:
+            image_item.filename = os.path.basename(img_url) + ext
+
+        filepath = os.path.join(download_dir, image_item.filename)
+        part_path = filepath + ".part"
+        
+        # .part 에 받은 뒤 rename: 중간에 죽어도 최종 이름의 파일은 항상 완성본
+        with open(part_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if stop_event and stop_event.is_set():
+                    f.close()
+                    os.remove(part_path) # clean up partial
+                    return False
+                f.write(chunk)
+        os.replace(part_path, filepath)
+        return True
+
     def download_chapter_images(self, images: list[ImageItem], download_dir: str, referer: str, stop_event=None):
         if not os.path.exists(download_dir):
             os.makedirs(download_dir)
@@ -64,7 +157,9 @@ class ImageDownloader:
         total_images = len(images)
         success_count = 0
         
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+        # 호스트별 한도를 쓰면 실제 동시 요청 수는 한도가 정하므로, 풀은 한도의 최대치만큼 준비합니다.
+        max_workers = self.host_limits.maximum if self.host_limits else self.max_threads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_img = {
                 executor.submit(self.download_image, img, download_dir, referer, stop_event): img 
                 for img in images
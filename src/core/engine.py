@@ -1,43 +1,217 @@
 import time
 import os
 import re
+import hashlib
+import itertools
+import collections
 import threading
+import queue
 import concurrent.futures
 from urllib.parse import urlparse
 from seleniumbase import Driver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from utils.logger import logger
-from data.db_repository import db
+from data.db_repository import db, url_key
 from parser.manatoki import ManatokiParser
 from core.captcha_solver import GeminiSolver
-from core.downloader import ImageDownloader
+from core.downloader import create_downloader, DOWNLOADER_THREADS
+from core.download_scheduler import (DownloadScheduler, DEFAULT_IMAGE_CONCURRENCY, DEFAULT_PER_HOST, ASYNC_IMAGE_CONCURRENCY,
+                                     ASYNC_PER_HOST)
+from core.browser_pool import BrowserSlot, DriverPool
+from core.cdp_tab import CdpTab, SCROLL_PAGE_JS, close_targets
+from core.concurrency import (AdaptiveLimit, HostLimits, FAILURE_CAPTCHA, FAILURE_TIMEOUT, FAILURE_ERROR, FAILURE_PARSE_EMPTY,
+                              PERMANENT_FAILURES)
+from core.resource_policy import ResourcePolicy
+from core.response_harvester import ResponseHarvester
+from core.session_store import SessionStore, cdp_cookie_params
+from core.browser_recycler import BrowserRecycler, QuiesceGate
+from core.work_queue import (EpisodeQueue, EpisodeTask, EpisodeDownload, SeriesJob, ORDER_NEWEST, DEFAULT_LATEST_COUNT,
+                             PRIORITY_URGENT, order_episodes)
+from core.job_journal import JobJournal
+from core.watchdog import (Watchdog, AnyEvent, REARM_DELAY, PHASE_NAVIGATE, PHASE_LOAD, PHASE_CAPTCHA, PHASE_SCROLL,
+                           PHASE_PARSE, PHASE_DOWNLOAD)
+
+BROWSER_MODE_TABS = "tabs"
+BROWSER_MODE_POOL = "pool"
+
+ARTICLE_SELECTOR = "article[itemprop='articleBody']"
+READY_SELECTOR = "article[itemprop='articleBody'], img[src*='kcaptcha_image.php']"
+PAGE_LOAD_TIMEOUT = 30
+
+FETCH_MODE_BROWSER = "browser"
+FETCH_MODE_HTTP = "http"
+
+# (DOMContentLoaded 까지 걸린 ms, 지금까지 전송된 바이트)
+PAGE_METRICS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const bytes = (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0);
+return [nav ? nav.domContentLoadedEventEnd : 0, bytes];
+"""
+
+# 증분 목록 스캔: 이미 받은 에피소드가 이만큼 연속으로 나오면 그 뒤(더 오래된 화)는 보지 않음
+KNOWN_EPISODE_STOP = 5
+# 일부 이미지가 일시적 오류로 빠져도 이 비율 이상 받았으면 수집 완료로 기록
+COMMIT_THRESHOLD = 0.9
+# 일시적 실패(타임아웃/403/캡챠/빈 파싱 등)를 실행 끝에서 다시 시도하는 횟수와 첫 대기 시간 (회차마다 두 배)
+DEFERRED_RETRY_PASSES = 2
+DEFERRED_RETRY_BACKOFF = 30
+# 목록 지문에 쓰는 최신 에피소드 수 (새 화는 목록 맨 위에 추가됨)
+FINGERPRINT_DEPTH = 10
+
+IMAGE_DISCOVERY_SCROLL = "scroll"
+IMAGE_DISCOVERY_DOM = "dom"
+# 스크롤 없는 탐색에서 맨 아래로 한 번 이동한 뒤 지연 로딩 스크립트가 src 를 채울 시간
+LAZY_JUMP_SETTLE = 1.0
+# 중지 후 진행 중인 다운로드(취소 전파/파일 정리)를 기다리는 최대 시간. 넘으면 남은 에피소드는 실패로 셉니다.
+DOWNLOAD_STOP_GRACE = 10
+# HTTP 모드의 브라우저 폴백이 빈 브라우저 슬롯을 기다리는 최대 시간. 넘으면 에피소드를 실패로 돌려 재시도합니다.
+BROWSER_SLOT_WAIT = 120
+# 탭 모드에서 한 번의 대기 호출이 공유 driver_lock 을 잡고 있을 수 있는 최대 시간
+SHARED_WAIT_SLICE = 0.3
+
+# 셀렉터에 맞는 요소가 생기는 순간 resolve 되는 비동기 대기 스크립트 (MutationObserver).
+# 이동 직전에 __manaNavPending 표시를 남기므로, 아직 이전 문서라면 resolve 하지 않고
+# 문서가 언로드될 때(Selenium 예외) 또는 타임아웃까지 기다립니다.
+WAIT_FOR_SELECTOR_JS = """
+const selector = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+if (window.__manaNavPending) {
+    setTimeout(() => done(false), timeoutMs);
+    return;
+}
+if (document.querySelector(selector)) {
+    done(true);
+    return;
+}
+const observer = new MutationObserver(() => {
+    if (document.querySelector(selector)) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document, {childList: true, subtree: true, attributes: true, attributeFilter: ['src']});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+"""
 
 class CrawlerEngine:
-    def __init__(self, download_path: str, num_download_threads: int = 2, captcha_auto_solve: bool = True, base_store_folder: str = None, headless: bool = False):
+    def __init__(self, download_path: str, num_download_threads: int = 2, captcha_auto_solve: bool = True, base_store_folder: str = None, headless: bool = False,
+                 browser_mode: str = BROWSER_MODE_TABS, pool_size: int = None, image_discovery: str = IMAGE_DISCOVERY_SCROLL,
+                 fetch_mode: str = FETCH_MODE_BROWSER, http_workers: int = None, resource_policy: ResourcePolicy = None,
+                 harvest_images: bool = False, persist_session: bool = True, session_dir: str = None, broker=None,
+                 tab_sessions: bool = False, adaptive: bool = False, resume: bool = True, full_resync: bool = False,
+                 recycle_episodes: int = 0, recycle_memory_mb: int = 0, commit_threshold: float = COMMIT_THRESHOLD,
+                 queue_order: str = ORDER_NEWEST, latest_count: int = DEFAULT_LATEST_COUNT, image_concurrency: int = None,
+                 images_per_host: int = None, downloader_backend: str = DOWNLOADER_THREADS):
         """
         :param download_path: Path to save downloaded files
         :param num_download_threads: Number of WORKER TABS to open (Parallel Browsing)
         :param captcha_auto_solve: Whether to use Gemini API for captcha solving
         :param base_store_folder: Base folder for auto-folder creation when download_path is empty
         :param headless: Whether to run browser in headless mode
+        :param browser_mode: "tabs" (one browser, N tabs behind driver_lock) or "pool" (one browser process per worker)
+        :param pool_size: Number of browsers in "pool" mode (defaults to num_download_threads)
+        :param image_discovery: "scroll" (PAGE_DOWN until bottom) or "dom" (read lazy-load attributes without scrolling)
+        :param fetch_mode: "browser" (render every page) or "http" (fetch pages with the browser's cookies, browser only as fallback)
+        :param http_workers: Number of HTTP fetch workers in "http" mode (defaults to 4x the browser workers)
+        :param resource_policy: Block images/fonts/media/ads in worker tabs via CDP (None = load everything)
+        :param harvest_images: Save images the browser already loaded (CDP getResponseBody) instead of downloading them again
+        :param persist_session: Reuse a per-site browser profile and cookie store across runs
+        :param session_dir: Root folder for browser profiles/cookies (defaults to "browser_sessions" next to the DB file)
+        :param broker: BrowserBroker/RemoteBroker to lease warm browsers from (returned on stop instead of quit)
+        :param tab_sessions: In "tabs" mode, drive each worker tab through its own DevTools session instead of switch_to.window under driver_lock
+        :param adaptive: Adjust active workers and per-host image requests (AIMD) from latency, errors and captcha hits.
+                         The worker count becomes the upper limit.
+        :param resume: Continue an interrupted job for the same URL from the job journal instead of re-listing it
+        :param full_resync: Check every episode of the list against the DB (default: stop after KNOWN_EPISODE_STOP consecutive known episodes)
+        :param recycle_episodes: Restart a browser after this many episodes (0 = never), restoring its cookies
+        :param recycle_memory_mb: Restart a browser when its process tree RSS exceeds this many MB (0 = off, needs psutil)
+        :param commit_threshold: Record an episode as crawled when at least this share of its images downloaded
+                                 (images that are permanently gone, e.g. 404, never block it)
+        :param queue_order: Episode order within a series: "newest", "oldest" or "latest" (latest_count newest first, then the rest from
+                            episode 1; in a batch every series' latest episodes come before any backfill)
+        :param latest_count: Number of newest episodes fetched first with queue_order="latest"
+        :param image_concurrency: Image requests in flight across all episodes (shared download pool;
+                                  defaults to max(DEFAULT_IMAGE_CONCURRENCY, 2x the workers), ASYNC_IMAGE_CONCURRENCY with asyncio)
+        :param images_per_host: Image requests in flight per image host (the ceiling of the adaptive per-host limit;
+                                defaults to DEFAULT_PER_HOST, ASYNC_PER_HOST with asyncio)
+        :param downloader_backend: "threads" (requests, one pool thread per image request) or "asyncio" (aiohttp on one event loop
+                                   thread; falls back to "threads" without aiohttp)
         """
         self.download_path = download_path
         self.base_store_folder = base_store_folder
         self.num_workers = num_download_threads
         self.captcha_auto_solve = captcha_auto_solve
         self.headless = headless
+        self.browser_mode = browser_mode if browser_mode in (BROWSER_MODE_TABS, BROWSER_MODE_POOL) else BROWSER_MODE_TABS
+        self.pool_size = pool_size or num_download_threads
+        self.image_discovery = image_discovery if image_discovery in (IMAGE_DISCOVERY_SCROLL, IMAGE_DISCOVERY_DOM) else IMAGE_DISCOVERY_SCROLL
+        self.discovery_times = []
+        self.fetch_mode = fetch_mode if fetch_mode in (FETCH_MODE_BROWSER, FETCH_MODE_HTTP) else FETCH_MODE_BROWSER
+        self.http_workers = http_workers or self._worker_count() * 4
+        self.resource_policy = resource_policy
+        self.harvester = ResponseHarvester() if harvest_images else None
+        if self.harvester and self.resource_policy:
+            # 이미지를 막으면 회수할 응답이 없으므로 이미지 외의 차단만 유지
+            logger.info("Image harvesting enabled: resource policy will not block images.")
+            self.resource_policy = self.resource_policy.allow_images()
+        self.session_store = None
+        if persist_session:
+            root_dir = session_dir or os.path.join(os.path.dirname(os.path.abspath(db.db_path)), "browser_sessions")
+            self.session_store = SessionStore(root_dir, ManatokiParser.site_name)
+        self.broker = broker
+        self.tab_sessions = tab_sessions and self.browser_mode == BROWSER_MODE_TABS
+        self.adaptive = adaptive
+        self.worker_limit = None
+        self.journal = JobJournal()
+        self.resume = resume
+        self.full_resync = full_resync
+        self.recycler = BrowserRecycler(recycle_episodes, recycle_memory_mb) if (recycle_episodes or recycle_memory_mb) else None
+        # 공유 브라우저를 재시작할 때 진행 중인 에피소드/목록 수집이 끝나기를 기다리는 문
+        self.browser_gate = QuiesceGate()
+        self.run_started_at = None
+        self.first_episode_logged = False
+        self.max_episode_retries = 2
+        self.commit_threshold = commit_threshold
+        self.queue_order = queue_order
+        self.latest_count = latest_count
+        # 배치 실행 중 "지금 받기" 로 끼워 넣은 시리즈 URL (목록 수집 스레드가 다음 차례에 먼저 처리)
+        self.urgent_targets = []
+        self.urgent_lock = threading.Lock()
+        self.accepting_urgent = False
+        self.deferred = []  # 실행 끝의 재시도 단계로 미룬 EpisodeTask
+        self.deferred_lock = threading.Lock()
+        # 공유 다운로드 풀에 넘겼지만 아직 끝나지 않은 에피소드 (id -> EpisodeDownload) / 이번 라운드에 완료한 에피소드 수
+        self.downloads_in_flight = {}
+        self.downloads_completed = 0
+        self.download_cond = threading.Condition()
+        self.download_ids = itertools.count(1)  # 워치독 키
         self.driver = None
         self.driver_lock = threading.Lock()
+        self.driver_pool = None
+        self.run_thread = None  # start/start_batch 를 실행 중인 스레드 (워커를 기다린 뒤 브라우저를 정리)
+        self.main_slot = None
+        self.worker_slots = []
         self.stop_event = threading.Event()
+        # 단계별 기한을 넘겨 멈춘 탭/브라우저를 닫고 에피소드를 다시 큐에 넣습니다.
+        self.watchdog = Watchdog(self._on_phase_expired)
         
         # Components
         self.parser = ManatokiParser()
         self.captcha_solver = GeminiSolver()
-        self.downloader = ImageDownloader(max_threads=2) 
+        self.downloader = create_downloader(downloader_backend)
+        # asyncio 다운로더 (aiohttp 가 없어 스레드로 대신한 경우 제외) 는 스레드 한도를 물려받지 않습니다.
+        if hasattr(self.downloader, "submit_image"):
+            image_concurrency = image_concurrency or ASYNC_IMAGE_CONCURRENCY
+            images_per_host = images_per_host or ASYNC_PER_HOST
+        else:
+            image_concurrency = image_concurrency or max(DEFAULT_IMAGE_CONCURRENCY, num_download_threads * 2)
+            images_per_host = images_per_host or DEFAULT_PER_HOST
+        if adaptive:
+            self.downloader.host_limits = HostLimits(initial=min(2, images_per_host), maximum=images_per_host)
+        self.download_scheduler = DownloadScheduler(self.downloader, max_concurrent=image_concurrency, per_host=images_per_host)
         
         self.is_running = False
 
@@ -63,7 +237,9 @@ class CrawlerEngine:
         """단일 URL 크롤링. 완료 후 브라우저를 닫습니다."""
         self.stop_event.clear()
         self.is_running = True
-        logger.info(f"Starting crawler for: {target_url} with {self.num_workers} worker tabs")
+        self.run_thread = threading.current_thread()
+        logger.info(f"Starting crawler for: {target_url} with {self._worker_count()} workers ({self.browser_mode} mode)")
+        self._mark_run_start()
 
         try:
             self._init_driver()
@@ -75,27 +251,71 @@ class CrawlerEngine:
         finally:
             self.stop()
 
-    def start_batch(self, url_list: list):
-        """여러 URL을 하나의 브라우저 세션으로 순차 크롤링합니다."""
+    def start_batch(self, url_list: list, first: list = None):
+        """
+        여러 URL을 하나의 브라우저 세션으로 크롤링합니다.
+        메인 탭이 시리즈 목록을 차례로 수집하는 동안 워커들은 하나의 전역 큐에서
+        모든 시리즈의 에피소드를 가져가므로, 시리즈가 바뀌어도 워커가 놀지 않습니다.
+        first 의 시리즈와 실행 중 crawl_now() 로 들어온 시리즈는 먼저 목록을 받고, 그 에피소드들이 큐 맨 앞으로 갑니다.
+        """
         self.stop_event.clear()
         self.is_running = True
+        self.run_thread = threading.current_thread()
         total = len(url_list)
-        logger.info(f"Starting BATCH crawl for {total} URLs with {self.num_workers} worker tabs")
+        logger.info(f"Starting BATCH crawl for {total} URLs with {self._worker_count()} workers ({self.browser_mode} mode)")
+        self._mark_run_start()
 
-        try:
-            self._init_driver()
-            for idx, url in enumerate(url_list):
-                if self.stop_event.is_set():
-                    logger.info("Batch crawl stopped by user.")
-                    break
-                logger.info(f"=== Batch [{idx+1}/{total}] Starting: {url} ===")
+        jobs = []
+        with self.urgent_lock:
+            self.urgent_targets = list(first or [])
+            self.accepting_urgent = True
+
+        def feed(work_queue: EpisodeQueue):
+            pending = list(url_list)
+            listed = 0
+            while not self.stop_event.is_set():
+                with self.urgent_lock:
+                    urgent = self.urgent_targets.pop(0) if self.urgent_targets else None
+                    if urgent is None and not pending and work_queue.idle():
+                        # 더 받을 작업이 없으면 끼워 넣기를 닫고 큐를 닫습니다.
+                        self.accepting_urgent = False
+                        break
+                if urgent:
+                    url = urgent
+                    if url in pending:
+                        pending.remove(url)
+                    logger.info(f"=== Batch [now] Listing: {url} ===")
+                elif pending:
+                    url = pending.pop(0)
+                    listed += 1
+                    logger.info(f"=== Batch [{listed}/{total}] Listing: {url} ===")
+                    if not pending:
+                        logger.info(f"=== Batch listing done ({total} series). Waiting for workers... ===")
+                else:
+                    # 목록은 다 받았고 워커가 남은 에피소드를 처리하는 중: "지금 받기" 요청을 기다림
+                    self.stop_event.wait(0.2)
+                    continue
                 try:
-                    self._crawl_single_url(url)
+                    with self.browser_gate.entered():
+                        job, tasks = self._prepare_series_job(url, urgent=bool(urgent))
+                    if tasks:
+                        jobs.append(job)
+                    for task in tasks:
+                        work_queue.put(task)
                 except Exception as e:
                     logger.error(f"Error crawling {url}: {e}")
                     import traceback
                     logger.error(traceback.format_exc())
-                logger.info(f"=== Batch [{idx+1}/{total}] Done ===")
+            if self.stop_event.is_set():
+                logger.info("Batch crawl stopped by user.")
+            with self.urgent_lock:
+                self.accepting_urgent = False
+
+        try:
+            self._init_driver()
+            self._run_workers(EpisodeQueue(max_retries=self.max_episode_retries, closed=False), feed=feed)
+            for job in jobs:
+                self._complete_job(job)
             logger.info("Batch Crawling Finished.")
         except Exception as e:
             logger.error(f"Critical Error in Batch Engine: {e}")
@@ -104,13 +324,64 @@ class CrawlerEngine:
         finally:
             self.stop()
 
+    def crawl_now(self, target_url: str) -> bool:
+        """
+        실행 중인 배치에 시리즈를 끼워 넣습니다. 목록 수집 스레드가 다음 차례에 이 시리즈의 목록을 받고,
+        그 에피소드들은 남은 배치 작업보다 먼저 처리됩니다. 배치가 아니거나 끝나는 중이면 False.
+        """
+        with self.urgent_lock:
+            if not self.accepting_urgent:
+                return False
+            self.urgent_targets.append(target_url)
+        logger.info(f"Queued for immediate crawl: {target_url}")
+        return True
+
     def _crawl_single_url(self, target_url: str):
         """단일 URL에 대한 크롤링 핵심 로직. 브라우저는 건드리지 않습니다."""
+        job, tasks = self._prepare_series_job(target_url)
+        if not tasks:
+            return
+
+        work_queue = EpisodeQueue(tasks, max_retries=self.max_episode_retries)
+        self._run_workers(work_queue, max_workers=len(tasks))
+        self._complete_job(job)
+        logger.info("Crawling Finished.")
+
+    def _complete_job(self, job: SeriesJob):
+        """
+        중지/크래시로 끝나지 않았다면 저널을 닫습니다 (남아 있으면 다음 실행이 이어서 함).
+        실패한 에피소드 없이 끝났을 때만 목록 지문을 저장해, 다음에 목록이 그대로면 바로 건너뜁니다.
+        """
+        if self.stop_event.is_set():
+            return
+        self.journal.finish(job)
+        if job.fingerprint and not job.failed:
+            db.set_list_fingerprint(job.list_url, job.fingerprint)
+
+    def _prepare_series_job(self, target_url: str, urgent: bool = False):
+        """
+        목록 페이지를 수집해 시리즈 작업(SeriesJob)과 아직 수집하지 않은 에피소드 작업(EpisodeTask) 목록을 반환합니다.
+        시리즈별 저장 경로 등은 job 에 담기므로 self.download_path 는 변경하지 않습니다.
+        같은 URL 의 중단된 작업이 저널에 있으면 목록을 다시 받지 않고 남은 작업을 그대로 이어갑니다.
+        """
+        if self.resume:
+            job, tasks = self.journal.resume(target_url, self.queue_order, self.latest_count)
+            if job:
+                if tasks:
+                    if urgent:
+                        for task in tasks:
+                            task.priority = PRIORITY_URGENT
+                    return job, tasks
+                self.journal.finish(job)
+
         # 1. Get Episode List (using Main Tab)
-        episode_list, list_title = self._get_episode_list(target_url)
-        if not episode_list:
+        list_html = self._fetch_list_page(target_url)
+        episode_urls = self.parser.iter_episode_urls(list_html) if list_html else iter(())
+        newest = [url for _, url in zip(range(FINGERPRINT_DEPTH), episode_urls)]
+        if not newest:
             logger.warning("No episodes found or failed to parse list.")
-            return
+            return None, []
+        list_title = self.parser.get_title(list_html)
 
         # Auto-resolve download path if not explicitly set
         effective_path = self.download_path
@@ -122,60 +393,125 @@ class CrawlerEngine:
                 logger.info(f"Auto-created download folder: {effective_path}")
             else:
                 effective_path = self.base_store_folder
-        
-        # Use effective_path for this URL
-        original_path = self.download_path
-        self.download_path = effective_path
 
         parsed_uri = urlparse(target_url)
         list_url = f'{parsed_uri.scheme}://{parsed_uri.netloc}{parsed_uri.path}'
-        db.upsert_mana_list(list_url, list_title, self.download_path)
+        referer = f'{parsed_uri.scheme}://{parsed_uri.netloc}/'
+        db.upsert_mana_list(list_url, list_title, effective_path)
+        db.mark_list_checked(list_url)
+        job = SeriesJob(target_url=target_url, list_url=list_url, list_title=list_title, download_path=effective_path, referer=referer,
+                        fingerprint=self._list_fingerprint(newest))
 
-        total_episodes = len(episode_list)
-        logger.info(f"Found {total_episodes} episodes.")
+        # 지난 실행에서 재시도까지 실패한 화: 증분 확인 범위 밖의 오래된 화라도 다시 받습니다.
+        failed_before = self.journal.failed_episodes(target_url)
 
-        # Filter already crawled
+        # 마지막으로 전부 받았을 때와 최신 화 목록이 같으면 에피소드별 DB 확인 없이 건너뜀
+        if not self.full_resync and not failed_before and job.fingerprint == db.get_list_fingerprint(list_url):
+            logger.info("Episode list unchanged since the last complete crawl. Skipping.")
+            return job, []
+
+        # Filter already crawled (최신 화부터; 증분 모드는 이미 받은 화가 연속으로 나오면 중단)
         to_crawl = []
-        for url in episode_list:
+        scanned = 0
+        known_streak = 0
+        for url in itertools.chain(newest, episode_urls):
+            scanned += 1
             if not db.is_url_crawled(url):
                 to_crawl.append(url)
+                known_streak = 0
+                continue
+            known_streak += 1
+            if not self.full_resync and known_streak >= KNOWN_EPISODE_STOP:
+                logger.info(f"Stopped list scan after {known_streak} consecutive crawled episodes (use full resync to check older ones).")
+                break
         
-        logger.info(f"Episodes to crawl: {len(to_crawl)} (Excluded {total_episodes - len(to_crawl)} already crawled)")
+        logger.info(f"Episodes to crawl: {len(to_crawl)} (Scanned {scanned}, excluded {scanned - len(to_crawl)} already crawled)")
+        retry = [url for url in failed_before if url not in to_crawl]
+        if retry:
+            logger.info(f"Re-queueing {len(retry)} episodes that failed in the previous run.")
+            to_crawl.extend(retry)
         
         if not to_crawl:
             logger.info("Nothing to crawl.")
-            return
+            db.set_list_fingerprint(list_url, job.fingerprint)
+            return job, []
+        ordered = order_episodes(to_crawl, self.queue_order, self.latest_count)
+        self.journal.open(job, to_crawl)
+        return job, [EpisodeTask(url, job=job, priority=PRIORITY_URGENT if urgent else priority) for url, priority in ordered]
 
-        # 2. Prepare Worker Tabs
-        worker_tabs = self._create_worker_tabs(self.num_workers)
-        if not worker_tabs:
-            logger.error("Failed to create worker tabs.")
-            return
+    @staticmethod
+    def _list_fingerprint(newest_urls: list) -> str:
+        """최신 FINGERPRINT_DEPTH 개 에피소드 키(순서 포함)의 해시. 새 화가 올라오면 달라지고, 도메인만 바뀌면 그대로입니다."""
+        return hashlib.sha1("\n".join(url_key(url) for url in newest_urls).encode("utf-8")).hexdigest()
+
+    def _run_workers(self, work_queue: EpisodeQueue, feed=None, max_workers: int = None) -> int:
+        """
+        워커를 돌려 큐를 비운 뒤, 일시적 오류로 미뤄진 에피소드들을 대기(백오프) 후 다시 시도합니다
+        (DEFERRED_RETRY_PASSES 회까지). 그래도 실패한 에피소드는 수집 완료로 기록하지 않아 다음 실행에서 다시 받습니다.
+        """
+        with self.deferred_lock:
+            self.deferred = []
+        processed = self._run_worker_round(work_queue, feed=feed, max_workers=max_workers)
+        for retry_pass in range(DEFERRED_RETRY_PASSES):
+            with self.deferred_lock:
+                tasks, self.deferred = self.deferred, []
+            if not tasks or self.stop_event.is_set():
+                break
+            delay = DEFERRED_RETRY_BACKOFF * (2 ** retry_pass)
+            logger.info(f"Retry pass {retry_pass + 1}/{DEFERRED_RETRY_PASSES}: {len(tasks)} deferred episodes in {delay}s")
+            if self.stop_event.wait(delay):
+                break
+            retry_queue = EpisodeQueue(tasks, max_retries=0)
+            processed += self._run_worker_round(retry_queue, max_workers=min(len(tasks), max_workers or len(tasks)))
+        return processed
+
+    def _run_worker_round(self, work_queue: EpisodeQueue, feed=None, max_workers: int = None) -> int:
+        """
+        워커 슬롯을 준비하고 공유 큐를 비울 때까지 워커 스레드를 돌립니다.
+        feed 가 주어지면 워커가 도는 동안 현재 스레드에서 큐를 채운 뒤 close() 합니다.
 
-        # 3. Distribute Work and Start Threads
-        worker_queues = [[] for _ in range(len(worker_tabs))]
-        for i, url in enumerate(to_crawl):
-            worker_idx = i % len(worker_tabs)
-            worker_queues[worker_idx].append(url)
+        브라우저 워커는 이동/스크롤/파싱만 하고 결과를 엔진 공유 다운로드 풀(download_scheduler)로 넘기며,
+        풀의 스레드들이 모든 에피소드의 이미지를 받고 에피소드가 끝나면 DB에 기록합니다 (파이프라인).
+        다운로드가 밀리면 풀의 대기열이 가득 차서 브라우저 워커가 자연스럽게 대기합니다.
+        """
+        # Prepare Worker Slots (tabs of the shared browser, or pooled browsers; reused across runs of this engine)
+        worker_slots = self._acquire_worker_slots(max_workers)
+        if not worker_slots:
+            logger.error("Failed to create worker slots.")
+            work_queue.close()
+            return 0
+
+        # HTTP 모드: 브라우저 슬롯보다 많은 HTTP 워커가 돌고, 캡챠 등으로 폴백할 때만 빈 슬롯을 빌려 씁니다.
+        free_slots = None
+        worker_assignments = list(worker_slots)
+        if self.fetch_mode == FETCH_MODE_HTTP:
+            free_slots = queue.Queue()
+            for slot in worker_slots:
+                free_slots.put(slot)
+            http_workers = min(self.http_workers, max_workers) if max_workers else self.http_workers
+            worker_assignments = [None] * max(1, http_workers)
+        # 자동 조절: 준비한 워커 수를 상한으로 두고, 실제로 동시에 처리하는 워커 수를 늘리고 줄입니다.
+        self.worker_limit = AdaptiveLimit("workers", len(worker_assignments)) if self.adaptive else None
 
+        started_at = time.time()
+        processed = 0
+        self.discovery_times = []
+        self.watchdog.start()
+        self.download_scheduler.start()
+        with self.download_cond:
+            self.downloads_completed = 0
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=len(worker_tabs)) as executor:
-                futures = []
-                for i, tab_handle in enumerate(worker_tabs):
-                    urls_for_worker = worker_queues[i]
-                    if not urls_for_worker:
-                        continue
-                    
-                    futures.append(
-                        executor.submit(
-                            self._worker_loop, 
-                            worker_id=i+1, 
-                            tab_handle=tab_handle, 
-                            urls=urls_for_worker, 
-                            main_url=target_url,
-                            list_title=list_title
-                        )
-                    )
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(worker_assignments)) as executor:
+                futures = [
+                    executor.submit(self._worker_loop, worker_id=i+1, slot=slot, work_queue=work_queue, free_slots=free_slots)
+                    for i, slot in enumerate(worker_assignments)
+                ]
+
+                if feed:
+                    try:
+                        feed(work_queue)
+                    finally:
+                        work_queue.close()
                 
                 for future in concurrent.futures.as_completed(futures):
                     try:
@@ -183,72 +519,307 @@ class CrawlerEngine:
                     except Exception as e:
                         logger.error(f"Worker thread failed: {e}")
         finally:
-            # 워커 탭 정리 (메인 탭만 남기기)
-            self._close_worker_tabs(worker_tabs)
-            # 배치 모드를 위해 download_path 원복
-            self.download_path = original_path
+            # 워커 탭은 닫지 않고 다음 시리즈/실행에서 재사용합니다 (stop() 에서 정리).
+            # 브라우저 단계가 끝났으므로 공유 다운로드 풀에 넘긴 에피소드가 모두 끝날 때까지 기다립니다.
+            processed += self._wait_for_downloads()
+            self.watchdog.stop()
 
-        logger.info("Crawling Finished.")
+        self._log_throughput(processed, time.time() - started_at)
+        if self.adaptive:
+            logger.info(f"Adaptive limits at finish: {self.format_concurrency()}")
+        if self.discovery_times:
+            average = sum(self.discovery_times) / len(self.discovery_times)
+            logger.info(f"Image discovery ({self.image_discovery}): {average:.1f}s/episode average over {len(self.discovery_times)} episodes")
+        return processed
 
-    def _close_worker_tabs(self, worker_tabs):
-        """워커 탭들을 닫고 메인 탭으로 전환"""
+    def concurrency_snapshot(self) -> dict:
+        """현재 자동 조절 한도 ({"workers": {...}, "images": {host: {...}}}). 자동 조절이 꺼져 있으면 빈 dict."""
+        if not self.adaptive:
+            return {}
+        snapshot = {"images": self.downloader.host_limits.snapshot()}
+        if self.worker_limit:
+            snapshot["workers"] = self.worker_limit.snapshot()
+        return snapshot
+
+    def format_concurrency(self) -> str:
+        snapshot = self.concurrency_snapshot()
+        parts = []
+        if "workers" in snapshot:
+            parts.append(f"workers {snapshot['workers']['limit']}/{snapshot['workers']['maximum']}")
+        for host, limit in snapshot.get("images", {}).items():
+            parts.append(f"{host} {limit['limit']}/{limit['maximum']}")
+        return ", ".join(parts)
+
+    def _record_worker_failure(self, kind: str):
+        if self.worker_limit:
+            self.worker_limit.record_failure(kind)
+
+    def _mark_run_start(self):
+        self.run_started_at = time.time()
+        self.first_episode_logged = False
+
+    def _worker_count(self) -> int:
+        return self.pool_size if self.browser_mode == BROWSER_MODE_POOL else self.num_workers
+
+    @staticmethod
+    def _log_throughput(processed: int, elapsed: float):
+        if processed and elapsed > 0:
+            logger.info(f"Processed {processed} episodes in {elapsed:.1f}s ({processed * 60 / elapsed:.1f} episodes/min)")
+
+    def _acquire_worker_slots(self, max_workers: int = None) -> list:
+        """
+        엔진 세션 동안 유지하는 워커 슬롯을 돌려줍니다. 처음에 만든 탭(브라우저)을 시리즈/실행이 바뀌어도 재사용하고,
+        매번 상태를 확인해 응답하지 않는 슬롯만 교체합니다.
+        """
+        count = min(self._worker_count(), max_workers) if max_workers else self._worker_count()
+        slots = []
+        for slot in self.worker_slots:
+            if self._slot_healthy(slot):
+                slots.append(slot)
+                continue
+            logger.warning(f"Worker slot {slot.tab_handle or 'browser'} is not responding. Replacing it.")
+            replacement = self._replace_worker_slot(slot)
+            if replacement:
+                slots.append(replacement)
+        missing = count - len(slots)
+        if missing > 0:
+            slots += self._create_worker_slots(missing, exclude=slots)
+        self.worker_slots = slots
+        return slots[:count]
+
+    @staticmethod
+    def _slot_healthy(slot: BrowserSlot) -> bool:
         try:
-            main_tab = self.driver.window_handles[0]
-            for tab in worker_tabs:
-                try:
-                    if tab in self.driver.window_handles:
-                        self.driver.switch_to.window(tab)
-                        self.driver.close()
-                except Exception:
-                    pass
-            if main_tab in self.driver.window_handles:
-                self.driver.switch_to.window(main_tab)
+            with slot.session(webdriver=True) as driver:
+                return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _replace_worker_slot(self, slot: BrowserSlot):
+        """고장 난 슬롯 정리. 풀 모드는 그 브라우저만 새로 띄워 반환하고, 탭 모드는 탭을 닫고 None (새 탭은 호출자가 생성)."""
+        slot.detach_cdp()
+        if not self.driver_pool:
+            self._close_worker_tabs([slot.tab_handle])
+            return None
+        if slot.driver is self.driver:
+            # 목록 탭과 같은 브라우저: 교체하면 메인 탭도 사라지므로 이 슬롯만 뺍니다.
+            return None
+        try:
+            replacement = self.driver_pool.replace(slot)
         except Exception as e:
-            logger.warning(f"Error closing worker tabs: {e}")
+            logger.error(f"Failed to relaunch pooled browser: {e}")
+            return None
+        self._prepare_worker_slots([replacement])
+        return replacement
+
+    def _create_worker_slots(self, count: int, exclude: list = ()) -> list:
+        """풀 모드는 아직 쓰지 않은 풀 브라우저들을, 탭 모드는 새 워커 탭들을 슬롯으로 반환"""
+        if self.driver_pool:
+            slots = [slot for slot in self.driver_pool.slots if slot not in exclude][:count]
+        else:
+            slots = [BrowserSlot(self.driver, self.driver_lock, tab_handle=tab) for tab in self._create_worker_tabs(count)]
+        self._prepare_worker_slots(slots)
+        return slots
+
+    def _prepare_worker_slots(self, slots: list):
+        if self.resource_policy:
+            for slot in slots:
+                self._apply_resource_policy(slot)
+        if self.tab_sessions:
+            self._attach_tab_sessions(slots)
+
+    def _attach_tab_sessions(self, slots: list):
+        """워커 탭마다 전용 DevTools 세션을 연결합니다. 실패한 탭은 기존 방식(driver_lock + 탭 전환)으로 동작합니다."""
+        attached = 0
+        for slot in slots:
+            try:
+                slot.cdp_tab = CdpTab.attach(self.driver, slot.tab_handle, command_timeout=PAGE_LOAD_TIMEOUT + 5)
+                attached += 1
+            except Exception as e:
+                logger.warning(f"Could not attach a DevTools session to tab {slot.tab_handle}, using the shared driver: {e}")
+        logger.info(f"Per-tab DevTools sessions: {attached}/{len(slots)} worker tabs")
+
+    def _apply_resource_policy(self, slot: BrowserSlot):
+        # setBlockedURLs 는 CDP 타깃(탭)별 설정이므로 워커 탭마다 적용합니다. 메인 탭은 건드리지 않습니다.
+        with slot.session(webdriver=True) as driver:
+            try:
+                self.resource_policy.apply(driver)
+            except Exception as e:
+                logger.warning(f"Failed to apply resource policy: {e}")
+
+    def _close_worker_tabs(self, worker_tabs):
+        """
+        워커 탭들을 닫고 메인 탭으로 전환.
+        실행 중에도 (_recover_worker_slot) 불리므로 다른 워커가 중간에 탭을 바꾸지 않도록 driver_lock 을 잡고 합니다.
+        """
+        with self.driver_lock:
+            try:
+                main_tab = self.driver.window_handles[0]
+                for tab in worker_tabs:
+                    try:
+                        if tab in self.driver.window_handles:
+                            self.driver.switch_to.window(tab)
+                            self.driver.close()
+                    except Exception:
+                        pass
+                if main_tab in self.driver.window_handles:
+                    self.driver.switch_to.window(main_tab)
+            except Exception as e:
+                logger.warning(f"Error closing worker tabs: {e}")
 
     def stop(self):
+        """
+        중지합니다. 다른 스레드(GUI 등)에서 호출하면 중지 신호만 보내고, 브라우저 반납/종료는
+        워커 스레드가 모두 끝난 뒤 실행 스레드(start/start_batch 의 finally)가 합니다.
+        워커가 아직 쓰고 있는 브로커 브라우저를 반납해 초기화하지 않기 위해서입니다.
+        """
         self.is_running = False
         self.stop_event.set()
         logger.info("Stopping crawler...")
-        if self.driver:
+        self.download_scheduler.shutdown(wait=False)
+        run_thread = self.run_thread
+        if run_thread is not None and run_thread is not threading.current_thread() and run_thread.is_alive():
+            return
+        self.run_thread = None
+        self.watchdog.stop()
+        try:
+            self.downloader.close()
+        except Exception as e:
+            logger.warning(f"Failed to close image downloader: {e}")
+        for slot in self.worker_slots:
+            slot.detach_cdp()
+        self.worker_slots = []
+        if self.session_store and self.driver:
             try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
+                self.session_store.capture(self.driver)
+            except Exception as e:
+                logger.warning(f"Failed to save browser cookies: {e}")
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+        elif self.driver:
+            self._dispose_driver(self.driver)
+        self.driver = None
+        self.main_slot = None
 
     def _init_driver(self):
-        if not self.driver:
-            mode = "Headless" if self.headless else "Normal"
+        if self.driver:
+            return
+        mode = "Headless" if self.headless else "Normal"
+        if self.browser_mode == BROWSER_MODE_POOL:
+            logger.info(f"Initializing Browser Pool ({mode} mode, {self.pool_size} browsers)...")
+            self.driver_pool = DriverPool(self.pool_size, launcher=lambda i: self._launch_driver(f"pool-{i+1}"), closer=self._dispose_driver)
+            slots = self.driver_pool.start()
+            if not slots:
+                raise RuntimeError("Browser pool failed to start")
+            # 목록 페이지는 첫 번째 풀 브라우저의 별도 탭에서 처리합니다.
+            # 배치 모드에서는 워커 1이 같은 브라우저를 쓰는 동안 목록을 수집하므로 탭을 분리하고 락을 공유합니다.
+            first = slots[0]
+            self.driver = first.driver
+            self.main_slot = BrowserSlot(self.driver, first.lock, tab_handle=self.driver.window_handles[0])
+            initial_handles = set(self.driver.window_handles)
+            self.driver.execute_script("window.open('about:blank', '_blank');")
+            first.tab_handle = (set(self.driver.window_handles) - initial_handles).pop()
+        else:
             logger.info(f"Initializing Browser ({mode} mode)...")
-            self.driver = Driver(uc=True, headless=self.headless) 
+            self.driver = self._launch_driver("main")
+            self.main_slot = BrowserSlot(self.driver, self.driver_lock, tab_handle=self.driver.window_handles[0])
+
+        if self.session_store and self.fetch_mode == FETCH_MODE_HTTP:
+            # 저장된 세션으로 첫 HTTP 요청부터 캡챠 없이 시도
+            self.downloader.import_browser_session(self.session_store.load_cookies())
+
+    def _launch_driver(self, profile_name: str):
+        """브라우저를 띄우고 (세션 유지 시 사이트 프로필 + 저장된 쿠키 복원) 공통 설정을 적용합니다."""
+        kwargs = self._driver_kwargs()
+        driver = None
+        if self.session_store:
+            try:
+                driver = self._new_driver(dict(kwargs, user_data_dir=self.session_store.profile_dir(profile_name)))
+            except Exception as e:
+                # 다른 엔진이 같은 프로필을 쓰고 있는 경우 등: 새 프로필로 진행
+                logger.warning(f"Could not open persistent profile '{profile_name}', using a fresh one: {e}")
+        if driver is None:
+            driver = self._new_driver(kwargs)
+        self._configure_driver(driver)
+        if self.session_store:
+            try:
+                restored = self.session_store.restore(driver)
+                if restored:
+                    logger.info(f"Restored {restored} cookies from the last session.")
+            except Exception as e:
+                logger.warning(f"Failed to restore cookies: {e}")
+        return driver
+
+    def _new_driver(self, kwargs: dict):
+        """브로커가 있으면 대기 중인 브라우저를 빌리고, 없으면 새로 띄웁니다."""
+        if self.broker:
+            return self.broker.lease(kwargs)
+        return Driver(**kwargs)
+
+    def _dispose_driver(self, driver):
+        """브로커에서 빌린 브라우저는 반납하고 (다음 작업이 재사용), 아니면 종료합니다."""
+        try:
+            if self.broker:
+                self.broker.release(driver)
+            else:
+                driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while closing browser: {e}")
+
+    def _driver_kwargs(self) -> dict:
+        kwargs = {"uc": True, "headless": self.headless}
+        if self.harvester:
+            # 이미지 응답의 requestId 를 얻기 위해 performance(CDP) 로그를 켭니다.
+            kwargs["log_cdp_events"] = True
+        return kwargs
+
+    @staticmethod
+    def _configure_driver(driver):
+        # 비동기 대기 스크립트가 JS 쪽 타임아웃보다 먼저 끊기지 않도록 여유를 둡니다.
+        driver.set_script_timeout(PAGE_LOAD_TIMEOUT + 5)
 
     def _get_episode_list(self, target_url: str):
-        # Assumes driver is on the Main Tab (first tab)
-        with self.driver_lock:
+        """목록 페이지의 전체 에피소드 URL과 시리즈 제목"""
+        html = self._fetch_list_page(target_url)
+        if not html:
+            return [], ""
+        return self.parser.get_episode_urls(html), self.parser.get_title(html)
+
+    def _fetch_list_page(self, target_url: str) -> str:
+        """목록 페이지 HTML (실패하면 빈 문자열)"""
+        if self.fetch_mode == FETCH_MODE_HTTP:
+            try:
+                final_url, html = self.downloader.fetch_html(target_url)
+                if not self.parser.is_captcha_page(final_url, html) and next(self.parser.iter_episode_urls(html), None):
+                    return html
+                logger.info("HTTP list fetch needs the browser (captcha or empty list). Falling back...")
+            except Exception as e:
+                logger.warning(f"HTTP list fetch failed, falling back to browser: {e}")
+
+        # Uses the Main Tab (first tab) or the first pooled browser
+        with self.main_slot.session() as driver:
             try:
                 logger.info("Start getting episode list...")
-                # Ensure we are on the first tab
-                if self.driver.window_handles:
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-                
-                self.driver.get(target_url)
+                driver.get(target_url)
 
-                time.sleep(1)
+                # 목록 본문이나 캡챠가 나타나는 즉시 진행 (고정 sleep 대신)
+                self._wait_for_selector(driver, READY_SELECTOR, PAGE_LOAD_TIMEOUT)
 
                 # Check for Captcha on List Page
-                if self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
+                if self.parser.is_captcha_page(driver.current_url, driver.page_source):
                     logger.info("Captcha detected on List Page. Solving...")
-                    self._handle_captcha(worker_id=0)
+                    self._handle_captcha(driver, worker_id=0)
                 
-                WebDriverWait(self.driver, 30).until(
-                     EC.presence_of_element_located((By.CSS_SELECTOR, "article[itemprop='articleBody']"))
-                )
-                html = self.driver.page_source
-                return self.parser.get_episode_urls(html), self.parser.get_title(html)
+                if not self._wait_for_selector(driver, ARTICLE_SELECTOR, PAGE_LOAD_TIMEOUT):
+                    raise TimeoutError("episode list did not load")
+                if self.fetch_mode == FETCH_MODE_HTTP:
+                    self._export_browser_session(driver)
+                self._save_session(driver)
+                return driver.page_source
             except Exception as e:
                 logger.error(f"Error getting episode list: {e}")
-                return [], ""
+                return ""
 
     def _create_worker_tabs(self, count: int):
         created_tabs = []
@@ -267,152 +838,623 @@ class CrawlerEngine:
                 except Exception as e:
                     logger.error(f"Failed to open tab {i+1}: {e}")
             
-            # Wait a bit for tabs to open
-            time.sleep(1)
-            
-            new_handles = set(self.driver.window_handles)
-            diff = new_handles - initial_handles
+            # 탭이 모두 열릴 때까지 짧게 확인 (고정 sleep 대신)
+            deadline = time.time() + 2
+            while True:
+                new_handles = set(self.driver.window_handles)
+                diff = new_handles - initial_handles
+                if len(diff) >= count or time.time() >= deadline:
+                    break
+                time.sleep(0.05)
             created_tabs = list(diff)
             
             logger.info(f"Created {len(created_tabs)} worker tabs. Total tabs: {len(new_handles)}")
             
         return created_tabs
 
-    def _worker_loop(self, worker_id: int, tab_handle: str, urls: list, main_url: str, list_title: str = ""):
-        logger.info(f"Worker {worker_id} started. Tasks: {len(urls)}")
-        
-        parsed_uri = urlparse(main_url)
-        referer = f'{parsed_uri.scheme}://{parsed_uri.netloc}/'
-        list_url = f'{parsed_uri.scheme}://{parsed_uri.netloc}{parsed_uri.path}'
+    def _worker_loop(self, worker_id: int, slot: BrowserSlot, work_queue: EpisodeQueue, free_slots: queue.Queue = None) -> int:
+        logger.info(f"Worker {worker_id} started. Queue: {len(work_queue)}")
 
-        for i, url in enumerate(urls):
-            if self.stop_event.is_set():
+        processed = 0
+        limit = self.worker_limit
+        while not self.stop_event.is_set():
+            # 자동 조절 중이면 동시 처리 한도에 자리가 날 때까지 대기
+            if limit and not limit.acquire(self.stop_event):
+                break
+            task = work_queue.get(self.stop_event)
+            if task is None:
+                if limit:
+                    limit.release()
                 break
             
-            logger.info(f"Worker {worker_id} processing ({i+1}/{len(urls)}): {url}")
+            logger.info(f"Worker {worker_id} processing (attempt {task.attempts+1}, {len(work_queue)} queued): {task.url}")
             
             success = False
+            started = time.time()
+            borrowed = []
             try:
-                success = self._process_single_episode(worker_id, tab_handle, url, referer, list_url, list_title)
+                with self.browser_gate.entered():
+                    success = self._process_episode(worker_id, slot, task, free_slots, borrowed)
             except Exception as e:
-                logger.error(f"Worker {worker_id} error processing {url}: {e}")
+                logger.error(f"Worker {worker_id} error processing {task.url}: {e}")
+            self.watchdog.leave(worker_id)
             
-            if not success:
-                logger.warning(f"Worker {worker_id} failed to process: {url}")
+            if limit:
+                if success:
+                    limit.record_success(time.time() - started)
+                elif not self.stop_event.is_set():
+                    limit.record_failure(FAILURE_ERROR)
+                limit.release()
+
+            if success:
+                processed += 1
+            elif not self.stop_event.is_set() and work_queue.retry(task):
+                logger.warning(f"Worker {worker_id} failed to process, requeued ({task.attempts}/{work_queue.max_retries}): {task.url}")
+            else:
+                logger.warning(f"Worker {worker_id} failed to process ({task.error or FAILURE_ERROR}): {task.url}")
+                if not self.stop_event.is_set():
+                    self._defer_or_fail(task)
+            work_queue.task_done()
+
+            if slot and self.watchdog.fired(worker_id):
+                slot = self._recover_worker_slot(worker_id, slot)
+                if slot is None:
+                    logger.error(f"Worker {worker_id} lost its browser slot and stops.")
+                    break
+            elif slot and success and self.recycler and not self.stop_event.is_set():
+                self._maybe_recycle_browser(worker_id, slot)
+            for lent in borrowed:
+                # HTTP 모드: 폴백에 빌린 브라우저 슬롯도 같은 기준으로 교체/재시작한 뒤 돌려놓습니다.
+                if self.watchdog.fired(worker_id):
+                    lent = self._recover_worker_slot(worker_id, lent)
+                elif success and self.recycler and not self.stop_event.is_set():
+                    self._maybe_recycle_browser(worker_id, lent)
+                if lent:
+                    free_slots.put(lent)
             
             # Small delay to prevent hammering? 
             # Accessing next page will have network delay anyway.
 
         logger.info(f"Worker {worker_id} finished.")
+        return processed
 
-    def _process_single_episode(self, worker_id: int, tab_handle: str, episode_url: str, referer: str, list_url: str = None, list_title: str = "") -> bool:
-        images = []
-        episode_title = ""
+    def _process_episode(self, worker_id: int, slot: BrowserSlot, task: EpisodeTask, free_slots: queue.Queue = None,
+                         borrowed: list = None) -> bool:
+        """borrowed: HTTP 모드의 브라우저 폴백이 빌린 슬롯을 담습니다 (워커 루프가 브라우저 게이트 밖에서 정리해 돌려놓음)."""
+        task.error = ""
+        if task.images is not None:
+            # 이미 파싱된 에피소드 (저널에서 복원했거나 재시도 단계): 받은 파일은 건너뛰고 나머지만 다운로드
+            logger.info(f"Worker {worker_id} [{task.title}] resuming download ({len(task.images)} images already parsed).")
+            return self._enqueue_download(EpisodeDownload(task=task, title=task.title, images=task.images))
+        if self.fetch_mode != FETCH_MODE_HTTP:
+            return self._process_single_episode(worker_id, slot, task)
+
+        result = self._process_single_episode_http(worker_id, task)
+        if result is not None:
+            return result
+
+        # 브라우저 폴백: 빈 슬롯을 빌려 에피소드 전체를 브라우저로 처리
+        slot = self._borrow_browser_slot(worker_id, task, free_slots)
+        if slot is None:
+            return False
+        borrowed.append(slot)
+        return self._process_single_episode(worker_id, slot, task)
+
+    def _borrow_browser_slot(self, worker_id: int, task: EpisodeTask, free_slots: queue.Queue):
+        """빈 브라우저 슬롯을 기다립니다. 중지되거나 BROWSER_SLOT_WAIT 초 안에 돌아오지 않으면 None."""
+        deadline = time.time() + BROWSER_SLOT_WAIT
+        while not self.stop_event.is_set():
+            try:
+                return free_slots.get(timeout=0.5)
+            except queue.Empty:
+                if time.time() >= deadline:
+                    logger.warning(f"Worker {worker_id}: no browser slot free for {BROWSER_SLOT_WAIT}s, giving up on fallback: {task.url}")
+                    task.error = FAILURE_TIMEOUT
+                    return None
+        return None
+
+    def _process_single_episode_http(self, worker_id: int, task: EpisodeTask):
+        """
+        브라우저 없이 에피소드 HTML을 가져와 파싱합니다.
+        캡챠 페이지이거나 HTML만으로 이미지를 다 찾지 못하면 None 을 반환해 브라우저 경로로 보냅니다.
+        """
+        discovery_started = time.time()
+        try:
+            final_url, html = self.downloader.fetch_html(task.url, task.job.referer)
+        except Exception as e:
+            logger.warning(f"Worker {worker_id} HTTP fetch failed, falling back to browser: {e}")
+            return None
+
+        if self.parser.is_captcha_page(final_url, html):
+            logger.info(f"Worker {worker_id}: Captcha on HTTP fetch, falling back to browser: {task.url}")
+            self._record_worker_failure(FAILURE_CAPTCHA)
+            return None
+
+        image_items, missing = self.parser.discover_images(html)
+        if not image_items or missing:
+            logger.info(f"Worker {worker_id}: HTTP page has {missing} unresolved images, falling back to browser: {task.url}")
+            return None
+
+        return self._hand_off_episode(worker_id, task, html, image_items, time.time() - discovery_started, FETCH_MODE_HTTP)
+
+    def _process_single_episode(self, worker_id: int, slot: BrowserSlot, task: EpisodeTask) -> bool:
+        """브라우저 단계 (이동/캡챠/스크롤/파싱). 성공하면 이미지 목록을 다운로드 단계로 넘깁니다."""
+        episode_url = task.url
         
-        # --- Browser Phase (Protected by Lock) ---
-        with self.driver_lock:
+        # --- Browser Phase (Protected by the slot lock; shared only in tabs mode) ---
+        self.watchdog.enter(worker_id, PHASE_NAVIGATE, slot)
+        with slot.session() as driver:
             try:
-                self.driver.switch_to.window(tab_handle)
-                self.driver.execute_script(f"window.location.href = '{episode_url}';")
+                driver.execute_script("window.__manaNavPending = true; window.location.href = arguments[0];", episode_url)
             except Exception as e:
                 logger.error(f"Worker {worker_id} failed to switch/navigate: {e}")
+                task.error = FAILURE_ERROR
                 return False
 
-        # --- Wait for Load (Partial Lock or Loop) ---
-        # We cannot hold the lock while waiting for 30 seconds.
-        # We must poll.
-        if not self._wait_for_page_load(worker_id, tab_handle):
+        # --- Wait for Load (event-driven; sliced in tabs mode so the shared lock is not held for long) ---
+        self.watchdog.enter(worker_id, PHASE_LOAD, slot)
+        if not self._wait_for_page_load(worker_id, slot):
+            task.error = FAILURE_TIMEOUT
             return False
 
         # --- Processing Phase ---
         # 1. Captcha Check
-        with self.driver_lock:
-            try:
-                self.driver.switch_to.window(tab_handle)
-                if self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
-                    logger.info(f"Worker {worker_id}: Captcha detected on Episode Page. Solving...")
-                    self._handle_captcha(worker_id=worker_id)
-            except Exception as e:
-                logger.error(f"Worker {worker_id} captcha check error: {e}")
+        self.watchdog.enter(worker_id, PHASE_CAPTCHA, slot)
+        try:
+            with slot.session() as driver:
+                self._log_page_metrics(worker_id, driver)
+                captcha = self.parser.is_captcha_page(driver.current_url, driver.page_source)
+            if captcha:
+                logger.info(f"Worker {worker_id}: Captcha detected on Episode Page. Solving...")
+                self._record_worker_failure(FAILURE_CAPTCHA)
+                task.error = FAILURE_CAPTCHA
+                if not self.captcha_auto_solve:
+                    # 사람이 푸는 동안은 기한을 두지 않습니다.
+                    self.watchdog.leave(worker_id)
+                # 캡챠 입력은 요소 조작이 필요하므로 (CDP 세션이어도) Selenium 드라이버로 처리합니다.
+                with slot.session(webdriver=True) as driver:
+                    self._handle_captcha(driver, worker_id=worker_id)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} captcha check error: {e}")
 
         # Re-wait after captcha solve if necessary
-        if not self._wait_for_page_load(worker_id, tab_handle):
+        self.watchdog.enter(worker_id, PHASE_LOAD, slot)
+        if not self._wait_for_page_load(worker_id, slot):
+            task.error = task.error or FAILURE_TIMEOUT
             return False
 
-        # 2. Scroll (Interleaved Locking)
-        self._scroll_down(worker_id, tab_handle)
+        # 2-3. Discover Images (scroll + parse, or read the DOM attributes without scrolling)
+        discovery_started = time.time()
+        try:
+            if self.image_discovery == IMAGE_DISCOVERY_DOM:
+                self.watchdog.enter(worker_id, PHASE_PARSE, slot)
+                html, image_items = self._discover_images_without_scroll(worker_id, slot)
+            else:
+                # 2. Scroll (Interleaved Locking)
+                self.watchdog.enter(worker_id, PHASE_SCROLL, slot)
+                self._scroll_down(worker_id, slot)
 
-        # 3. Parse (Blocking Lock)
-        with self.driver_lock:
-            try:
-                self.driver.switch_to.window(tab_handle)
-                html = self.driver.page_source
-                episode_title = self.parser.get_title(html)
+                # 3. Parse (page_source under lock, BeautifulSoup outside it)
+                self.watchdog.enter(worker_id, PHASE_PARSE, slot)
+                with slot.session() as driver:
+                    html = driver.page_source
                 image_items = self.parser.get_images(html)
-                
-                for i, img in enumerate(image_items):
-                    ext = ".jpg" 
-                    if '.png' in img.url: ext = '.png'
-                    elif '.gif' in img.url: ext = '.gif'
-                    elif '.webp' in img.url: ext = '.webp'
-                    img.filename = f"{i+1:03d}{ext}"
-                    images.append(img)
-                
-                logger.info(f"Worker {worker_id} [{episode_title}] found {len(images)} images.")
+        except Exception as e:
+            logger.error(f"Worker {worker_id} browser error: {e}")
+            task.error = FAILURE_ERROR
+            return False
+        return self._hand_off_episode(worker_id, task, html, image_items, time.time() - discovery_started, self.image_discovery, slot=slot)
 
-            except Exception as e:
-                logger.error(f"Worker {worker_id} browser error: {e}")
-                return False
+    def _hand_off_episode(self, worker_id: int, task: EpisodeTask, html: str, image_items: list, discovery_time: float, source: str,
+                          slot: BrowserSlot = None) -> bool:
+        """파일명을 붙여 다운로드 단계로 넘깁니다. 회수 모드면 브라우저가 받아 둔 이미지를 먼저 저장합니다."""
+        self.discovery_times.append(discovery_time)
+        images = []
+        episode_title = self.parser.get_title(html)
+        for i, img in enumerate(image_items):
+            ext = ".jpg" 
+            if '.png' in img.url: ext = '.png'
+            elif '.gif' in img.url: ext = '.gif'
+            elif '.webp' in img.url: ext = '.webp'
+            img.filename = f"{i+1:03d}{ext}"
+            images.append(img)
+        
+        logger.info(f"Worker {worker_id} [{episode_title}] found {len(images)} images ({source} discovery, {discovery_time:.1f}s).")
+        if images and not self.first_episode_logged and self.run_started_at:
+            self.first_episode_logged = True
+            logger.info(f"Time to first parsed episode: {time.time() - self.run_started_at:.1f}s (session {'reused' if self.session_store else 'fresh'})")
 
-        # --- Download Phase (No Lock needed) ---
         if not images:
+            # 캡챠를 넘지 못한 페이지였다면 captcha 로 남아 있음
+            task.error = task.error or FAILURE_PARSE_EMPTY
             return False
+        task.error = ""
+        self.journal.episode_parsed(task, episode_title, images)
 
-        safe_title = self._sanitize_folder_name(episode_title)
-        save_dir = f"{self.download_path}/{safe_title}"
-        
-        success_count, total = self.downloader.download_chapter_images(images, save_dir, referer, self.stop_event)
+        harvested = 0
+        remaining = images
+        if self.harvester and slot:
+            save_dir = self._episode_dir(task.job, episode_title)
+            try:
+                remaining = self.harvester.harvest(lambda: slot.session(webdriver=True), images, save_dir)
+            except Exception as e:
+                logger.warning(f"Worker {worker_id} image harvest failed: {e}")
+                remaining = images
+            harvested = len(images) - len(remaining)
+            logger.info(f"Worker {worker_id} [{episode_title}] harvested {harvested}/{len(images)} images from the browser.")
+
+        # --- Hand off to Download Stage (the tab is free for the next episode) ---
+        self.watchdog.leave(worker_id)
+        return self._enqueue_download(EpisodeDownload(task=task, title=episode_title, images=remaining, harvested=harvested,
+                                                      parsed=images))
+
+    @staticmethod
+    def _log_page_metrics(worker_id: int, driver):
+        """Assumes LOCK is HELD. 페이지 로드 시간과 전송량을 기록해 리소스 차단 효과를 비교할 수 있게 합니다."""
+        try:
+            load_ms, transferred = driver.execute_script(PAGE_METRICS_JS)
+            logger.info(f"Worker {worker_id} page loaded in {load_ms:.0f}ms, {transferred / 1024:.0f}KB transferred")
+        except Exception:
+            pass
+
+    def _discover_images_without_scroll(self, worker_id: int, slot: BrowserSlot):
+        """
+        스크롤 없이 data-* 속성/인라인 스크립트에서 이미지 URL을 읽습니다.
+        실제 URL을 알 수 없는 자리표시자가 남아 있을 때만 맨 아래로 한 번 이동해 지연 로딩을 트리거합니다.
+        """
+        with slot.session() as driver:
+            html = driver.page_source
+        images, missing = self.parser.discover_images(html)
+        if images and not missing:
+            return html, images
+
+        logger.info(f"Worker {worker_id}: {missing} lazy images unresolved, jumping to bottom once.")
+        with slot.session() as driver:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(LAZY_JUMP_SETTLE)
+        with slot.session() as driver:
+            html = driver.page_source
+        images, missing = self.parser.discover_images(html)
+        if missing:
+            logger.warning(f"Worker {worker_id}: {missing} lazy images still unresolved after jump.")
+        return html, images
+
+    def _enqueue_download(self, item: EpisodeDownload) -> bool:
+        """
+        공유 다운로드 풀에 넘깁니다. 풀의 대기열이 가득 차면 (backpressure) 자리가 날 때까지 기다리며,
+        에피소드가 끝나면 풀의 스레드에서 _on_download_done 이 호출됩니다.
+        """
+        if self.stop_event.is_set():
+            return False
+        with self.download_cond:
+            self.downloads_in_flight[id(item)] = item
+        if self._submit_download(item):
+            return True
+        self._download_finished(item, False)
+        return False
+
+    def _submit_download(self, item: EpisodeDownload, block: bool = True) -> bool:
+        key = ("download", next(self.download_ids))
+        cancel = threading.Event()
+        future = self.download_scheduler.submit(item.images, self._episode_dir(item.task.job, item.title), item.task.job.referer,
+                                                cancel=AnyEvent(self.stop_event, cancel), stop_event=self.stop_event, block=block,
+                                                priority=item.task.priority,
+                                                on_start=lambda: self.watchdog.enter(key, PHASE_DOWNLOAD, (item.task, cancel)))
+        if future is None:
+            return False
+        # 다운로드 단계 기한은 풀이 첫 이미지를 꺼낼 때부터 잽니다 (다른 에피소드 뒤에서 기다린 시간은 멈춤이 아님).
+        future.add_done_callback(lambda done: self._on_download_done(item, key, done))
+        return True
+
+    def _on_download_done(self, item: EpisodeDownload, key, future: concurrent.futures.Future):
+        """
+        다운로드 풀 스레드에서 호출. 다운로드 단계 기한을 넘겨 워치독이 취소했으면 남은 이미지만 다시 넣고
+        (max_episode_retries 까지), 끝내 못 받으면 저널에 파싱 결과가 남아 있으므로 재시도 단계/다음 실행에서 이어 받습니다.
+        """
+        self.watchdog.leave(key)
+        completed = False
+        try:
+            success_count, total = future.result()
+            if self.watchdog.fired(key) and not self.stop_event.is_set():
+                item.stalls += 1
+                if item.stalls <= self.max_episode_retries:
+                    logger.warning(f"Downloader [{item.title}] download deadline exceeded, "
+                                   f"retrying remaining images ({item.stalls}/{self.max_episode_retries})")
+                    # 풀 스레드 안이므로 대기열 상한을 기다리지 않고 넣습니다.
+                    if self._submit_download(item, block=False):
+                        return
+                else:
+                    logger.error(f"Downloader [{item.title}] gave up after repeated download stalls: {item.task.url}")
+                success_count = None
+            completed = self._finish_download(item, success_count, total)
+        except Exception as e:
+            logger.error(f"Downloader error processing {item.task.url}: {e}")
+        self._download_finished(item, completed)
+
+    def _download_finished(self, item: EpisodeDownload, completed: bool):
+        with self.download_cond:
+            if self.downloads_in_flight.pop(id(item), None) is None:
+                # _wait_for_downloads 가 중지 유예 시간을 넘겨 이미 실패로 센 에피소드
+                return
+            if completed:
+                self.downloads_completed += 1
+            self.download_cond.notify_all()
+
+    def _wait_for_downloads(self) -> int:
+        """
+        넘긴 에피소드가 모두 끝날 때까지 기다리고 이번 라운드에 완료한 에피소드 수를 반환합니다.
+        중지된 뒤에는 DOWNLOAD_STOP_GRACE 초까지만 기다리고, 남은 에피소드는 실패로 세고 돌아갑니다
+        (저널에 파싱 결과가 남아 있으므로 다음 실행에서 이어 받습니다).
+        """
+        stopped_at = None
+        with self.download_cond:
+            while self.downloads_in_flight:
+                if self.stop_event.is_set():
+                    stopped_at = stopped_at or time.time()
+                    if time.time() - stopped_at >= DOWNLOAD_STOP_GRACE:
+                        abandoned = list(self.downloads_in_flight.values())
+                        self.downloads_in_flight.clear()
+                        break
+                self.download_cond.wait(0.5)
+            else:
+                return self.downloads_completed
+            completed = self.downloads_completed
+        logger.warning(f"Stopped with {len(abandoned)} episode downloads unfinished after {DOWNLOAD_STOP_GRACE}s, "
+                       f"counting them as failed.")
+        for item in abandoned:
+            logger.warning(f"Download abandoned on stop, not recorded as crawled: {item.task.url}")
+            if item.task.job:
+                item.task.job.failed += 1
+        return completed
+
+    def _episode_dir(self, job: SeriesJob, episode_title: str) -> str:
+        return f"{job.download_path}/{self._sanitize_folder_name(episode_title)}"
+
+    def _finish_download(self, item: EpisodeDownload, success_count, total: int) -> bool:
+        """success_count 가 None 이면 다운로드 단계가 계속 멈춘 경우 (재시도 단계로 미룸)"""
+        job = item.task.job
+        episode_title = item.title
+        if success_count is None:
+            item.task.error = FAILURE_TIMEOUT
+            return self._defer_download(item)
+        success_count += item.harvested
+        total += item.harvested
         
-        # User request: Save to DB when all downloads are finished (regardless of success count logic)
-        # This ensures we don't get stuck processing the same broken episode forever.
+        # (중지로 중단된 에피소드는 기록하지 않아 다음 실행에서 다시 받습니다.)
+        if self.stop_event.is_set() and success_count < total:
+            return False
+        # 일시적 오류로 빠진 이미지가 많으면 기록하지 않고 재시도 단계로 미룹니다.
+        # 영구 실패(404 등)뿐이거나 commit_threshold 이상 받았으면 기록해 같은 에피소드를 계속 붙잡지 않습니다.
+        if success_count < total and not self._should_commit(item, success_count, total):
+            return self._defer_download(item)
         
         # User request: Add list_url (address before ?) to DB
-        db.add_crawled_url(episode_url, episode_title, list_url, list_title, self.download_path)
+        db.add_crawled_url(item.task.url, episode_title, job.list_url, job.list_title, job.download_path)
+        self.journal.episode_done(item.task)
         
         if success_count > 0:
-            logger.info(f"Worker {worker_id} [{episode_title}] Downloaded {success_count}/{total}")
+            logger.info(f"Downloader [{episode_title}] Downloaded {success_count}/{total}")
             return True
         else:
-            logger.warning(f"Worker {worker_id} [{episode_title}] Finished with 0 successes out of {total}")
+            logger.warning(f"Downloader [{episode_title}] Finished with 0 successes out of {total}")
             return True # Considered processed
 
-    def _wait_for_page_load(self, worker_id: int, tab_handle: str) -> bool:
-        """Polls for element presence without holding the lock for tool long."""
-        end_time = time.time() + 30
+    def _should_commit(self, item: EpisodeDownload, success_count: int, total: int) -> bool:
+        failed = [img for img in item.images if img.error]
+        transient = [img for img in failed if img.error not in PERMANENT_FAILURES]
+        summary = ", ".join(f"{kind} {count}" for kind, count in collections.Counter(img.error for img in failed).items())
+        if not transient:
+            logger.warning(f"Downloader [{item.title}] {success_count}/{total} images, "
+                           f"the rest are permanently unavailable ({summary}). Recording as crawled.")
+            return True
+        if success_count / total >= self.commit_threshold:
+            logger.warning(f"Downloader [{item.title}] {success_count}/{total} images ({summary}), "
+                           f"above the {self.commit_threshold:.0%} threshold. Recording as crawled.")
+            return True
+        item.task.error = collections.Counter(img.error for img in transient).most_common(1)[0][0]
+        logger.warning(f"Downloader [{item.title}] only {success_count}/{total} images ({summary}).")
+        return False
+
+    def _defer_download(self, item: EpisodeDownload) -> bool:
+        """
+        파싱 결과를 작업에 남겨 재시도 때는 브라우저 단계 없이 빠진 이미지만 받게 합니다.
+        회수한 이미지까지 전체 목록을 넘기므로 (디스크에 있는 파일은 다시 받지 않음) 재시도의 성공/전체 수가 에피소드 전체 기준입니다.
+        """
+        item.task.title = item.title
+        item.task.images = item.parsed or item.images
+        self._defer_or_fail(item.task)
+        return False
+
+    def _defer_or_fail(self, task: EpisodeTask):
+        """일시적 실패는 실행 끝의 재시도 단계로 미루고, 영구 실패이거나 재시도를 다 쓴 경우 실패로 남깁니다."""
+        kind = task.error or FAILURE_ERROR
+        if kind not in PERMANENT_FAILURES and task.deferrals < DEFERRED_RETRY_PASSES:
+            task.deferrals += 1
+            task.attempts = 0
+            with self.deferred_lock:
+                self.deferred.append(task)
+            logger.info(f"Deferred to the retry pass ({kind}): {task.url}")
+            return
+        logger.warning(f"Giving up on episode ({kind}), not recorded as crawled: {task.url}")
+        self.journal.episode_failed(task)
+        if task.job:
+            task.job.failed += 1
+
+    def _on_phase_expired(self, key, phase: str, context) -> bool:
+        """워치독 스레드에서 호출. 멈춘 작업을 정리했으면 True (워커가 슬롯을 교체하고 에피소드는 재시도 큐로)."""
+        if phase == PHASE_DOWNLOAD:
+            task, cancel = context
+            logger.error(f"Watchdog: download of {task.url} exceeded its deadline. Cancelling.")
+            cancel.set()
+            return True
+        slot = context
+        busy_since = slot.busy_since
+        if busy_since is None or time.time() - busy_since < REARM_DELAY:
+            # 공유 락을 기다리거나 명령 사이에 있을 뿐 브라우저가 멈춘 것은 아님
+            return False
+        logger.error(f"Watchdog: worker {key} stuck in {phase} for {time.time() - busy_since:.0f}s. "
+                     f"Closing its {'tab' if slot.tab_handle else 'browser'}.")
+        return self._kill_slot(slot)
+
+    def _kill_slot(self, slot: BrowserSlot) -> bool:
+        """멈춘 명령이 오류로 끝나도록 슬롯의 탭(탭 모드) 또는 브라우저(풀 모드)를 강제로 닫습니다."""
+        if slot.cdp_tab:
+            # 웹소켓을 닫으면 응답을 기다리던 recv 가 바로 끝납니다.
+            slot.cdp_tab.close()
+        if not slot.tab_handle and slot.driver is self.driver:
+            # 목록 탭과 같은 브라우저를 쓰는 풀 슬롯은 닫을 수 없습니다 (WebDriver 명령 제한 시간에 맡김).
+            return bool(slot.cdp_tab)
+        try:
+            if close_targets(slot.driver, slot.tab_handle):
+                return True
+        except Exception as e:
+            logger.warning(f"Watchdog: failed to close DevTools target: {e}")
+        if slot.owns_driver:
+            process = getattr(getattr(slot.driver, "service", None), "process", None)
+            if process:
+                process.kill()
+                return True
+        return bool(slot.cdp_tab)
+
+    def _maybe_recycle_browser(self, worker_id: int, slot: BrowserSlot):
+        """
+        슬롯의 브라우저가 에피소드 수/메모리 한도를 넘으면 재시작합니다.
+        목록 탭과 같은 브라우저(탭 모드 전체, 풀 모드 첫 브라우저)는 모든 작업이 멈춘 뒤에 재시작합니다.
+        """
+        old = slot.driver
+        reason = self.recycler.record(old)
+        if not reason:
+            return
+        try:
+            if old is not self.driver:
+                # 이 워커만 쓰는 풀 브라우저
+                self._recycle_browser(old, reason)
+                return
+            logger.info(f"Worker {worker_id}: waiting for in-flight episodes before restarting the shared browser ({reason})...")
+            with self.browser_gate.quiesce():
+                if slot.driver is old:
+                    # 기다리는 동안 다른 워커가 이미 재시작했을 수 있음
+                    self._recycle_browser(old, reason)
+        except Exception as e:
+            logger.error(f"Failed to recycle browser: {e}")
+
+    def _recycle_browser(self, old, reason: str):
+        """
+        브라우저를 종료하고 같은 프로필로 다시 띄운 뒤 쿠키를 복원합니다.
+        워커들이 들고 있는 BrowserSlot 객체는 그대로 두고 드라이버/탭만 바꿔 끼웁니다.
+        """
+        shares_main = old is self.driver
+        slots = [s for s in self.worker_slots if s.driver is old]
+        profile = self._profile_name(old)
+        logger.info(f"Recycling browser '{profile}' ({reason})...")
+
+        cookies = []
+        try:
+            cookies = old.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            if self.session_store:
+                self.session_store.save_cookies(cookies)
+        except Exception as e:
+            logger.warning(f"Failed to read cookies before recycling: {e}")
+        for slot in slots:
+            slot.detach_cdp()
+        self.recycler.forget(old)
+        self._retire_driver(old)
+
+        new = self._launch_driver(profile)
+        if cookies and not self.session_store:
+            # 세션 유지가 꺼져 있으면 _launch_driver 가 복원하지 않으므로 직접 옮깁니다.
+            try:
+                new.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookie_params(cookies)})
+            except Exception as e:
+                logger.warning(f"Failed to restore cookies after recycling: {e}")
+
+        if shares_main:
+            self.driver = new
+            self.main_slot.driver = new
+            self.main_slot.tab_handle = new.window_handles[0]
+            tabs = self._create_worker_tabs(len(slots))
+            if len(tabs) < len(slots):
+                logger.error(f"Recycled browser opened only {len(tabs)}/{len(slots)} worker tabs.")
+            for slot, tab in zip(slots, tabs):
+                slot.driver = new
+                slot.tab_handle = tab
+        else:
+            for slot in slots:
+                slot.driver = new
+        self._prepare_worker_slots(slots)
+        logger.info(f"Browser '{profile}' recycled.")
+
+    def _profile_name(self, driver) -> str:
+        if self.driver_pool:
+            for i, slot in enumerate(self.driver_pool.slots):
+                if slot.driver is driver:
+                    return f"pool-{i+1}"
+        return "main"
+
+    def _retire_driver(self, driver):
+        """재시작용 종료: 브로커에도 돌려주지 않고 실제로 종료해 메모리를 반환합니다."""
+        try:
+            if self.broker:
+                self.broker.retire(driver)
+            else:
+                driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while closing browser: {e}")
+
+    def _recover_worker_slot(self, worker_id: int, slot: BrowserSlot):
+        """워치독이 닫은 슬롯을 새 탭/브라우저로 교체합니다. 실패하면 None."""
+        replacement = self._replace_worker_slot(slot)
+        if replacement is None and not self.driver_pool:
+            created = self._create_worker_slots(1)
+            replacement = created[0] if created else None
+        try:
+            index = self.worker_slots.index(slot)
+            if replacement:
+                self.worker_slots[index] = replacement
+            else:
+                del self.worker_slots[index]
+        except ValueError:
+            pass
+        if replacement:
+            logger.info(f"Worker {worker_id} continues on a fresh {'tab' if replacement.tab_handle else 'browser'}.")
+        return replacement
+
+    def _wait_for_page_load(self, worker_id: int, slot: BrowserSlot) -> bool:
+        """
+        본문(Article) 또는 캡챠가 나타날 때까지 브라우저 안에서 대기합니다.
+        전용 브라우저(풀 모드)는 한 번의 호출로 끝까지 기다리고, 탭 모드는 다른 워커가
+        굶지 않도록 SHARED_WAIT_SLICE 단위로 나눠 기다립니다. 어느 쪽이든 요소가 생기면 즉시 반환합니다.
+        """
+        end_time = time.time() + PAGE_LOAD_TIMEOUT
         while time.time() < end_time:
             if self.stop_event.is_set():
                 return False
             
-            found = False
-            with self.driver_lock:
-                try:
-                    self.driver.switch_to.window(tab_handle)
-                    # Check for Article OR Captcha
-                    elems = self.driver.find_elements(By.CSS_SELECTOR, "article[itemprop='articleBody'], img[src*='kcaptcha_image.php']")
-                    if elems:
-                        found = True
-                except Exception:
-                    pass
-            
-            if found:
-                return True
-            
-            time.sleep(0.5)
+            remaining = end_time - time.time()
+            wait = remaining if slot.exclusive else min(SHARED_WAIT_SLICE, remaining)
+            with slot.session() as driver:
+                if self._wait_for_selector(driver, READY_SELECTOR, wait):
+                    return True
         
         logger.warning(f"Worker {worker_id} timeout waiting for page load.")
+        self._record_worker_failure(FAILURE_TIMEOUT)
         return False
 
-    def _scroll_down(self, worker_id: int, tab_handle: str):
+    @staticmethod
+    def _wait_for_selector(driver, selector: str, timeout: float) -> bool:
+        """Assumes LOCK is HELD. 셀렉터가 나타나면 True, 타임아웃이면 False."""
+        deadline = time.time() + timeout
+        while True:
+            remaining = max(deadline - time.time(), 0)
+            try:
+                return bool(driver.execute_async_script(WAIT_FOR_SELECTOR_JS, selector, int(remaining * 1000)))
+            except Exception:
+                # 대기 중 페이지가 이동하면 스크립트가 끊깁니다 (document unloaded). 새 문서에서 다시 대기합니다.
+                if time.time() >= deadline:
+                    return False
+                time.sleep(0.05)
+
+    def _scroll_down(self, worker_id: int, slot: BrowserSlot):
         """
         지연 로딩(lazy loading)을 트리거하기 위해 단계적으로 스크롤을 내립니다.
         
@@ -420,6 +1462,7 @@ class CrawlerEngine:
         긴 스크롤 과정 동안 락(lock)을 계속 잡고 있으면 다른 워커 탭들이 완전히 차단됩니다.
         루프의 각 반복에서 락을 획득하고 해제함으로써, 이 스레드가 다음 스크롤 단계나 
         네트워크 응답을 기다리는 동안 다른 스레드가 페이지 이동이나 파싱 작업을 수행할 수 있도록 합니다.
+        (풀 모드에서는 슬롯 락을 이 워커만 사용하므로 경합이 없습니다.)
         """
         max_scrolls = 100 # Safety limit
         scroll_count = 0
@@ -429,13 +1472,15 @@ class CrawlerEngine:
             if self.stop_event.is_set():
                 break
                 
-            with self.driver_lock:
+            with slot.session() as driver:
                 try:
-                    self.driver.switch_to.window(tab_handle)
                     # Get current height before scroll
-                    # last_height = self.driver.execute_script("return document.body.scrollHeight")
+                    # last_height = driver.execute_script("return document.body.scrollHeight")
                     
-                    self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
+                    if isinstance(driver, CdpTab):
+                        driver.execute_script(SCROLL_PAGE_JS)
+                    else:
+                        driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
                     
                     # Check if reached bottom? 
                     # Many infinite scroll sites extend scrollHeight.
@@ -444,8 +1489,8 @@ class CrawlerEngine:
                     # PageDown is usually enough.
                     
                     # Let's check if we hit bottom.
-                    # new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    # current_scroll = self.driver.execute_script("return window.scrollY + window.innerHeight")
+                    # new_height = driver.execute_script("return document.body.scrollHeight")
+                    # current_scroll = driver.execute_script("return window.scrollY + window.innerHeight")
                     
                     # Optimization: Just scroll unconditionally for separate images to load?
                     # The user said: "Move to end of page as before".
@@ -461,11 +1506,10 @@ class CrawlerEngine:
             # Check for termination condition
             # We need to acquire lock again to check heights
             reached_bottom = False
-            with self.driver_lock:
+            with slot.session() as driver:
                 try:
-                    self.driver.switch_to.window(tab_handle)
-                    current_scroll = self.driver.execute_script("return window.scrollY + window.innerHeight")
-                    total_height = self.driver.execute_script("return document.body.scrollHeight")
+                    current_scroll = driver.execute_script("return window.scrollY + window.innerHeight")
+                    total_height = driver.execute_script("return document.body.scrollHeight")
                     
                     # Allow some tolerance (e.g. 10px)
                     if current_scroll >= total_height - 10:
@@ -476,11 +1520,10 @@ class CrawlerEngine:
             if reached_bottom:
                 # Wait a bit more to see if it expands?
                 time.sleep(0.5)
-                with self.driver_lock:
+                with slot.session() as driver:
                     try:
-                        self.driver.switch_to.window(tab_handle)
-                        new_total_height = self.driver.execute_script("return document.body.scrollHeight")
-                        current_scroll = self.driver.execute_script("return window.scrollY + window.innerHeight")
+                        new_total_height = driver.execute_script("return document.body.scrollHeight")
+                        current_scroll = driver.execute_script("return window.scrollY + window.innerHeight")
                          # Double check
                         if current_scroll >= new_total_height - 10:
                              break
@@ -489,43 +1532,65 @@ class CrawlerEngine:
             
             scroll_count += 1
 
-    def _handle_captcha(self, worker_id: int):
+    def _handle_captcha(self, driver, worker_id: int):
         # Assumes LOCK is HELD
-        if not self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
+        if not self.parser.is_captcha_page(driver.current_url, driver.page_source):
             return
 
         if self.captcha_auto_solve:
-            self._handle_captcha_auto(worker_id)
+            self._handle_captcha_auto(driver, worker_id)
         else:
-            self._handle_captcha_manual(worker_id)
+            self._handle_captcha_manual(driver, worker_id)
+
+        # 캡챠를 통과한 세션을 HTTP 워커들도 쓰도록 넘겨주고, 다음 실행을 위해 저장합니다.
+        if self.fetch_mode == FETCH_MODE_HTTP:
+            self._export_browser_session(driver)
+        self._save_session(driver)
 
-    def _handle_captcha_auto(self, worker_id: int):
+    def _save_session(self, driver):
+        """Assumes LOCK is HELD."""
+        if not self.session_store:
+            return
+        try:
+            self.session_store.capture(driver)
+        except Exception as e:
+            logger.warning(f"Failed to save browser cookies: {e}")
+
+    def _export_browser_session(self, driver):
+        """Assumes LOCK is HELD. 브라우저 쿠키/User-Agent 를 다운로더의 requests 세션으로 복사"""
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+            self.downloader.import_browser_session(driver.get_cookies(), user_agent)
+        except Exception as e:
+            logger.warning(f"Failed to export browser session: {e}")
+
+    def _handle_captcha_auto(self, driver, worker_id: int):
         """Gemini API를 사용한 자동 캡챠 해결"""
         max_retries = 3
         for i in range(max_retries):
-            if not self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
+            if not self.parser.is_captcha_page(driver.current_url, driver.page_source):
                 return
 
             logger.warning(f"Worker {worker_id}: Captcha detected. Auto-solve attempt {i+1}")
             try:
-                captcha_img = self.driver.find_element(By.CSS_SELECTOR, "img[src*='kcaptcha_image.php']")
+                captcha_img = driver.find_element(By.CSS_SELECTOR, "img[src*='kcaptcha_image.php']")
                 img_data = captcha_img.screenshot_as_png
                 
                 code = self.captcha_solver.solve(img_data)
                 
                 if code:
-                    input_field = self.driver.find_element(By.NAME, "captcha_key")
+                    input_field = driver.find_element(By.NAME, "captcha_key")
                     input_field.clear()
                     input_field.send_keys(code)
                     
                     try:
-                         self.driver.find_element(By.XPATH, "//button[@type='submit' and text()='Check']").click()
+                         driver.find_element(By.XPATH, "//button[@type='submit' and text()='Check']").click()
                     except:
-                         self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+                         driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
                     
                     time.sleep(1)
                     
-                    if not self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
+                    if not self.parser.is_captcha_page(driver.current_url, driver.page_source):
                         logger.info(f"Worker {worker_id}: Captcha Solved!")
                         return
                     else:
@@ -535,12 +1600,12 @@ class CrawlerEngine:
                     time.sleep(1)
             except Exception as e:
                 logger.error(f"Worker {worker_id}: Captcha Error: {e}")
-                self.driver.refresh()
+                driver.refresh()
                 time.sleep(3)
         
         logger.error(f"Worker {worker_id}: Failed to solve Captcha automatically.")
 
-    def _handle_captcha_manual(self, worker_id: int):
+    def _handle_captcha_manual(self, driver, worker_id: int):
         """유저가 직접 캡챠를 입력할 때까지 대기"""
         logger.info(f"Worker {worker_id}: 캡챠 감지됨. 브라우저에서 직접 캡챠를 입력해 주세요...")
         
@@ -559,7 +1624,7 @@ class CrawlerEngine:
             elapsed += poll_interval
             
             try:
-                if not self.parser.is_captcha_page(self.driver.current_url, self.driver.page_source):
+                if not self.parser.is_captcha_page(driver.current_url, driver.page_source):
                     logger.info(f"Worker {worker_id}: 유저가 캡챠를 해결했습니다!")
                     return
             except Exception:
@@ -570,4 +1635,3 @@ class CrawlerEngine:
                 logger.info(f"Worker {worker_id}: 캡챠 입력 대기 중... (남은 시간: {remaining}초)")
         
         logger.error(f"Worker {worker_id}: 캡챠 입력 시간 초과 (2분).")
-
@@ -0,0 +1,131 @@
+import json
+from urllib.parse import urlparse
+
+from utils.logger import logger
+from data.db_repository import db
+from data.models import ImageItem
+from core.work_queue import SeriesJob, EpisodeTask, ORDER_NEWEST, DEFAULT_LATEST_COUNT, order_episodes
+
+# 에피소드 단계
+PHASE_QUEUED = "queued"  # 아직 브라우저 단계 전
+PHASE_PARSED = "parsed"  # 이미지 목록까지 확보 (재개 시 브라우저 단계 생략)
+PHASE_DONE = "done"  # 다운로드 + crawled_urls 기록 완료
+PHASE_FAILED = "failed"  # 재시도까지 실패 (재개 시 다시 시도)
+
+
+class JobJournal:
+    """
+    SQLite(crawl_jobs / job_episodes) 에 남기는 작업 저널.
+    시리즈 작업의 큐와 에피소드별 단계, 파싱된 이미지 목록을 기록해 두고,
+    프로세스가 죽거나 중지된 뒤 같은 URL 을 다시 시작하면 목록 재수집 없이 남은 곳부터 이어서 합니다.
+    이미지 파일은 완성된 것만 최종 이름으로 남으므로 (.part → rename) 디스크에 있는 파일은 다시 받지 않습니다.
+    저널 기록 실패는 크롤링을 멈추지 않습니다.
+    """
+
+    def open(self, job: SeriesJob, episode_urls: list):
+        """:param episode_urls: 목록 순서 (최신 화부터). 처리 순서는 재개할 때 order_episodes 로 다시 정합니다."""
+        try:
+            job.journal_id = db.save_crawl_job(job.target_url, job.list_url, job.list_title, job.download_path,
+                                               job.referer, episode_urls)
+        except Exception as e:
+            logger.warning(f"Failed to write job journal: {e}")
+
+    def resume(self, target_url: str, order: str = ORDER_NEWEST, latest_count: int = DEFAULT_LATEST_COUNT):
+        """
+        끝나지 않은 작업이 있으면 (SeriesJob, 남은 EpisodeTask 목록), 없으면 (None, []).
+        남은 작업의 순서와 우선순위는 저널의 전체 목록(완료 포함)에 order_episodes 를 다시 적용해 정하므로,
+        "최신 N화 먼저" 의 N화는 처음 열 때와 같은 화입니다.
+        """
+        row = db.get_crawl_job(target_url)
+        if not row:
+            return None, []
+        job_id, list_url, list_title, download_path, referer, journaled_url = row
+        if _origin(journaled_url) != _origin(target_url):
+            list_url, referer = self._move(job_id, journaled_url, target_url, list_url, referer)
+        job = SeriesJob(target_url=target_url, list_url=list_url, list_title=list_title, download_path=download_path,
+                        referer=referer, journal_id=job_id)
+        ordered = order_episodes(db.get_job_episode_urls(job_id), order, latest_count)
+        priorities = dict(ordered)
+        positions = {url: i for i, (url, _) in enumerate(ordered)}
+        tasks = []
+        for url, phase, title, images_json, attempts in db.get_pending_job_episodes(job_id):
+            if db.is_url_crawled(url):
+                # 기록 직후 저널 갱신 전에 죽은 경우
+                continue
+            task = EpisodeTask(url, job=job, priority=priorities[url])
+            if phase == PHASE_PARSED and images_json:
+                task.title = title or ""
+                task.images = [ImageItem(**item) for item in json.loads(images_json)]
+            tasks.append(task)
+        tasks.sort(key=lambda t: positions[t.url])
+        parsed = sum(1 for t in tasks if t.images is not None)
+        logger.info(f"Resuming journaled job '{list_title}': {len(tasks)} episodes left ({parsed} already parsed)")
+        return job, tasks
+
+    def pending_targets(self) -> list:
+        return db.get_crawl_job_urls()
+
+    def episode_parsed(self, task: EpisodeTask, title: str, images: list):
+        self._update(task, PHASE_PARSED, page_title=title,
+                     images=json.dumps([{"url": img.url, "filename": img.filename} for img in images], ensure_ascii=False))
+
+    def episode_done(self, task: EpisodeTask):
+        self._update(task, PHASE_DONE)
+
+    def episode_failed(self, task: EpisodeTask):
+        self._update(task, PHASE_FAILED, attempts=task.attempts)
+
+    def failed_episodes(self, target_url: str) -> list:
+        """지난 실행에서 재시도까지 실패해 수집 기록이 없는 에피소드 URL (target_url 의 도메인으로)"""
+        try:
+            return [_rebase(url, target_url) for url in db.get_failed_job_episodes(target_url) if not db.is_url_crawled(url)]
+        except Exception as e:
+            logger.warning(f"Failed to read job journal: {e}")
+            return []
+
+    def finish(self, job: SeriesJob):
+        """
+        작업을 닫습니다. 실패한 에피소드가 있으면 그 행만 남겨, 증분 목록 확인이 거기까지 내려가지 않아도
+        다음 실행에서 다시 큐에 넣습니다 (같은 URL 의 새 작업을 열면 대체됨).
+        """
+        if job and job.journal_id:
+            try:
+                if job.failed:
+                    db.keep_failed_job_episodes(job.journal_id)
+                else:
+                    db.delete_crawl_job(job.journal_id)
+            except Exception as e:
+                logger.warning(f"Failed to close job journal: {e}")
+            job.journal_id = None
+
+    @staticmethod
+    def _move(job_id: int, journaled_url: str, target_url: str, list_url: str, referer: str):
+        """미러 도메인이 바뀐 작업: 저널의 주소들을 새 도메인으로 옮기고 (list_url, referer) 를 반환합니다."""
+        list_url, referer = _rebase(list_url, target_url), _rebase(referer, target_url)
+        episode_urls = {url: _rebase(url, target_url) for url in db.get_job_episode_urls(job_id)}
+        db.move_crawl_job(job_id, target_url, list_url, referer, episode_urls)
+        logger.info(f"Job journal moved from {_origin(journaled_url)} to {_origin(target_url)}")
+        return list_url, referer
+
+    @staticmethod
+    def _update(task: EpisodeTask, phase: str, **fields):
+        if not task.job or not task.job.journal_id:
+            return
+        try:
+            db.update_job_episode(task.job.journal_id, task.url, phase, **fields)
+        except Exception as e:
+            logger.warning(f"Failed to update job journal for {task.url}: {e}")
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url or "")
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _rebase(url: str, target_url: str) -> str:
+    """url 의 scheme/도메인을 target_url 의 것으로 바꿉니다 (경로/쿼리는 그대로)."""
+    parsed = urlparse(url or "")
+    if not parsed.netloc:
+        return url
+    target = urlparse(target_url)
+    return parsed._replace(scheme=target.scheme, netloc=target.netloc).geturl()
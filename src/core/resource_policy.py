@@ -0,0 +1,57 @@
+import re
+from fnmatch import fnmatch
+
+from utils.logger import logger
+
+# 워커 탭에서 막을 리소스 (Chrome Network.setBlockedURLs 의 * 와일드카드 패턴)
+# Images (실제 이미지는 ImageDownloader 가 받으므로 탭에서는 DOM 속성만 필요)
+IMAGE_PATTERNS = [
+    "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.png", "*.png?*", "*.gif", "*.gif?*",
+    "*.webp", "*.webp?*", "*.svg", "*.ico", "*.bmp",
+]
+DEFAULT_BLOCKED_PATTERNS = IMAGE_PATTERNS + [
+    # Fonts
+    "*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.otf", "*.eot",
+    # Media
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    # Ads / Trackers
+    "*googlesyndication.com*", "*doubleclick.net*", "*googleadservices.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*adservice.google.*",
+    "*facebook.net*", "*criteo.*", "*taboola.com*", "*outbrain.com*", "*exosrv.com*",
+]
+
+# 어떤 패턴으로도 막으면 안 되는 요청 (캡챠 이미지가 막히면 자동/수동 해결이 불가능)
+ALWAYS_ALLOWED_SAMPLES = [
+    "https://manatoki.net/plugin/kcaptcha/kcaptcha_image.php",
+    "https://manatoki.net/plugin/kcaptcha/kcaptcha_image.php?t=0",
+]
+
+
+class ResourcePolicy:
+    """워커 탭에서 이미지/폰트/미디어/광고 요청을 차단하는 정책 (DOM 속성은 그대로 남습니다)"""
+
+    def __init__(self, patterns: list = None, extra_patterns: list = None):
+        patterns = list(DEFAULT_BLOCKED_PATTERNS if patterns is None else patterns)
+        patterns += [p for p in (extra_patterns or []) if p not in patterns]
+        self.patterns = [p for p in patterns if not self._blocks_allowed(p)]
+        dropped = set(patterns) - set(self.patterns)
+        if dropped:
+            logger.warning(f"Ignoring block patterns that would block the captcha: {sorted(dropped)}")
+
+    def allow_images(self) -> 'ResourcePolicy':
+        """이미지 패턴을 뺀 정책 (브라우저가 받은 이미지를 회수하는 모드에서 사용)"""
+        return ResourcePolicy(patterns=[p for p in self.patterns if p not in IMAGE_PATTERNS])
+
+    @staticmethod
+    def parse_patterns(text: str) -> list:
+        """설정에 저장된 패턴 문자열 (쉼표/줄바꿈 구분) → 리스트"""
+        return [p.strip() for p in re.split(r'[,\n]', text or "") if p.strip()]
+
+    @staticmethod
+    def _blocks_allowed(pattern: str) -> bool:
+        return any(fnmatch(url, pattern) for url in ALWAYS_ALLOWED_SAMPLES)
+
+    def apply(self, driver):
+        """현재 탭(CDP 타깃)에 차단 목록을 적용합니다. Assumes LOCK is HELD."""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
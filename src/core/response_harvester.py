@@ -0,0 +1,83 @@
+import os
+import json
+import base64
+import threading
+from collections import OrderedDict
+
+from utils.logger import logger
+
+# 수집 중인 응답 메타데이터의 최대 개수 (썸네일/광고 등 회수되지 않는 항목이 무한히 쌓이지 않도록)
+MAX_TRACKED_RESPONSES = 5000
+
+
+class ResponseHarvester:
+    """
+    브라우저가 페이지를 그리면서 이미 받은 이미지 응답을 CDP(Network.getResponseBody)로 꺼내
+    에피소드 폴더에 바로 저장합니다. 같은 이미지를 requests 로 다시 받지 않아도 됩니다.
+
+    드라이버는 performance 로그(log_cdp_events)를 켠 상태로 생성되어야 합니다.
+    performance 로그는 세션(모든 탭) 공용 버퍼이므로 읽은 이벤트를 URL 기준으로 공유 보관합니다.
+    """
+
+    def __init__(self):
+        self._responses = OrderedDict()  # url -> requestId
+        self._finished = set()  # loadingFinished 가 온 requestId
+        self._lock = threading.Lock()
+
+    def collect(self, driver):
+        """Assumes LOCK is HELD. 쌓인 performance 로그를 읽어 이미지 응답을 기록합니다."""
+        for entry in driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            with self._lock:
+                if method == "Network.responseReceived":
+                    response = params.get("response", {})
+                    if params.get("type") == "Image" or response.get("mimeType", "").startswith("image/"):
+                        self._responses[response.get("url")] = params.get("requestId")
+                        while len(self._responses) > MAX_TRACKED_RESPONSES:
+                            _, stale_id = self._responses.popitem(last=False)
+                            self._finished.discard(stale_id)
+                elif method == "Network.loadingFinished":
+                    self._finished.add(params.get("requestId"))
+
+    def harvest(self, session, images: list, download_dir: str) -> list:
+        """
+        브라우저가 받아 둔 이미지를 저장하고, 회수하지 못한 이미지 목록을 반환합니다.
+        session: 이미지를 불러온 탭으로 전환한 드라이버를 넘겨주는 컨텍스트 매니저 팩토리 (BrowserSlot.session).
+        탭 모드의 공유 락을 이미지 하나의 CDP 호출 동안만 잡으므로, 회수 중에도 다른 탭이 번갈아 동작합니다.
+        """
+        with session() as driver:
+            self.collect(driver)
+        remaining = []
+        for image_item in images:
+            with self._lock:
+                request_id = self._responses.get(image_item.url)
+                finished = request_id in self._finished
+            if not request_id or not finished:
+                remaining.append(image_item)
+                continue
+            try:
+                with session() as driver:
+                    result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                body = result.get("body", "")
+                data = base64.b64decode(body) if result.get("base64Encoded") else body.encode("latin-1")
+                if not data:
+                    raise ValueError("empty body")
+                os.makedirs(download_dir, exist_ok=True)
+                filepath = os.path.join(download_dir, image_item.filename)
+                with open(filepath + ".part", 'wb') as f:
+                    f.write(data)
+                os.replace(filepath + ".part", filepath)
+            except Exception as e:
+                logger.debug(f"Harvest failed for {image_item.url}: {e}")
+                remaining.append(image_item)
+                continue
+            finally:
+                with self._lock:
+                    self._responses.pop(image_item.url, None)
+                    self._finished.discard(request_id)
+        return remaining
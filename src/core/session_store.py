@@ -0,0 +1,76 @@
+import os
+import json
+import time
+import threading
+
+from utils.logger import logger
+
+# CDP Network.setCookies 가 받는 필드 (Network.getAllCookies 결과에는 size/priority 등이 더 있음)
+CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+def cdp_cookie_params(cookies: list) -> list:
+    """Network.getAllCookies 결과를 Network.setCookies 인자 형식으로 변환"""
+    payload = []
+    for cookie in cookies:
+        item = {k: cookie[k] for k in CDP_COOKIE_FIELDS if k in cookie}
+        if item.get("expires", -1) <= 0:
+            item.pop("expires", None)
+        payload.append(item)
+    return payload
+
+
+class SessionStore:
+    """
+    사이트별 브라우저 프로필 디렉터리와 직렬화된 쿠키 저장소.
+    캡챠를 통과한 세션 쿠키를 다음 실행에서도 재사용해 첫 목록 페이지의 캡챠를 피합니다.
+    """
+
+    def __init__(self, root_dir: str, site: str):
+        self.site_dir = os.path.join(root_dir, site)
+        self.cookie_path = os.path.join(self.site_dir, "cookies.json")
+        self._lock = threading.Lock()
+
+    def profile_dir(self, name: str) -> str:
+        """브라우저마다 별도의 user-data-dir (Chrome 은 같은 프로필을 동시에 열 수 없음)"""
+        path = os.path.join(self.site_dir, f"profile-{name}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def load_cookies(self) -> list:
+        with self._lock:
+            if not os.path.exists(self.cookie_path):
+                return []
+            try:
+                with open(self.cookie_path, 'r', encoding='utf-8') as f:
+                    cookies = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read cookie store: {e}")
+                return []
+        now = time.time()
+        # expires <= 0 은 세션 쿠키 (캡챠 통과 표시가 보통 여기에 해당하므로 유지)
+        return [c for c in cookies if not (c.get("expires", -1) > 0 and c["expires"] < now)]
+
+    def save_cookies(self, cookies: list):
+        if not cookies:
+            return
+        os.makedirs(self.site_dir, exist_ok=True)
+        with self._lock:
+            tmp_path = self.cookie_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cookies, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cookie_path)
+
+    def restore(self, driver) -> int:
+        """저장된 쿠키를 브라우저 전체에 주입합니다 (CDP 는 현재 도메인과 무관하게 설정 가능)."""
+        cookies = self.load_cookies()
+        if not cookies:
+            return 0
+        payload = cdp_cookie_params(cookies)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": payload})
+        return len(payload)
+
+    def capture(self, driver):
+        """브라우저의 모든 쿠키를 저장합니다. Assumes LOCK is HELD."""
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        self.save_cookies(cookies)
@@ -0,0 +1,122 @@
+import time
+import statistics
+import threading
+from datetime import datetime, timezone
+
+from utils.logger import logger
+from data.db_repository import db
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# 한 번에 몰아서 받은 에피소드(백필)는 하나의 "업데이트"로 봅니다.
+UPDATE_CLUSTER_GAP = 6 * HOUR
+# 기록이 부족한 시리즈는 주간 연재로 가정
+DEFAULT_CADENCE = 7 * DAY
+MIN_CADENCE = DAY
+MAX_CADENCE = 60 * DAY
+# 주기의 몇 배 동안 새 화가 없으면 휴재/완결로 보고 확인 간격을 늘립니다.
+DORMANT_FACTOR = 3
+# 연재 주기 안에 몇 번 확인할지 (2 = 주기의 절반마다)
+CHECKS_PER_CADENCE = 2
+
+DEFAULT_LIST_BUDGET = 20  # 시간당 목록 페이지 확인 수
+DEFAULT_TICK_INTERVAL = 5 * 60
+
+
+def parse_db_timestamp(value: str):
+    """SQLite CURRENT_TIMESTAMP (UTC, 'YYYY-MM-DD HH:MM:SS') → epoch 초"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:19], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def estimate_cadence(crawl_times: list, now: float) -> float:
+    """
+    에피소드 수집 시각들로 연재 주기(초)를 추정합니다.
+    가까운 수집은 하나의 업데이트로 묶고, 업데이트 간격의 중앙값을 주기로 씁니다.
+    """
+    events = []
+    for t in sorted(crawl_times):
+        if not events or t - events[-1] > UPDATE_CLUSTER_GAP:
+            events.append(t)
+    if len(events) < 2:
+        cadence = DEFAULT_CADENCE
+    else:
+        cadence = statistics.median(b - a for a, b in zip(events, events[1:]))
+    cadence = min(max(cadence, MIN_CADENCE), MAX_CADENCE)
+    if events and now - events[-1] > cadence * DORMANT_FACTOR:
+        # 오래 조용한 시리즈: 마지막 업데이트 이후 경과 시간만큼 간격을 늘림
+        cadence = min(now - events[-1], MAX_CADENCE)
+    return cadence
+
+
+class UpdateScheduler:
+    """
+    팔로우 중인 시리즈(crawled_urls 가 있는 mana_lists)를 추정 연재 주기에 따라 주기적으로 다시 확인합니다.
+
+    - 확인 간격 = 주기 / CHECKS_PER_CADENCE. 간격 대비 가장 오래 밀린 시리즈부터 확인합니다.
+    - 목록 페이지 확인은 시간당 list_budget 회로 제한합니다 (mana_lists.last_checked_at 기준, 수동 크롤링 포함).
+    - runner(urls) 는 start_batch 를 실행하고 끝날 때까지 블록해야 하며, is_busy() 가 True 면 이번 차례를 건너뜁니다.
+    """
+
+    def __init__(self, runner, is_busy=None, list_budget: int = DEFAULT_LIST_BUDGET, interval: float = DEFAULT_TICK_INTERVAL):
+        self.runner = runner
+        self.is_busy = is_busy or (lambda: False)
+        self.list_budget = max(1, list_budget)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def due_series(self, now: float = None) -> list:
+        """확인할 차례인 시리즈 URL (우선순위 순, 남은 예산만큼)"""
+        now = now or time.time()
+        remaining = self.list_budget - db.count_lists_checked_since(now - HOUR)
+        if remaining <= 0:
+            return []
+        candidates = []
+        for list_url, title, last_checked, crawl_times in db.get_followed_series():
+            times = [t for t in (parse_db_timestamp(v) for v in crawl_times) if t]
+            cadence = estimate_cadence(times, now)
+            checked_at = parse_db_timestamp(last_checked) or (max(times) if times else 0)
+            overdue = (now - checked_at) / (cadence / CHECKS_PER_CADENCE)
+            if overdue >= 1:
+                candidates.append((overdue, list_url, title, cadence))
+        candidates.sort(reverse=True)
+        for overdue, list_url, title, cadence in candidates[:remaining]:
+            logger.debug(f"Scheduler: {title} (cadence {cadence / DAY:.1f}d, overdue x{overdue:.1f})")
+        return [list_url for _, list_url, _, _ in candidates[:remaining]]
+
+    def run_once(self) -> int:
+        if self.is_busy():
+            return 0
+        urls = self.due_series()
+        if not urls:
+            return 0
+        logger.info(f"Scheduler: checking {len(urls)} series for new episodes.")
+        for url in urls:
+            db.mark_list_checked(url)
+        self.runner(urls)
+        return len(urls)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        logger.info(f"Update scheduler started (budget {self.list_budget} lists/hour).")
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Update scheduler error: {e}")
+            self._stop_event.wait(self.interval)
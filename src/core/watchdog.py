@@ -0,0 +1,115 @@
+import time
+import threading
+
+from utils.logger import logger
+
+# 단계 이름
+PHASE_NAVIGATE = "navigate"
+PHASE_LOAD = "load"
+PHASE_CAPTCHA = "captcha"
+PHASE_SCROLL = "scroll"
+PHASE_PARSE = "parse"
+PHASE_DOWNLOAD = "download"
+
+# 단계별 기한(초). None 이면 감시하지 않습니다 (예: 사람이 푸는 캡챠).
+DEFAULT_DEADLINES = {
+    PHASE_NAVIGATE: 30,
+    PHASE_LOAD: 60,
+    PHASE_CAPTCHA: 180,
+    PHASE_SCROLL: 120,
+    PHASE_PARSE: 45,
+    PHASE_DOWNLOAD: 600,
+}
+
+# 처리기가 "아직 멈춘 게 아니다"라고 판단하면 이만큼 뒤에 다시 확인
+REARM_DELAY = 10
+CHECK_INTERVAL = 1.0
+
+
+class AnyEvent:
+    """여러 Event 중 하나라도 set 되면 set 으로 보이는 읽기 전용 이벤트 (엔진 중지 + 작업 취소)"""
+
+    def __init__(self, *events):
+        self.events = events
+
+    def is_set(self) -> bool:
+        return any(event.is_set() for event in self.events)
+
+
+class Watchdog:
+    """
+    워커/다운로더가 지금 어느 단계(이동/로드/캡챠/스크롤/파싱/다운로드)에 있는지 기록하고,
+    단계 기한을 넘긴 작업을 on_expired(key, phase, context) 로 알립니다 (감시 스레드에서 호출).
+
+    on_expired 가 True 를 반환하면 처리된 것으로 보고 fired(key) 로 한 번 알려 줍니다.
+    False 면 (예: 공유 락을 기다리는 중일 뿐) REARM_DELAY 뒤에 다시 확인합니다.
+    """
+
+    def __init__(self, on_expired, deadlines: dict = None, interval: float = CHECK_INTERVAL):
+        self.on_expired = on_expired
+        self.deadlines = dict(DEFAULT_DEADLINES, **(deadlines or {}))
+        self.interval = interval
+        self._active = {}  # key -> [phase, deadline, context]
+        self._fired = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def enter(self, key, phase: str, context=None):
+        """key 의 현재 단계를 바꾸고 기한을 새로 잽니다."""
+        limit = self.deadlines.get(phase)
+        with self._lock:
+            if limit is None:
+                self._active.pop(key, None)
+            else:
+                self._active[key] = [phase, time.time() + limit, context]
+
+    def leave(self, key):
+        with self._lock:
+            self._active.pop(key, None)
+
+    def fired(self, key) -> bool:
+        """key 가 기한 초과로 처리되었는지 (확인하면 지워짐)"""
+        with self._lock:
+            if key in self._fired:
+                self._fired.discard(key)
+                return True
+            return False
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        with self._lock:
+            self._active.clear()
+            self._fired.clear()
+
+    def check(self, now: float = None):
+        now = now or time.time()
+        with self._lock:
+            expired = [(key, entry) for key, entry in self._active.items() if entry[1] <= now]
+        for key, (phase, _, context) in expired:
+            try:
+                handled = self.on_expired(key, phase, context)
+            except Exception as e:
+                logger.error(f"Watchdog handler failed for {key} ({phase}): {e}")
+                handled = False
+            with self._lock:
+                entry = self._active.get(key)
+                same_phase = entry is not None and entry[0] == phase
+                if handled:
+                    # 탭/브라우저를 이미 정리했으므로 그 사이 단계가 바뀌었어도 알려야 합니다.
+                    self._fired.add(key)
+                    if same_phase:
+                        self._active.pop(key)
+                elif same_phase:
+                    entry[1] = now + REARM_DELAY
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.check()
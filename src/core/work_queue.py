@@ -0,0 +1,133 @@
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+# 시리즈 안의 에피소드 처리 순서
+ORDER_NEWEST = "newest"  # 최신 화부터 (목록 순서 그대로)
+ORDER_OLDEST = "oldest"  # 1화부터
+ORDER_LATEST_FIRST = "latest"  # 최신 N화를 먼저 받고, 나머지는 1화부터 채움
+QUEUE_ORDERS = (ORDER_NEWEST, ORDER_OLDEST, ORDER_LATEST_FIRST)
+DEFAULT_LATEST_COUNT = 3
+
+# 큐 우선순위 (작을수록 먼저). 같은 우선순위는 넣은 순서대로.
+PRIORITY_URGENT = 0  # "지금 받기" 로 끼워 넣은 시리즈
+PRIORITY_NORMAL = 1
+PRIORITY_BACKFILL = 2  # ORDER_LATEST_FIRST 의 나머지 화 (배치 전체에서 모든 시리즈의 최신 화 뒤로)
+
+
+@dataclass
+class SeriesJob:
+    """시리즈(목록 페이지) 단위 상태. 에피소드 작업들이 공유하며 엔진의 가변 상태를 대신합니다."""
+    target_url: str
+    list_url: str
+    list_title: str
+    download_path: str
+    referer: str
+    journal_id: Optional[int] = None  # 작업 저널(crawl_jobs) id
+    fingerprint: Optional[str] = None  # 목록 지문 (시리즈를 빠짐없이 끝냈을 때만 저장)
+    failed: int = 0  # 재시도까지 실패한 에피소드 수
+
+
+@dataclass
+class EpisodeTask:
+    url: str
+    job: Optional[SeriesJob] = None
+    attempts: int = 0
+    # 이전 실행에서 이미 파싱된 에피소드 (저널에서 복원): 브라우저 단계를 건너뛰고 바로 다운로드
+    title: str = ""
+    images: Optional[list] = None
+    priority: int = PRIORITY_NORMAL
+    error: str = ""  # 마지막 실패 종류 (core.concurrency.FAILURE_*)
+    deferrals: int = 0  # 실행 끝의 재시도 단계로 미뤄진 횟수
+
+
+@dataclass
+class EpisodeDownload:
+    """브라우저 단계(이동/스크롤/파싱)를 마치고 다운로드 단계로 넘겨지는 에피소드"""
+    task: EpisodeTask
+    title: str
+    images: list = field(default_factory=list)
+    harvested: int = 0  # 브라우저에서 이미 회수해 저장한 이미지 수 (images 에는 남은 것만)
+    parsed: list = field(default_factory=list)  # 회수한 것을 포함한 전체 이미지 (재시도 단계에 넘김)
+    stalls: int = 0  # 다운로드 단계 기한을 넘겨 남은 이미지를 다시 넣은 횟수
+
+
+def order_episodes(urls: list, order: str = ORDER_NEWEST, latest_count: int = DEFAULT_LATEST_COUNT) -> list:
+    """최신 화부터 정렬된 목록(urls)을 정책에 맞게 (url, priority) 목록으로 바꿉니다."""
+    if order == ORDER_OLDEST:
+        return [(url, PRIORITY_NORMAL) for url in reversed(urls)]
+    if order == ORDER_LATEST_FIRST:
+        latest, backfill = urls[:latest_count], urls[latest_count:]
+        return [(url, PRIORITY_NORMAL) for url in latest] + [(url, PRIORITY_BACKFILL) for url in reversed(backfill)]
+    return [(url, PRIORITY_NORMAL) for url in urls]
+
+
+class EpisodeQueue:
+    """
+    워커들이 공유하는 스레드 안전 에피소드 작업 큐.
+    작업의 priority 가 작은 것부터, 같은 우선순위는 넣은 순서대로 꺼냅니다.
+
+    미리 워커별로 나눠 주는 대신 놀고 있는 워커가 다음 작업을 가져가므로,
+    한 워커가 캡챠나 긴 에피소드에 묶여도 나머지 작업은 다른 워커들이 처리합니다.
+    실패한 작업은 max_retries 까지 같은 우선순위의 맨 뒤로 다시 들어갑니다.
+
+    closed=False 로 만들면 생산자(배치의 목록 수집)가 close() 를 호출할 때까지
+    큐가 비어도 워커들이 종료하지 않고 새 작업을 기다립니다.
+    """
+
+    def __init__(self, tasks=(), max_retries: int = 2, closed: bool = True):
+        self.max_retries = max_retries
+        self._seq = itertools.count()
+        self._items = [(task.priority, next(self._seq), task) for task in tasks]
+        heapq.heapify(self._items)
+        self._in_flight = 0
+        self._closed = closed
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._items)
+
+    def put(self, task: EpisodeTask):
+        with self._cond:
+            heapq.heappush(self._items, (task.priority, next(self._seq), task))
+            self._cond.notify()
+
+    def idle(self) -> bool:
+        """남은 작업도 처리 중인 작업도 없는지"""
+        with self._cond:
+            return not self._items and self._in_flight == 0
+
+    def get(self, stop_event: threading.Event = None) -> Optional[EpisodeTask]:
+        """
+        다음 작업을 꺼냅니다. 큐가 비었어도 처리 중인 작업이 재시도로 돌아올 수 있으므로
+        in-flight 작업이 모두 끝날 때까지 기다렸다가, 더 이상 할 일이 없으면 None 을 반환합니다.
+        """
+        with self._cond:
+            while not self._items:
+                if (self._closed and self._in_flight == 0) or (stop_event and stop_event.is_set()):
+                    return None
+                self._cond.wait(timeout=0.5)
+            self._in_flight += 1
+            return heapq.heappop(self._items)[2]
+
+    def retry(self, task: EpisodeTask) -> bool:
+        """재시도 횟수가 남아 있으면 작업을 다시 넣고 True 를 반환합니다."""
+        task.attempts += 1
+        if task.attempts > self.max_retries:
+            return False
+        self.put(task)
+        return True
+
+    def close(self):
+        """더 이상 생산자가 작업을 넣지 않음을 알립니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def task_done(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
@@ -1,12 +1,37 @@
 import os
+import re
 import sqlite3
 from contextlib import contextmanager
 from typing import Optional, List
+from urllib.parse import urlparse, parse_qsl, urlencode
 from utils.config import config_manager
 from utils.logger import logger
 
 DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawled_pages.db')
 
+
+def url_key(url: str) -> str:
+    """
+    도메인이 바뀌어도 같은 에피소드/목록을 가리키는 키.
+    마나토끼는 숫자 도메인(manatoki468.net 등)이 자주 바뀌므로 호스트의 숫자와 TLD 를 떼고 경로만 남깁니다.
+    경로가 숫자 ID 로 끝나면 쿼리(spage 등)는 무시합니다.
+      https://manatoki468.net/comic/123?spage=1 -> manatoki/comic/123
+    """
+    url = (url or "").strip()
+    parsed = urlparse(url)
+    if not parsed.netloc:
+        return url
+    host = parsed.hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    site = re.sub(r"\d+$", "", host.split(".")[0]) or host
+    path = parsed.path.rstrip("/") or "/"
+    key = f"{site}{path}"
+    if parsed.query and not re.search(r"/\d+$", path):
+        key += "?" + urlencode(sorted(parse_qsl(parsed.query)))
+    return key
+
+
 class DBRepository:
     def __init__(self, db_path=DB_FILE):
         self.db_path = db_path
@@ -65,6 +90,33 @@ class DBRepository:
                     value TEXT
                 )
             """)
+            # 작업 저널: 중단된 크롤링을 목록 재수집 없이 이어서 하기 위한 큐/단계 기록
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    target_url TEXT NOT NULL UNIQUE,
+                    list_url TEXT,
+                    list_title TEXT,
+                    download_path TEXT,
+                    referer TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS job_episodes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    position INTEGER,
+                    phase TEXT DEFAULT 'queued',
+                    page_title TEXT,
+                    images TEXT,
+                    attempts INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (job_id, url),
+                    FOREIGN KEY (job_id) REFERENCES crawl_jobs(id) ON DELETE CASCADE
+                )
+            """)
             conn.commit()
         finally:
             conn.close()
@@ -107,12 +159,47 @@ class DBRepository:
                 conn.commit()
             except sqlite3.OperationalError:
                 pass
+            try:
+                # 업데이트 스케줄러가 마지막으로 목록을 확인한 시각
+                cursor.execute("ALTER TABLE mana_lists ADD COLUMN last_checked_at TIMESTAMP")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            try:
+                # 마지막으로 전부 수집한 목록의 지문 (같으면 에피소드별 확인 생략)
+                cursor.execute("ALTER TABLE mana_lists ADD COLUMN list_fingerprint TEXT")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            try:
+                # 도메인과 무관한 키 (url_key)
+                cursor.execute("ALTER TABLE crawled_urls ADD COLUMN url_key TEXT")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            try:
+                cursor.execute("ALTER TABLE mana_lists ADD COLUMN list_key TEXT")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            try:
+                # 1 = 끝났지만 실패한 에피소드(phase='failed')만 남겨 둔 작업 (이어서 할 작업이 아니라 다음 실행의 재시도 대상)
+                cursor.execute("ALTER TABLE crawl_jobs ADD COLUMN completed INTEGER DEFAULT 0")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            try:
+                # 도메인과 무관한 작업 키 (url_key(target_url)): 미러 도메인이 바뀌어도 같은 작업을 이어 갑니다.
+                cursor.execute("ALTER TABLE crawl_jobs ADD COLUMN target_key TEXT")
+                conn.commit()
+            except sqlite3.OperationalError:
+                pass
             try:
                 cursor.execute("""
                     INSERT OR IGNORE INTO mana_lists (mana_list_url)
                     SELECT DISTINCT list_url
                     FROM crawled_urls
-                    WHERE list_url IS NOT NULL AND list_url != ''
+                    WHERE mana_list_id IS NULL AND list_url IS NOT NULL AND list_url != ''
                 """)
                 cursor.execute("""
                     UPDATE crawled_urls
@@ -124,9 +211,47 @@ class DBRepository:
                 conn.commit()
             except sqlite3.OperationalError:
                 pass
+            # 키가 없는 기존 행을 채우고, 도메인만 다른 같은 시리즈를 하나로 합칩니다 (한 번만 실제로 동작).
+            conn.create_function("url_key", 1, url_key)
+            cursor.execute("UPDATE crawled_urls SET url_key = url_key(url) WHERE url_key IS NULL")
+            cursor.execute("UPDATE mana_lists SET list_key = url_key(mana_list_url) WHERE list_key IS NULL")
+            cursor.execute("UPDATE crawl_jobs SET target_key = url_key(target_url) WHERE target_key IS NULL")
+            self._merge_duplicate_lists(cursor)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawled_urls_url_key ON crawled_urls (url_key)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mana_lists_list_key ON mana_lists (list_key)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_target_key ON crawl_jobs (target_key)")
+            conn.commit()
         finally:
             conn.close()
 
+    @staticmethod
+    def _merge_duplicate_lists(cursor):
+        """
+        같은 list_key 의 mana_lists 행들을 가장 최근(마지막 도메인) 행 하나로 합치고
+        crawled_urls 가 그 행을 가리키도록 바꿉니다.
+        """
+        cursor.execute("SELECT list_key FROM mana_lists WHERE list_key IS NOT NULL GROUP BY list_key HAVING COUNT(*) > 1")
+        for (key,) in cursor.fetchall():
+            cursor.execute(
+                "SELECT id, mana_title, local_store_path, last_checked_at FROM mana_lists WHERE list_key = ? ORDER BY id DESC",
+                (key,)
+            )
+            rows = cursor.fetchall()
+            keep_id = rows[0][0]
+            other_ids = [row[0] for row in rows[1:]]
+            title = next((row[1] for row in rows if row[1]), None)
+            store_path = next((row[2] for row in rows if row[2]), None)
+            checked = max((row[3] for row in rows if row[3]), default=None)
+            placeholders = ','.join('?' for _ in other_ids)
+            cursor.execute(f"UPDATE crawled_urls SET mana_list_id = ? WHERE mana_list_id IN ({placeholders})", [keep_id] + other_ids)
+            cursor.execute(f"DELETE FROM mana_lists WHERE id IN ({placeholders})", other_ids)
+            # 합친 목록은 지문을 다시 계산하도록 초기화
+            cursor.execute(
+                "UPDATE mana_lists SET mana_title = ?, local_store_path = ?, last_checked_at = ?, list_fingerprint = NULL WHERE id = ?",
+                (title, store_path, checked, keep_id)
+            )
+            logger.info(f"DB: merged {len(rows)} list entries for {key} (domain changes)")
+
     def get_config(self, key: str) -> Optional[str]:
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -173,9 +298,10 @@ class DBRepository:
             conn.close()
 
     def is_url_crawled(self, url: str) -> bool:
+        """도메인이 달라도 같은 에피소드(url_key)면 수집한 것으로 봅니다."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM crawled_urls WHERE url = ?", (url,))
+            cursor.execute("SELECT 1 FROM crawled_urls WHERE url_key = ?", (url_key(url),))
             return cursor.fetchone() is not None
 
     def _get_or_create_mana_list(
@@ -188,24 +314,31 @@ class DBRepository:
             return None
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "INSERT OR IGNORE INTO mana_lists (mana_list_url, mana_title, local_store_path) VALUES (?, ?, ?)",
-                (mana_list_url, mana_title, local_store_path)
-            )
+            cursor.execute("SELECT id, mana_list_url FROM mana_lists WHERE list_key = ?", (url_key(mana_list_url),))
+            row = cursor.fetchone()
+            if row:
+                list_id = row[0]
+                if row[1] != mana_list_url:
+                    # 도메인이 바뀐 경우: 같은 행을 새 주소로 갱신
+                    cursor.execute("UPDATE mana_lists SET mana_list_url = ? WHERE id = ?", (mana_list_url, list_id))
+            else:
+                cursor.execute(
+                    "INSERT INTO mana_lists (mana_list_url, list_key, mana_title, local_store_path) VALUES (?, ?, ?, ?)",
+                    (mana_list_url, url_key(mana_list_url), mana_title, local_store_path)
+                )
+                list_id = cursor.lastrowid
             if mana_title:
                 cursor.execute(
-                    "UPDATE mana_lists SET mana_title = ? WHERE mana_list_url = ? AND (mana_title IS NULL OR mana_title != ?)",
-                    (mana_title, mana_list_url, mana_title)
+                    "UPDATE mana_lists SET mana_title = ? WHERE id = ? AND (mana_title IS NULL OR mana_title != ?)",
+                    (mana_title, list_id, mana_title)
                 )
             if local_store_path:
                 cursor.execute(
-                    "UPDATE mana_lists SET local_store_path = ? WHERE mana_list_url = ? AND (local_store_path IS NULL OR local_store_path != ?)",
-                    (local_store_path, mana_list_url, local_store_path)
+                    "UPDATE mana_lists SET local_store_path = ? WHERE id = ? AND (local_store_path IS NULL OR local_store_path != ?)",
+                    (local_store_path, list_id, local_store_path)
                 )
             conn.commit()
-            cursor.execute("SELECT id FROM mana_lists WHERE mana_list_url = ?", (mana_list_url,))
-            row = cursor.fetchone()
-            return row[0] if row else None
+            return list_id
 
     def add_crawled_url(
         self,
@@ -218,10 +351,15 @@ class DBRepository:
         mana_list_id = self._get_or_create_mana_list(list_url, list_title, local_store_path)
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            key = url_key(url)
+            cursor.execute("SELECT 1 FROM crawled_urls WHERE url_key = ?", (key,))
+            if cursor.fetchone():
+                logger.debug(f"DB Duplicate ignored (same episode on another domain): {url}")
+                return
             try:
                 cursor.execute(
-                    "INSERT INTO crawled_urls (url, page_title, list_url, mana_list_id) VALUES (?, ?, ?, ?)",
-                    (url, page_title, list_url, mana_list_id)
+                    "INSERT INTO crawled_urls (url, url_key, page_title, list_url, mana_list_id) VALUES (?, ?, ?, ?, ?)",
+                    (url, key, page_title, list_url, mana_list_id)
                 )
                 conn.commit()
                 # logger.debug(f"DB Saved: {url}")
@@ -234,12 +372,122 @@ class DBRepository:
     def upsert_mana_list(self, mana_list_url: str, mana_title: str = None, local_store_path: str = None):
         self._get_or_create_mana_list(mana_list_url, mana_title, local_store_path)
 
+    # --- Job Journal ---
+
+    def save_crawl_job(self, target_url: str, list_url: str, list_title: str, download_path: str, referer: str,
+                       episode_urls: List[str]) -> int:
+        """시리즈 작업과 에피소드 큐를 저널에 기록합니다 (도메인만 다른 것을 포함해 같은 작업의 이전 기록은 대체)."""
+        key = url_key(target_url)
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM crawl_jobs WHERE target_key = ? OR target_url = ?", (key, target_url))
+            cursor.execute(
+                "INSERT INTO crawl_jobs (target_url, target_key, list_url, list_title, download_path, referer) VALUES (?, ?, ?, ?, ?, ?)",
+                (target_url, key, list_url, list_title, download_path, referer)
+            )
+            job_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT OR IGNORE INTO job_episodes (job_id, url, position) VALUES (?, ?, ?)",
+                [(job_id, url, i) for i, url in enumerate(episode_urls)]
+            )
+            conn.commit()
+            return job_id
+
+    def get_crawl_job(self, target_url: str) -> Optional[tuple]:
+        """
+        끝나지 않은 작업 (도메인만 다른 것 포함): (id, list_url, list_title, download_path, referer, 기록된 target_url) 또는 None
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, list_url, list_title, download_path, referer, target_url FROM crawl_jobs "
+                "WHERE target_key = ? AND completed = 0",
+                (url_key(target_url),)
+            )
+            return cursor.fetchone()
+
+    def move_crawl_job(self, job_id: int, target_url: str, list_url: str, referer: str, episode_urls: dict):
+        """미러 도메인이 바뀐 작업의 주소들을 새 도메인으로 옮깁니다. episode_urls: 기존 URL -> 새 URL"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE crawl_jobs SET target_url = ?, list_url = ?, referer = ? WHERE id = ?",
+                           (target_url, list_url, referer, job_id))
+            cursor.executemany("UPDATE job_episodes SET url = ? WHERE job_id = ? AND url = ?",
+                               [(new, job_id, old) for old, new in episode_urls.items()])
+            conn.commit()
+
+    def get_crawl_job_urls(self) -> List[str]:
+        """끝나지 않은 작업들의 target_url (오래된 순)"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT target_url FROM crawl_jobs WHERE completed = 0 ORDER BY created_at, id")
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_pending_job_episodes(self, job_id: int) -> List[tuple]:
+        """완료되지 않은 에피소드: (url, phase, page_title, images_json, attempts), 큐 순서대로"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT url, phase, page_title, images, attempts FROM job_episodes "
+                "WHERE job_id = ? AND phase != 'done' ORDER BY position",
+                (job_id,)
+            )
+            return cursor.fetchall()
+
+    def get_job_episode_urls(self, job_id: int) -> List[str]:
+        """작업의 모든 에피소드 URL (완료 포함), 저널에 기록한 순서대로"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT url FROM job_episodes WHERE job_id = ? ORDER BY position", (job_id,))
+            return [row[0] for row in cursor.fetchall()]
+
+    def update_job_episode(self, job_id: int, url: str, phase: str, page_title: str = None, images: str = None,
+                           attempts: int = None):
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE job_episodes SET phase = ?, page_title = COALESCE(?, page_title), images = COALESCE(?, images), "
+                "attempts = COALESCE(?, attempts), updated_at = CURRENT_TIMESTAMP WHERE job_id = ? AND url = ?",
+                (phase, page_title, images, attempts, job_id, url)
+            )
+            conn.commit()
+
+    def keep_failed_job_episodes(self, job_id: int):
+        """작업을 끝내되 재시도까지 실패한 에피소드만 남깁니다 (get_failed_job_episodes 로 다음 실행에서 다시 큐에 넣음)."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM job_episodes WHERE job_id = ? AND phase != 'failed'", (job_id,))
+            cursor.execute("UPDATE crawl_jobs SET completed = 1 WHERE id = ?", (job_id,))
+            conn.commit()
+
+    def get_failed_job_episodes(self, target_url: str) -> List[str]:
+        """이전 실행에서 재시도까지 실패한 에피소드 URL (큐 순서대로)"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT e.url FROM job_episodes e JOIN crawl_jobs j ON e.job_id = j.id "
+                "WHERE j.target_key = ? AND j.completed = 1 AND e.phase = 'failed' ORDER BY e.position",
+                (url_key(target_url),)
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def delete_crawl_job(self, job_id: int):
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM crawl_jobs WHERE id = ?", (job_id,))
+            conn.commit()
+
     def delete_crawled_urls(self, ids: List[int]) -> int:
         if not ids:
             return 0
         with self._get_connection() as conn:
             cursor = conn.cursor()
             placeholders = ','.join('?' for _ in ids)
+            # 지운 에피소드를 다시 받을 수 있도록 해당 시리즈의 목록 지문을 초기화
+            cursor.execute(
+                f"UPDATE mana_lists SET list_fingerprint = NULL WHERE id IN (SELECT mana_list_id FROM crawled_urls WHERE id IN ({placeholders}))",
+                ids
+            )
             query = f"DELETE FROM crawled_urls WHERE id IN ({placeholders})"
             cursor.execute(query, ids)
             conn.commit()
@@ -265,11 +513,51 @@ class DBRepository:
                 SELECT ml.mana_list_url, ml.mana_title, MAX(cu.crawled_at) AS last_crawled
                 FROM crawled_urls cu
                 JOIN mana_lists ml ON ml.id = cu.mana_list_id
-                GROUP BY ml.id, ml.mana_list_url, ml.mana_title
+                GROUP BY COALESCE(ml.list_key, ml.id)
                 ORDER BY last_crawled DESC
             """)
             return cursor.fetchall()
 
+    def get_list_fingerprint(self, mana_list_url: str) -> Optional[str]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT list_fingerprint FROM mana_lists WHERE list_key = ?", (url_key(mana_list_url),))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def set_list_fingerprint(self, mana_list_url: str, fingerprint: str):
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE mana_lists SET list_fingerprint = ? WHERE list_key = ?", (fingerprint, url_key(mana_list_url)))
+            conn.commit()
+
+    def get_followed_series(self) -> List[tuple]:
+        """수집 기록이 있는 시리즈: (mana_list_url, mana_title, last_checked_at, [crawled_at, ...])"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT ml.mana_list_url, ml.mana_title, ml.last_checked_at, GROUP_CONCAT(cu.crawled_at)
+                FROM crawled_urls cu
+                JOIN mana_lists ml ON ml.id = cu.mana_list_id
+                GROUP BY ml.id, ml.mana_list_url, ml.mana_title, ml.last_checked_at
+            """)
+            return [(url, title, checked, (times or "").split(",")) for url, title, checked, times in cursor.fetchall()]
+
+    def mark_list_checked(self, mana_list_url: str):
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE mana_lists SET last_checked_at = CURRENT_TIMESTAMP WHERE list_key = ?", (url_key(mana_list_url),))
+            conn.commit()
+
+    def count_lists_checked_since(self, since_epoch: float) -> int:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM mana_lists WHERE last_checked_at >= datetime(?, 'unixepoch')",
+                (int(since_epoch),)
+            )
+            return cursor.fetchone()[0]
+
     def get_next_episode(self, current_id: int) -> Optional[tuple]:
         """
         Finds the next episode in the same mana_list based on page_title order.
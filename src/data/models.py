@@ -5,6 +5,7 @@ from typing import List
 class ImageItem:
     url: str
     filename: str = "" # e.g. "001.jpg"
+    error: str = "" # 마지막 다운로드 실패 종류 (core.concurrency.FAILURE_*), 성공하면 ""
 
 @dataclass
 class Episode:
@@ -3,21 +3,39 @@ import argparse
 import time
 import threading
 from ui.main_window import MainWindow
-from core.engine import CrawlerEngine
+from core.engine import CrawlerEngine, COMMIT_THRESHOLD
+from core.work_queue import QUEUE_ORDERS, ORDER_NEWEST, DEFAULT_LATEST_COUNT
+from core.download_scheduler import DEFAULT_IMAGE_CONCURRENCY, DEFAULT_PER_HOST, ASYNC_IMAGE_CONCURRENCY, ASYNC_PER_HOST
+from core.downloader import DOWNLOADER_BACKENDS, DOWNLOADER_THREADS
 from utils.logger import logger
 from data.db_repository import db
+from core.resource_policy import ResourcePolicy
+from core.job_journal import JobJournal
+from core.update_scheduler import UpdateScheduler, DEFAULT_LIST_BUDGET, DEFAULT_TICK_INTERVAL
+from core.browser_broker import BrokerServer, RemoteBroker, DEFAULT_BROKER_PORT, broker_authkey
 
-def run_cli(url, output_dir, threads):
+def run_cli(url, output_dir, threads, browser_mode="tabs", pool_size=None, image_discovery="scroll", fetch_mode="browser", http_workers=None,
+            resource_policy=None, harvest_images=False, persist_session=True, broker=None, tab_sessions=False,
+            adaptive=False, resume=True, full_resync=False, recycle_episodes=0, recycle_memory_mb=0,
+            commit_threshold=COMMIT_THRESHOLD, queue_order=ORDER_NEWEST, latest_count=DEFAULT_LATEST_COUNT, first=None,
+            image_concurrency=None, images_per_host=None, downloader_backend=DOWNLOADER_THREADS):
     print(f"Starting CLI Crawler...")
     print(f"URL: {url}")
     print(f"Output: {output_dir}")
     print(f"Threads: {threads}")
+    print(f"Browser Mode: {browser_mode}")
     
     # Configure logger to output to console only (already default? verify logger)
     # The current logger prints to console, but we might want to ensure it doesn't try to queue to GUI if GUI isn't there.
     # Our simple logger prints to stdout, so it's fine.
 
-    engine = CrawlerEngine(download_path=output_dir, num_download_threads=threads)
+    engine = CrawlerEngine(download_path=output_dir, num_download_threads=threads, browser_mode=browser_mode, pool_size=pool_size, image_discovery=image_discovery,
+                           fetch_mode=fetch_mode, http_workers=http_workers, resource_policy=resource_policy,
+                           harvest_images=harvest_images, persist_session=persist_session, broker=broker,
+                           tab_sessions=tab_sessions, adaptive=adaptive, resume=resume,
+                           full_resync=full_resync, recycle_episodes=recycle_episodes, recycle_memory_mb=recycle_memory_mb,
+                           commit_threshold=commit_threshold, queue_order=queue_order, latest_count=latest_count,
+                           image_concurrency=image_concurrency, images_per_host=images_per_host, downloader_backend=downloader_backend)
     
     # We need to keep the main thread alive while engine runs in background or run engine synchronously.
     # Engine.start is blocking? No, engine.start calls logic. 
@@ -28,7 +46,13 @@ def run_cli(url, output_dir, threads):
     # So engine.start IS blocking. Perfect.
     
     try:
-        engine.start(url)
+        if first:
+            # --first 시리즈는 배치의 나머지보다 먼저 목록을 받고, 그 에피소드가 큐 맨 앞으로 갑니다.
+            engine.start_batch(url if isinstance(url, list) else [url], first=first)
+        elif isinstance(url, list):
+            engine.start_batch(url)
+        else:
+            engine.start(url)
     except KeyboardInterrupt:
         print("\nStopping crawler...")
         engine.stop()
@@ -38,6 +62,35 @@ def main():
     parser.add_argument("--url", type=str, help="Target URL to crawl (e.g., https://manatoki.net/comic/123)")
     parser.add_argument("-o", "--output", type=str, default="downloaded_files", help="Download directory path")
     parser.add_argument("-t", "--threads", type=int, default=4, help="Number of download threads")
+    parser.add_argument("--browser-pool", action="store_true", help="Run one browser process per worker instead of tabs in one browser")
+    parser.add_argument("--pool-size", type=int, help="Number of browsers in --browser-pool mode (default: --threads)")
+    parser.add_argument("--no-scroll", action="store_true", help="Discover images from DOM attributes instead of scrolling each episode")
+    parser.add_argument("--http-fetch", action="store_true", help="Fetch list/episode pages over HTTP with the browser's cookies (browser only as fallback)")
+    parser.add_argument("--http-workers", type=int, help="Number of HTTP fetch workers in --http-fetch mode (default: 4x threads)")
+    parser.add_argument("--block-resources", action="store_true", help="Block images, fonts, media and ads in worker tabs (captcha stays allowed)")
+    parser.add_argument("--blocklist", type=str, help="Extra comma-separated URL patterns to block with --block-resources (e.g. '*ads.example.com*')")
+    parser.add_argument("--harvest-images", action="store_true", help="Save images the browser already loaded instead of downloading them again")
+    parser.add_argument("--fresh-session", action="store_true", help="Do not reuse the saved browser profile and cookies")
+    parser.add_argument("--tab-sessions", action="store_true", help="Drive each worker tab through its own DevTools session (no shared lock/tab switching)")
+    parser.add_argument("--adaptive", action="store_true", help="Adapt active workers and per-host image requests to latency, errors and captchas (--threads becomes the upper limit)")
+    parser.add_argument("--resume", action="store_true", help="Resume every interrupted job recorded in the job journal (no --url needed)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the job journal and re-list the series from scratch")
+    parser.add_argument("--full-resync", action="store_true", help="Check every episode in the list (default: stop after a run of already crawled episodes)")
+    parser.add_argument("--recycle-episodes", type=int, default=0, help="Restart a browser after this many episodes to cap its memory (cookies are kept; 0 = never)")
+    parser.add_argument("--recycle-memory", type=int, default=0, help="Restart a browser when its processes use more than this many MB (needs psutil; 0 = off)")
+    parser.add_argument("--commit-threshold", type=float, default=COMMIT_THRESHOLD * 100, help="Record an episode as crawled when at least this %% of its images downloaded; otherwise retry it at the end of the run (default: %(default).0f)")
+    parser.add_argument("--image-workers", type=int, help=f"Image requests in flight across all episodes (default: max({DEFAULT_IMAGE_CONCURRENCY}, 2x threads); {ASYNC_IMAGE_CONCURRENCY} with --downloader asyncio)")
+    parser.add_argument("--per-host", type=int, help=f"Image requests in flight per image host (default: {DEFAULT_PER_HOST}; {ASYNC_PER_HOST} with --downloader asyncio). Images usually come from a single CDN host, so this is the effective image concurrency")
+    parser.add_argument("--downloader", choices=DOWNLOADER_BACKENDS, help="Image downloader backend: thread pool (requests) or asyncio (aiohttp, hundreds of requests from one thread) (default: saved DOWNLOADER_BACKEND setting or threads)")
+    parser.add_argument("--order", choices=QUEUE_ORDERS, default=ORDER_NEWEST, help="Episode order within a series: newest first, oldest first, or the latest N first then backfill from episode 1 (default: %(default)s)")
+    parser.add_argument("--latest-count", type=int, default=DEFAULT_LATEST_COUNT, help="Number of newest episodes fetched first with --order latest (default: %(default)s)")
+    parser.add_argument("--first", action="append", metavar="URL", help="Crawl this series before the rest of the batch (repeatable; may be used without --url)")
+    parser.add_argument("--schedule", action="store_true", help="Keep checking followed series for new episodes, most likely to have updates first")
+    parser.add_argument("--list-budget", type=int, default=DEFAULT_LIST_BUDGET, help=f"Max list pages the scheduler checks per hour (default: {DEFAULT_LIST_BUDGET})")
+    parser.add_argument("--schedule-interval", type=int, default=DEFAULT_TICK_INTERVAL // 60, help="Minutes between scheduler passes (default: %(default)s)")
+    parser.add_argument("--broker", action="store_true", help="Run a warm browser broker that keeps browsers open between CLI runs (blocks until Ctrl+C)")
+    parser.add_argument("--use-broker", action="store_true", help="Lease browsers from a running --broker instead of launching new ones")
+    parser.add_argument("--broker-port", type=int, default=DEFAULT_BROKER_PORT, help=f"Local port of the browser broker (default: {DEFAULT_BROKER_PORT})")
     parser.add_argument("--db-path", type=str, help="Path to database file")
     parser.add_argument("--gui", action="store_true", help="Launch the GUI application")
     
@@ -58,9 +111,63 @@ def main():
         app.mainloop()
         return
 
-    # Case 2: CLI Mode
-    if args.url:
-        run_cli(args.url, args.output, args.threads)
+    # Case 2: Browser broker (CLI 실행 사이에 브라우저를 띄워 둠)
+    if args.broker:
+        try:
+            BrokerServer(args.broker_port, broker_authkey(db)).serve_forever()
+        except KeyboardInterrupt:
+            print("\nBroker stopped.")
+        return
+
+    # Case 3: CLI Mode
+    if args.schedule and (args.url or args.first or args.resume):
+        # 스케줄러는 팔로우 중인 시리즈(수집 기록이 있는 시리즈)만 확인하므로 URL 이 조용히 무시되지 않게 막습니다.
+        parser.error("--schedule checks followed series only; run --url/--first/--resume separately (a crawled series is followed automatically)")
+    if args.resume and not args.url:
+        pending = JobJournal().pending_targets()
+        if not pending:
+            print("No interrupted jobs to resume.")
+            return
+        args.url = pending
+
+    if args.first and not args.url:
+        args.url = list(args.first)
+
+    if args.url or args.schedule:
+        browser_mode = "pool" if args.browser_pool else "tabs"
+        image_discovery = "dom" if args.no_scroll else "scroll"
+        fetch_mode = "http" if args.http_fetch else "browser"
+        resource_policy = ResourcePolicy(extra_patterns=ResourcePolicy.parse_patterns(args.blocklist)) if args.block_resources else None
+        broker = None
+        if args.use_broker:
+            try:
+                broker = RemoteBroker(args.broker_port, broker_authkey(db))
+            except OSError as e:
+                print(f"Browser broker not reachable on port {args.broker_port} ({e}); launching browsers directly.")
+        def crawl(url, first=None):
+            run_cli(url, args.output, args.threads, browser_mode=browser_mode, pool_size=args.pool_size, image_discovery=image_discovery,
+                    fetch_mode=fetch_mode, http_workers=args.http_workers, resource_policy=resource_policy,
+                    harvest_images=args.harvest_images, persist_session=not args.fresh_session, broker=broker,
+                    tab_sessions=args.tab_sessions, adaptive=args.adaptive, resume=not args.restart,
+                    full_resync=args.full_resync, recycle_episodes=args.recycle_episodes, recycle_memory_mb=args.recycle_memory,
+                    commit_threshold=args.commit_threshold / 100, queue_order=args.order, latest_count=args.latest_count,
+                    first=first, image_concurrency=args.image_workers, images_per_host=args.per_host,
+                    downloader_backend=args.downloader or db.get_config("DOWNLOADER_BACKEND") or DOWNLOADER_THREADS)
+
+        if args.schedule:
+            # 팔로우 중인 시리즈를 주기적으로 확인 (Ctrl+C 로 종료)
+            scheduler = UpdateScheduler(runner=crawl, list_budget=args.list_budget, interval=args.schedule_interval * 60)
+            print(f"Update scheduler running (budget {args.list_budget} lists/hour, every {args.schedule_interval} min). Ctrl+C to stop.")
+            try:
+                while True:
+                    scheduler.run_once()
+                    time.sleep(scheduler.interval)
+            except KeyboardInterrupt:
+                print("\nScheduler stopped.")
+        else:
+            crawl(args.url, first=args.first)
+        if broker:
+            broker.shutdown()
     else:
         # If arguments are provided but not --url and not --gui (e.g. just --output), show help
         print("Error: --url is required for CLI mode.")
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from data.models import Episode, ImageItem
 
 class BaseParser(ABC):
+    # 사이트 식별자 (브라우저 프로필/쿠키 저장 위치 등에 사용, 도메인이 바뀌어도 유지)
+    site_name = "default"
+
     @abstractmethod
     def get_title(self, html_source: str) -> str:
         pass
@@ -11,10 +14,24 @@ class BaseParser(ABC):
     def get_episode_urls(self, html_source: str) -> List[str]:
         pass
 
+    def iter_episode_urls(self, html_source: str) -> Iterator[str]:
+        """
+        에피소드 URL을 사이트 순서대로 하나씩 돌려줍니다 (증분 수집에서 앞쪽만 보고 멈출 수 있도록).
+        기본 구현은 전체 목록을 파싱한 뒤 순회합니다.
+        """
+        return iter(self.get_episode_urls(html_source))
+
     @abstractmethod
     def get_images(self, html_source: str) -> List[ImageItem]:
         pass
 
+    def discover_images(self, html_source: str) -> Tuple[List[ImageItem], int]:
+        """
+        스크롤 없이 DOM 속성만으로 이미지 URL을 찾습니다.
+        (이미지 목록, 실제 URL을 찾지 못한 지연 로딩 자리표시자 수)를 반환합니다.
+        """
+        return self.get_images(html_source), 0
+
     @abstractmethod
     def is_captcha_page(self, current_url: str, html_source: str) -> bool:
         pass
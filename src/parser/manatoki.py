@@ -1,11 +1,29 @@
+import html
 import logging
-from typing import List
+import re
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from .base_parser import BaseParser
 from data.models import ImageItem
 import random
 
+# 지연 로딩 이미지의 실제 주소가 들어 있는 data-* 속성 값 (사이트가 속성 이름을 무작위로 바꾸므로 값으로 판별)
+IMAGE_URL_PATTERN = re.compile(r'^(https?:)?//[^\s"\']+\.(jpe?g|png|webp|gif)(\?[^\s"\']*)?$', re.IGNORECASE)
+# 본문을 16진수로 인코딩해 스크립트로 그리는 페이지: html_data+='3C.69.6D.67...';
+HTML_DATA_PATTERN = re.compile(r"html_data\s*\+=\s*'([0-9A-Fa-f.]*)'")
+PLACEHOLDER_MARKERS = ('loading', 'blank', 'lazy', 'data:image')
+# 증분 목록 스캔용 (BeautifulSoup 전체 파싱 없이 본문 serial-list 안의 링크만 앞에서부터 읽음)
+ARTICLE_BODY_PATTERN = re.compile(r'<article\b[^>]*\sitemprop=["\']articleBody["\'][^>]*>', re.IGNORECASE)
+SERIAL_LIST_PATTERN = re.compile(r'<div\b[^>]*class=["\'][^"\']*\bserial-list\b[^"\']*["\'][^>]*>', re.IGNORECASE)
+LIST_TOKEN_PATTERN = re.compile(r'<(?P<close>/?)div\b[^>]*?(?P<empty>/?)>|(?P<end></article\s*>)|<a\b[^>]*?\shref=(["\'])(?P<href>.*?)\4',
+                                re.IGNORECASE | re.DOTALL)
+# 에피소드 링크 (/comic/<id>). 목록 안의 공유/다음 페이지 링크 등은 제외
+EPISODE_PATH_PATTERN = re.compile(r'^/comic/\d+/?$')
+
 class ManatokiParser(BaseParser):
+    site_name = "manatoki"
+
     def get_title(self, html_source: str) -> str:
         soup = BeautifulSoup(html_source, 'html.parser')
         title_element = soup.find('h1') or soup.find('div', class_='view-title')
@@ -27,9 +45,38 @@ class ManatokiParser(BaseParser):
                 # Crawler logic in legacy did not reverse explicitly, but we might want to check order.
                 # Usually list is DESC (latest first). We might want ASC execution?
                 # Legacy code: `article_urls = [link['href'] for link in links]`
-                return [link['href'] for link in links]
+                return [link['href'] for link in links if self._is_episode_url(link['href'])]
         return []
 
+    def iter_episode_urls(self, html_source: str) -> Iterator[str]:
+        """
+        본문(article[itemprop=articleBody])의 serial-list 링크를 최신 화부터 순서대로 돌려줍니다.
+        div 깊이를 세어 목록이 끝나면 멈추고 (<div/> 는 세지 않음), 원본 HTML 이 닫히지 않았어도 본문이 끝나면 멈춥니다.
+        """
+        article = ARTICLE_BODY_PATTERN.search(html_source)
+        start = SERIAL_LIST_PATTERN.search(html_source, article.end()) if article else None
+        if not start:
+            return
+        depth = 1
+        for match in LIST_TOKEN_PATTERN.finditer(html_source, start.end()):
+            if match.group('end'):
+                return
+            href = match.group('href')
+            if href is not None:
+                href = html.unescape(href)
+                if self._is_episode_url(href):
+                    yield href
+            elif match.group('close'):
+                depth -= 1
+                if depth == 0:
+                    return
+            elif not match.group('empty'):
+                depth += 1
+
+    @staticmethod
+    def _is_episode_url(href: str) -> bool:
+        return bool(EPISODE_PATH_PATTERN.match(urlparse(href).path))
+
     def get_images(self, html_source: str) -> List[ImageItem]:
         soup = BeautifulSoup(html_source, 'html.parser')
         html_mana_section = soup.find('section', itemtype='http://schema.org/NewsArticle')
@@ -47,6 +94,60 @@ class ManatokiParser(BaseParser):
                     images.append(ImageItem(url=img_url))
         return images
 
+    def discover_images(self, html_source: str) -> Tuple[List[ImageItem], int]:
+        soup = BeautifulSoup(html_source, 'html.parser')
+        html_mana_section = soup.find('section', itemtype='http://schema.org/NewsArticle')
+        if not html_mana_section:
+            return [], 0
+
+        img_tags = html_mana_section.find_all('img')
+        if not img_tags:
+            # 본문이 아직 스크립트(html_data)로 그려지지 않은 원본 HTML이면 직접 디코딩
+            decoded = self._decode_html_data(html_source)
+            if decoded:
+                img_tags = BeautifulSoup(decoded, 'html.parser').find_all('img')
+
+        images = []
+        missing = 0
+        for img in img_tags:
+            img_url = self._resolve_image_url(img)
+            if img_url is None:
+                missing += 1
+            elif '.gif' not in img_url.lower():
+                images.append(ImageItem(url=img_url))
+        return images, missing
+
+    @staticmethod
+    def _resolve_image_url(img) -> Optional[str]:
+        """
+        data-* 속성에 실제 URL이 있으면 우선 사용하고, 없으면 src 를 사용합니다.
+        src 가 자리표시자뿐이라 URL을 알 수 없으면 None 을 반환합니다.
+        """
+        candidates = [
+            value.strip() for attr, value in img.attrs.items()
+            if attr.startswith('data-') and isinstance(value, str) and IMAGE_URL_PATTERN.match(value.strip())
+        ]
+        # 로딩용 gif 가 data-* 에 들어 있는 경우가 있어 gif 가 아닌 후보를 우선합니다.
+        candidates.sort(key=lambda url: '.gif' in url.lower())
+        if candidates:
+            url = candidates[0]
+            return 'https:' + url if url.startswith('//') else url
+        src = (img.get('src') or '').strip()
+        if not src or any(marker in src.lower() for marker in PLACEHOLDER_MARKERS):
+            return None
+        return src
+
+    @staticmethod
+    def _decode_html_data(html_source: str) -> str:
+        chunks = HTML_DATA_PATTERN.findall(html_source)
+        if not chunks:
+            return ""
+        hex_codes = [code for code in ''.join(chunks).split('.') if code]
+        try:
+            return bytes(int(code, 16) for code in hex_codes).decode('utf-8', errors='ignore')
+        except ValueError:
+            return ""
+
     def is_captcha_page(self, current_url: str, html_source: str) -> bool:
         # logging.info("is_captcha_page - current_url: " + current_url)
         if "/bbs/captcha.php" in current_url:
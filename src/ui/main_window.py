@@ -7,6 +7,11 @@ import queue
 import webbrowser
 from utils.logger import logger
 from core.engine import CrawlerEngine
+from core.work_queue import ORDER_NEWEST, ORDER_OLDEST, ORDER_LATEST_FIRST, DEFAULT_LATEST_COUNT
+from core.downloader import DOWNLOADER_THREADS
+from core.resource_policy import ResourcePolicy
+from core.browser_broker import BrowserBroker
+from core.update_scheduler import UpdateScheduler, DEFAULT_LIST_BUDGET
 from ui.settings_dialog import SettingsDialog
 from db_viewer.db_viewer import DBViewer
 from data.db_repository import db
@@ -17,6 +22,13 @@ ctk.set_default_color_theme("blue")
 
 FONT_FAMILY = "Malgun Gothic"
 
+# 수집 순서 콤보 표시 이름 -> QUEUE_ORDER 설정값
+QUEUE_ORDER_LABELS = {
+    "최신 화부터": ORDER_NEWEST,
+    "1화부터": ORDER_OLDEST,
+    "최신 N화 먼저, 이후 1화부터": ORDER_LATEST_FIRST,
+}
+
 class MainWindow(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -37,6 +49,21 @@ class MainWindow(ctk.CTk):
         self.threads_var = tk.StringVar(value="2")
         self.captcha_auto_var = tk.BooleanVar(value=db.get_config("CAPTCHA_AUTO_SOLVE") != "false")
         self.headless_var = tk.BooleanVar(value=db.get_config("HEADLESS_MODE") == "true")
+        self.browser_pool_var = tk.BooleanVar(value=db.get_config("BROWSER_MODE") == "pool")
+        self.no_scroll_var = tk.BooleanVar(value=db.get_config("IMAGE_DISCOVERY") == "dom")
+        self.http_fetch_var = tk.BooleanVar(value=db.get_config("FETCH_MODE") == "http")
+        self.block_resources_var = tk.BooleanVar(value=db.get_config("BLOCK_RESOURCES") == "true")
+        self.harvest_images_var = tk.BooleanVar(value=db.get_config("HARVEST_IMAGES") == "true")
+        self.persist_session_var = tk.BooleanVar(value=db.get_config("PERSIST_SESSION") != "false")
+        self.warm_browser_var = tk.BooleanVar(value=db.get_config("WARM_BROWSER") == "true")
+        self.tab_sessions_var = tk.BooleanVar(value=db.get_config("TAB_SESSIONS") == "true")
+        self.adaptive_var = tk.BooleanVar(value=db.get_config("ADAPTIVE_CONCURRENCY") == "true")
+        self.auto_update_var = tk.BooleanVar(value=db.get_config("AUTO_UPDATE") == "true")
+        self.full_resync_var = tk.BooleanVar(value=db.get_config("FULL_RESYNC") == "true")
+        saved_order = db.get_config("QUEUE_ORDER") or ORDER_NEWEST
+        self.queue_order_var = tk.StringVar(value=next((label for label, order in QUEUE_ORDER_LABELS.items() if order == saved_order), "최신 화부터"))
+        self.update_scheduler = None  # 팔로우 중인 시리즈를 주기적으로 확인 (AUTO_UPDATE)
+        self.browser_broker = None  # 작업 사이에 브라우저를 띄워 두는 브로커 (WARM_BROWSER)
         self._status_counter = 0  # For throttling status refresh
         
         # Persistent log area to keep logs when switching views
@@ -48,6 +75,7 @@ class MainWindow(ctk.CTk):
         
         self.after(100, self._process_queue)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._sync_scheduler()
 
     def _create_widgets(self):
         # 1. Main Layout Containers
@@ -93,6 +121,8 @@ class MainWindow(ctk.CTk):
         self.status_apikey_label.pack(fill='x')
         self.status_engine_label = ctk.CTkLabel(status_frame, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=12), anchor="w")
         self.status_engine_label.pack(fill='x')
+        self.status_limits_label = ctk.CTkLabel(status_frame, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=11), anchor="w", justify="left", wraplength=180)
+        self.status_limits_label.pack(fill='x')
 
         self._refresh_status()
 
@@ -129,6 +159,9 @@ class MainWindow(ctk.CTk):
             text=f"⚙️ 엔진: {'실행중' if running else '대기'}",
             text_color='#3B8ED0' if running else 'gray'
         )
+        # 자동 조절 중인 동시성 한도
+        limits = self.engine.format_concurrency() if running else ""
+        self.status_limits_label.configure(text=f"📶 {limits}" if limits else "", text_color='gray')
 
     def _show_view(self, view_frame):
         if self.current_view:
@@ -175,7 +208,35 @@ class MainWindow(ctk.CTk):
         row2.pack(fill='x', padx=10, pady=(0, 10))
         
         ctk.CTkCheckBox(row2, text="캡챠 자동 해결 (Gemini)", variable=self.captcha_auto_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
-        ctk.CTkCheckBox(row2, text="백그라운드 실행 (Headless)", variable=self.headless_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
+        ctk.CTkCheckBox(row2, text="백그라운드 실행 (Headless)", variable=self.headless_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row2, text="워커별 브라우저 (Pool)", variable=self.browser_pool_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row2, text="스크롤 없이 이미지 탐색", variable=self.no_scroll_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
+
+        # Row 3: 수집 방식
+        row3 = ctk.CTkFrame(opt_frame, fg_color="transparent")
+        row3.pack(fill='x', padx=10, pady=(0, 10))
+
+        ctk.CTkCheckBox(row3, text="HTTP 직접 수집 (캡챠 시 브라우저)", variable=self.http_fetch_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row3, text="이미지/폰트/광고 차단", variable=self.block_resources_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row3, text="브라우저 이미지 재사용", variable=self.harvest_images_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row3, text="로그인 세션 유지", variable=self.persist_session_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
+
+        # Row 4: 브라우저 구동 방식
+        row4 = ctk.CTkFrame(opt_frame, fg_color="transparent")
+        row4.pack(fill='x', padx=10, pady=(0, 10))
+
+        ctk.CTkCheckBox(row4, text="브라우저 재사용 (빠른 시작)", variable=self.warm_browser_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row4, text="탭별 CDP 세션 (탭 동시 처리)", variable=self.tab_sessions_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row4, text="동시성 자동 조절 (스레드=상한)", variable=self.adaptive_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkCheckBox(row4, text="자동 업데이트 확인", variable=self.auto_update_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
+
+        # Row 5: 수집 범위
+        row5 = ctk.CTkFrame(opt_frame, fg_color="transparent")
+        row5.pack(fill='x', padx=10, pady=(0, 10))
+
+        ctk.CTkCheckBox(row5, text="전체 목록 재확인 (누락 화 찾기)", variable=self.full_resync_var, command=self._on_option_toggle, font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 20))
+        ctk.CTkLabel(row5, text="수집 순서:", font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=(0, 5))
+        ctk.CTkOptionMenu(row5, values=list(QUEUE_ORDER_LABELS), variable=self.queue_order_var, command=lambda _: self._on_option_toggle(), font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
 
         # 3. Controls
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
@@ -218,6 +279,7 @@ class MainWindow(ctk.CTk):
 
         ctk.CTkButton(action_frame, text="새로고침", command=lambda: self._load_latest_updates(tree), font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
         ctk.CTkButton(action_frame, text="선택 크롤링", command=lambda: self._crawl_selected_latest(tree), font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left', padx=10)
+        ctk.CTkButton(action_frame, text="지금 크롤링 (우선)", command=lambda: self._crawl_selected_now(tree), font=ctk.CTkFont(family=FONT_FAMILY, size=12)).pack(side='left')
 
         # Treeview Container
         tree_frame = ctk.CTkFrame(frame)
@@ -295,6 +357,21 @@ class MainWindow(ctk.CTk):
         """체크박스 변경 시 즉시 DB에 저장"""
         db.set_config("CAPTCHA_AUTO_SOLVE", "true" if self.captcha_auto_var.get() else "false")
         db.set_config("HEADLESS_MODE", "true" if self.headless_var.get() else "false")
+        db.set_config("BROWSER_MODE", "pool" if self.browser_pool_var.get() else "tabs")
+        db.set_config("IMAGE_DISCOVERY", "dom" if self.no_scroll_var.get() else "scroll")
+        db.set_config("FETCH_MODE", "http" if self.http_fetch_var.get() else "browser")
+        db.set_config("BLOCK_RESOURCES", "true" if self.block_resources_var.get() else "false")
+        db.set_config("HARVEST_IMAGES", "true" if self.harvest_images_var.get() else "false")
+        db.set_config("PERSIST_SESSION", "true" if self.persist_session_var.get() else "false")
+        db.set_config("WARM_BROWSER", "true" if self.warm_browser_var.get() else "false")
+        db.set_config("TAB_SESSIONS", "true" if self.tab_sessions_var.get() else "false")
+        db.set_config("ADAPTIVE_CONCURRENCY", "true" if self.adaptive_var.get() else "false")
+        db.set_config("AUTO_UPDATE", "true" if self.auto_update_var.get() else "false")
+        db.set_config("FULL_RESYNC", "true" if self.full_resync_var.get() else "false")
+        db.set_config("QUEUE_ORDER", QUEUE_ORDER_LABELS.get(self.queue_order_var.get(), ORDER_NEWEST))
+        self._sync_scheduler()
+        if not self.warm_browser_var.get() and self.browser_broker and not (self.engine and self.engine.is_running):
+            self._shutdown_broker()
         self._refresh_status()
 
     def _browse_path(self):
@@ -360,11 +437,7 @@ class MainWindow(ctk.CTk):
             messagebox.showinfo("알림", "크롤링할 항목을 선택해주세요.")
             return
         
-        path = self.path_var.get()
-        try: threads = int(self.threads_var.get())
-        except: threads = 2
-        base_folder = db.get_config("LOCAL_BASE_STORE_FOLDER") or ""
-        self.engine = CrawlerEngine(download_path=path, num_download_threads=threads, captcha_auto_solve=self.captcha_auto_var.get(), base_store_folder=base_folder, headless=self.headless_var.get())
+        self.engine = self._build_engine(self.path_var.get())
         self._toggle_ui(running=True)
 
         def run_batch():
@@ -372,14 +445,31 @@ class MainWindow(ctk.CTk):
             self._toggle_ui(running=False)
         threading.Thread(target=run_batch, daemon=True).start()
 
+    def _crawl_selected_now(self, tree):
+        """선택한 시리즈를 진행 중인 배치의 남은 작업보다 먼저 받습니다 (실행 중이 아니면 새 배치로 시작)."""
+        selected_urls = [tree.item(iid, "values")[1] for iid, var in tree.latest_check_vars.items() if var.get()]
+        if not selected_urls:
+            messagebox.showinfo("알림", "크롤링할 항목을 선택해주세요.")
+            return
+        if self.engine and self.engine.is_running:
+            if not all(self.engine.crawl_now(url) for url in selected_urls):
+                messagebox.showinfo("알림", "현재 실행 중인 작업에는 끼워 넣을 수 없습니다. 작업이 끝난 뒤 다시 시도해주세요.")
+            return
+
+        self.engine = self._build_engine(self.path_var.get())
+        self._toggle_ui(running=True)
+
+        def run_batch():
+            self.engine.start_batch(selected_urls, first=selected_urls)
+            self._toggle_ui(running=False)
+        threading.Thread(target=run_batch, daemon=True).start()
+
     def _start_crawling(self):
         url = self.url_var.get().strip()
         if not url:
             messagebox.showwarning("Warning", "URL을 입력해주세요.")
             return
         path = self.path_var.get()
-        try: threads = int(self.threads_var.get())
-        except: threads = 2
         
         # Auto-save and .bat creation logic (simplified)
         if path and os.path.isdir(path):
@@ -387,12 +477,83 @@ class MainWindow(ctk.CTk):
                 with open(os.path.join(path, "list_url.txt"), 'w', encoding='utf-8') as f: f.write(url)
             except: pass
 
-        base_folder = db.get_config("LOCAL_BASE_STORE_FOLDER") or ""
-        self.engine = CrawlerEngine(download_path=path, num_download_threads=threads, captcha_auto_solve=self.captcha_auto_var.get(), base_store_folder=base_folder, headless=self.headless_var.get())
+        self.engine = self._build_engine(path)
         self._toggle_ui(running=True)
         self.engine_thread = threading.Thread(target=self.engine.start, args=(url,), daemon=True)
         self.engine_thread.start()
 
+    def _build_engine(self, path):
+        """대시보드 옵션으로 엔진 생성 (단일/선택 크롤링 공용)"""
+        try: threads = int(self.threads_var.get())
+        except: threads = 2
+        base_folder = db.get_config("LOCAL_BASE_STORE_FOLDER") or ""
+        resource_policy = None
+        if self.block_resources_var.get():
+            resource_policy = ResourcePolicy(extra_patterns=ResourcePolicy.parse_patterns(db.get_config("RESOURCE_BLOCKLIST")))
+        return CrawlerEngine(
+            download_path=path,
+            num_download_threads=threads,
+            captcha_auto_solve=self.captcha_auto_var.get(),
+            base_store_folder=base_folder,
+            headless=self.headless_var.get(),
+            browser_mode="pool" if self.browser_pool_var.get() else "tabs",
+            image_discovery="dom" if self.no_scroll_var.get() else "scroll",
+            fetch_mode="http" if self.http_fetch_var.get() else "browser",
+            resource_policy=resource_policy,
+            harvest_images=self.harvest_images_var.get(),
+            persist_session=self.persist_session_var.get(),
+            broker=self._get_broker(),
+            tab_sessions=self.tab_sessions_var.get(),
+            adaptive=self.adaptive_var.get(),
+            full_resync=self.full_resync_var.get(),
+            recycle_episodes=self._int_config("BROWSER_RECYCLE_EPISODES"),
+            recycle_memory_mb=self._int_config("BROWSER_RECYCLE_MEMORY_MB"),
+            queue_order=QUEUE_ORDER_LABELS.get(self.queue_order_var.get(), ORDER_NEWEST),
+            latest_count=self._int_config("QUEUE_LATEST_COUNT", DEFAULT_LATEST_COUNT),
+            image_concurrency=self._int_config("IMAGE_CONCURRENCY") or None,
+            images_per_host=self._int_config("IMAGE_PER_HOST") or None,
+            downloader_backend=db.get_config("DOWNLOADER_BACKEND") or DOWNLOADER_THREADS,
+        )
+
+    @staticmethod
+    def _int_config(key: str, default: int = 0) -> int:
+        try: return int(db.get_config(key) or default)
+        except ValueError: return default
+
+    def _sync_scheduler(self):
+        """자동 업데이트 옵션에 맞춰 스케줄러를 시작/중지"""
+        if self.auto_update_var.get() and not self.update_scheduler:
+            try: budget = int(db.get_config("SCHEDULER_LIST_BUDGET") or DEFAULT_LIST_BUDGET)
+            except ValueError: budget = DEFAULT_LIST_BUDGET
+            self.update_scheduler = UpdateScheduler(
+                runner=self._run_scheduled_batch,
+                is_busy=lambda: bool(self.engine and self.engine.is_running),
+                list_budget=budget,
+            )
+            self.update_scheduler.start()
+        elif not self.auto_update_var.get() and self.update_scheduler:
+            self.update_scheduler.stop()
+            self.update_scheduler = None
+
+    def _run_scheduled_batch(self, urls):
+        """스케줄러 스레드에서 호출: 대시보드 옵션으로 배치 크롤링 후 끝날 때까지 대기"""
+        self.engine = self._build_engine(self.path_var.get())
+        self._toggle_ui(running=True)
+        self.engine.start_batch(urls)
+        self._toggle_ui(running=False)
+
+    def _get_broker(self):
+        if not self.warm_browser_var.get():
+            return None
+        if self.browser_broker is None:
+            self.browser_broker = BrowserBroker()
+        return self.browser_broker
+
+    def _shutdown_broker(self):
+        if self.browser_broker:
+            broker, self.browser_broker = self.browser_broker, None
+            threading.Thread(target=broker.shutdown, daemon=True).start()
+
     def _stop_crawling(self):
         if self.engine: self.engine.stop()
         if hasattr(self, 'btn_stop'): self.btn_stop.configure(state='disabled')
@@ -409,9 +570,12 @@ class MainWindow(ctk.CTk):
         messagebox.showinfo("About", "Manatoki Crawler\nVersion 3.2.0 (Sidebar Integrated)\n\nCreated by ChoChoCho with Gemini 3")
 
     def _on_close(self):
+        if self.update_scheduler: self.update_scheduler.stop()
         if self.engine and self.engine.is_running:
             if messagebox.askokcancel("종료", "크롤링이 진행 중입니다. 정말 종료하시겠습니까?"):
                 self.engine.stop()
+                if self.browser_broker: self.browser_broker.shutdown()
                 self.destroy()
         else:
+            if self.browser_broker: self.browser_broker.shutdown()
             self.destroy()
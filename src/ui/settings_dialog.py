@@ -2,6 +2,10 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from data.db_repository import db
+from core.update_scheduler import DEFAULT_LIST_BUDGET
+from core.work_queue import DEFAULT_LATEST_COUNT
+from core.download_scheduler import DEFAULT_IMAGE_CONCURRENCY, DEFAULT_PER_HOST, ASYNC_IMAGE_CONCURRENCY, ASYNC_PER_HOST
+from core.downloader import DOWNLOADER_BACKENDS, DOWNLOADER_THREADS
 
 FONT_FAMILY = "Malgun Gothic"
 
@@ -50,6 +54,51 @@ class SettingsDialog(ctk.CTkFrame):
         ctk.CTkButton(base_frame, text="선택", command=self._browse_base_folder, width=60, font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', padx=10)
         ctk.CTkLabel(main_frame, text="* 다운로드 경로 미지정 시, 이 경로 아래에 제목별 폴더가 자동 생성됩니다.", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
 
+        # Resource Blocklist
+        ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
+        ctk.CTkLabel(main_frame, text="추가 차단 패턴:", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
+        self.blocklist_var = tk.StringVar()
+        ctk.CTkEntry(main_frame, textvariable=self.blocklist_var, placeholder_text="*ads.example.com*, *.css", font=ctk.CTkFont(family=FONT_FAMILY)).pack(fill='x', padx=20, pady=5)
+        ctk.CTkLabel(main_frame, text="* '이미지/폰트/광고 차단' 사용 시 기본 목록에 더해 차단할 URL 패턴입니다 (쉼표 구분). 캡챠 이미지는 항상 허용됩니다.", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
+
+        # Update Scheduler Budget
+        ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
+        ctk.CTkLabel(main_frame, text="시간당 목록 확인 수:", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
+        self.list_budget_var = tk.StringVar()
+        ctk.CTkEntry(main_frame, textvariable=self.list_budget_var, placeholder_text=str(DEFAULT_LIST_BUDGET), font=ctk.CTkFont(family=FONT_FAMILY)).pack(fill='x', padx=20, pady=5)
+        ctk.CTkLabel(main_frame, text="* '자동 업데이트 확인' 사용 시 한 시간에 다시 확인할 시리즈 목록 페이지의 최대 수입니다.", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
+
+        # Browser Recycling
+        ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
+        ctk.CTkLabel(main_frame, text="브라우저 재시작 (에피소드 수 / 메모리 MB):", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
+        recycle_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        recycle_frame.pack(fill='x', padx=20, pady=5)
+        self.recycle_episodes_var = tk.StringVar()
+        self.recycle_memory_var = tk.StringVar()
+        ctk.CTkEntry(recycle_frame, textvariable=self.recycle_episodes_var, placeholder_text="0", font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', fill='x', expand=True)
+        ctk.CTkEntry(recycle_frame, textvariable=self.recycle_memory_var, placeholder_text="0", font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', fill='x', expand=True, padx=(10, 0))
+        ctk.CTkLabel(main_frame, text="* 긴 배치에서 브라우저 메모리가 계속 늘지 않도록, 에피소드 수나 메모리 사용량을 넘기면 쿠키를 유지한 채 재시작합니다 (0 = 사용 안 함).", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
+
+        # Image Download Pool
+        ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
+        ctk.CTkLabel(main_frame, text="이미지 동시 요청 수 (전체 / 호스트별) / 다운로더:", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
+        image_pool_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        image_pool_frame.pack(fill='x', padx=20, pady=5)
+        self.image_concurrency_var = tk.StringVar()
+        self.image_per_host_var = tk.StringVar()
+        ctk.CTkEntry(image_pool_frame, textvariable=self.image_concurrency_var, placeholder_text="자동", font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', fill='x', expand=True)
+        ctk.CTkEntry(image_pool_frame, textvariable=self.image_per_host_var, placeholder_text="자동", font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', fill='x', expand=True, padx=(10, 0))
+        self.downloader_backend_var = tk.StringVar(value=DOWNLOADER_THREADS)
+        ctk.CTkOptionMenu(image_pool_frame, values=list(DOWNLOADER_BACKENDS), variable=self.downloader_backend_var, width=110, font=ctk.CTkFont(family=FONT_FAMILY)).pack(side='left', padx=(10, 0))
+        ctk.CTkLabel(main_frame, text=f"* 모든 에피소드의 이미지를 하나의 다운로드 풀에서 받습니다. 비워 두면 스레드 수의 2배(최소 {DEFAULT_IMAGE_CONCURRENCY}) / 호스트별 {DEFAULT_PER_HOST}, asyncio 는 {ASYNC_IMAGE_CONCURRENCY} / {ASYNC_PER_HOST} 입니다 (asyncio 는 aiohttp 로 스레드 하나에서 요청 수백 개를 처리).", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
+
+        # Latest-first Queue Order
+        ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
+        ctk.CTkLabel(main_frame, text="먼저 받을 최신 화 수:", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
+        self.latest_count_var = tk.StringVar()
+        ctk.CTkEntry(main_frame, textvariable=self.latest_count_var, placeholder_text=str(DEFAULT_LATEST_COUNT), font=ctk.CTkFont(family=FONT_FAMILY)).pack(fill='x', padx=20, pady=5)
+        ctk.CTkLabel(main_frame, text="* 수집 순서가 '최신 N화 먼저' 일 때 모든 시리즈의 최신 N화를 먼저 받고, 나머지는 1화부터 채웁니다.", text_color="gray", font=ctk.CTkFont(family=FONT_FAMILY)).pack(anchor='w', padx=20, pady=(0, 10))
+
         # DB File
         ctk.CTkFrame(main_frame, height=2, fg_color="gray50").pack(fill='x', padx=20, pady=10)
         ctk.CTkLabel(main_frame, text="DB File:", font=ctk.CTkFont(family=FONT_FAMILY, weight="bold")).pack(anchor='w', padx=20, pady=5)
@@ -96,6 +145,23 @@ class SettingsDialog(ctk.CTkFrame):
         base_folder = db.get_config("LOCAL_BASE_STORE_FOLDER")
         if base_folder:
             self.base_folder_var.set(base_folder)
+        # Resource Blocklist
+        blocklist = db.get_config("RESOURCE_BLOCKLIST")
+        if blocklist:
+            self.blocklist_var.set(blocklist)
+        # Update Scheduler Budget
+        list_budget = db.get_config("SCHEDULER_LIST_BUDGET")
+        if list_budget:
+            self.list_budget_var.set(list_budget)
+        # Browser Recycling
+        self.recycle_episodes_var.set(db.get_config("BROWSER_RECYCLE_EPISODES") or "")
+        self.recycle_memory_var.set(db.get_config("BROWSER_RECYCLE_MEMORY_MB") or "")
+        # Image Download Pool
+        self.image_concurrency_var.set(db.get_config("IMAGE_CONCURRENCY") or "")
+        self.image_per_host_var.set(db.get_config("IMAGE_PER_HOST") or "")
+        self.downloader_backend_var.set(db.get_config("DOWNLOADER_BACKEND") or DOWNLOADER_THREADS)
+        # Latest-first Queue Order
+        self.latest_count_var.set(db.get_config("QUEUE_LATEST_COUNT") or "")
         # DB Path (global)
         db_path = db.get_global_config("DB_PATH") or db.db_path
         if db_path:
@@ -114,6 +180,27 @@ class SettingsDialog(ctk.CTkFrame):
         base_folder = self.base_folder_var.get().strip()
         if base_folder:
             db.set_config("LOCAL_BASE_STORE_FOLDER", base_folder)
+        # Save Resource Blocklist (빈 값도 저장해 목록을 지울 수 있게 함)
+        db.set_config("RESOURCE_BLOCKLIST", self.blocklist_var.get().strip())
+        # Save Update Scheduler Budget
+        list_budget = self.list_budget_var.get().strip()
+        if list_budget.isdigit() and int(list_budget) > 0:
+            db.set_config("SCHEDULER_LIST_BUDGET", list_budget)
+        # Save Browser Recycling (빈 값은 0 = 사용 안 함)
+        for key, var in (("BROWSER_RECYCLE_EPISODES", self.recycle_episodes_var), ("BROWSER_RECYCLE_MEMORY_MB", self.recycle_memory_var)):
+            value = var.get().strip() or "0"
+            if value.isdigit():
+                db.set_config(key, value)
+        # Save Image Download Pool (빈 값은 0 = 기본값)
+        for key, var in (("IMAGE_CONCURRENCY", self.image_concurrency_var), ("IMAGE_PER_HOST", self.image_per_host_var)):
+            value = var.get().strip() or "0"
+            if value.isdigit():
+                db.set_config(key, value)
+        db.set_config("DOWNLOADER_BACKEND", self.downloader_backend_var.get())
+        # Save Latest-first Queue Order
+        latest_count = self.latest_count_var.get().strip()
+        if latest_count.isdigit() and int(latest_count) > 0:
+            db.set_config("QUEUE_LATEST_COUNT", latest_count)
         # Save DB Path (global)
         db_path = self.db_path_var.get().strip()
         if db_path:
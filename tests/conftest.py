@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 앱은 src 를 작업 디렉터리로 실행되므로 (cd src && python main.py) 같은 import 경로를 씁니다.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,96 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from data.models import ImageItem
+from core import async_downloader
+from core.async_downloader import AsyncImageDownloader
+from core.concurrency import HostLimits
+from core.download_scheduler import DownloadScheduler
+
+
+class AlwaysBusyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", "5")
+        self.end_headers()
+        self.wfile.write(b"image")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def busy_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AlwaysBusyHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_close_fails_requests_stuck_in_backoff_and_host_limit(busy_server, tmp_path):
+    # 호스트 한도 1: 한 요청은 503 재시도 백오프에, 나머지는 try_acquire 대기에 머뭅니다.
+    downloader = AsyncImageDownloader(max_threads=50, host_limits=HostLimits(initial=1, maximum=1))
+    scheduler = DownloadScheduler(downloader, max_concurrent=50, per_host=50)
+    scheduler.start()
+    images = [ImageItem(f"{busy_server}/img/{i}.jpg", f"{i}.jpg") for i in range(5)]
+    stop = threading.Event()
+    future = scheduler.submit(images, str(tmp_path), busy_server, cancel=stop)
+    threading.Event().wait(0.5)
+
+    stop.set()
+    scheduler.shutdown(wait=False)
+    downloader.close()
+
+    assert future.result(timeout=5) == (0, 5)
+    assert all(image.error for image in images)
+
+
+def test_closed_downloader_does_not_start_a_new_loop(tmp_path):
+    downloader = AsyncImageDownloader()
+    downloader.close()
+    with pytest.raises(RuntimeError):
+        downloader.submit_image(ImageItem("http://127.0.0.1:9/x.jpg", "x.jpg"), str(tmp_path), "")
+
+
+def test_files_are_written_off_the_event_loop_thread(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    writers = []
+    write_file = async_downloader._write_file
+
+    def recording_write(filepath, data):
+        writers.append(threading.current_thread().name)
+        write_file(filepath, data)
+
+    monkeypatch.setattr(async_downloader, "_write_file", recording_write)
+    downloader = AsyncImageDownloader()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        assert downloader.download_image(ImageItem(f"{base_url}/a.jpg", "a.jpg"), str(tmp_path), base_url)
+    finally:
+        downloader.close()
+        server.shutdown()
+
+    assert (tmp_path / "a.jpg").read_bytes() == b"image"
+    assert writers and "async-image-download" not in writers
@@ -0,0 +1,83 @@
+import threading
+from multiprocessing import Pipe
+
+import pytest
+
+from data.db_repository import db
+from core.browser_broker import BrokerServer, AttachedDriver
+from core.engine import CrawlerEngine
+
+CAPABILITIES = {"browserName": "chrome", "goog:chromeOptions": {"debuggerAddress": "127.0.0.1:9222"}}
+
+
+class FakeExecutor:
+    _url = "http://127.0.0.1:9515"
+
+
+class FakeDriver:
+    session_id = "session-1"
+    command_executor = FakeExecutor()
+    capabilities = CAPABILITIES
+
+
+class FakeBroker:
+    def __init__(self):
+        self.released = []
+
+    def lease(self, driver_kwargs):
+        return FakeDriver()
+
+    def release(self, driver):
+        self.released.append(driver)
+
+
+def test_lease_forwards_the_browser_capabilities():
+    server = BrokerServer(0, b"key")
+    server.broker = FakeBroker()
+    client, server_end = Pipe()
+    thread = threading.Thread(target=server._handle, args=(server_end,), daemon=True)
+    thread.start()
+
+    client.send(("lease", {"uc": True}))
+    info = client.recv()
+    driver = AttachedDriver(info["executor_url"], info["session_id"], info.get("capabilities"))
+    client.close()
+    thread.join(5)
+
+    assert driver.session_id == "session-1"
+    assert driver.capabilities["goog:chromeOptions"]["debuggerAddress"] == "127.0.0.1:9222"
+    # 연결이 끊기면 빌린 브라우저는 반납됩니다.
+    assert len(server.broker.released) == 1
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    yield CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False, broker=FakeBroker())
+    db.set_db_path(old_path)
+
+
+def test_stop_from_another_thread_leaves_browsers_to_the_run_thread(engine):
+    driver = FakeDriver()
+    engine.driver = driver
+    started, finish = threading.Event(), threading.Event()
+
+    def run():
+        engine.run_thread = threading.current_thread()
+        started.set()
+        finish.wait(5)
+        engine.stop()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(5)
+
+    engine.stop()  # GUI 의 중지 버튼
+
+    assert engine.stop_event.is_set()
+    assert engine.broker.released == []
+    finish.set()
+    thread.join(5)
+    assert engine.broker.released == [driver]
+    assert engine.driver is None
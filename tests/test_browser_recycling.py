@@ -0,0 +1,41 @@
+import queue
+import threading
+
+import pytest
+
+from data.db_repository import db
+from core.browser_pool import BrowserSlot
+from core.engine import CrawlerEngine, FETCH_MODE_HTTP
+from core.work_queue import EpisodeQueue, EpisodeTask
+
+
+class FakeDriver:
+    pass
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    engine = CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False, fetch_mode=FETCH_MODE_HTTP,
+                           recycle_episodes=2)
+    engine._process_single_episode_http = lambda worker_id, task: None  # 모두 브라우저 폴백
+    engine._process_single_episode = lambda worker_id, slot, task: True
+    yield engine
+    db.set_db_path(old_path)
+
+
+def test_http_fallback_counts_episodes_against_the_borrowed_browser(engine):
+    slot = BrowserSlot(FakeDriver(), threading.Lock(), owns_driver=True)
+    free_slots = queue.Queue()
+    free_slots.put(slot)
+    recycled = []
+    engine._recycle_browser = lambda old, reason: recycled.append((old, reason))
+    tasks = [EpisodeTask(f"https://manatoki468.net/comic/{1000 + n}") for n in range(2)]
+
+    processed = engine._worker_loop(1, None, EpisodeQueue(tasks), free_slots)
+
+    assert processed == 2
+    assert recycled == [(slot.driver, "2 episodes")]
+    # 빌린 슬롯은 정리한 뒤 돌려놓습니다.
+    assert free_slots.get_nowait() is slot
@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+
+from core import concurrency
+from core.concurrency import AdaptiveLimit, HostLimits, FAILURE_THROTTLE
+
+
+@pytest.fixture(autouse=True)
+def no_cooldown(monkeypatch):
+    monkeypatch.setattr(concurrency, "DECREASE_COOLDOWN", 0)
+
+
+def test_limit_grows_by_one_per_round_of_successes():
+    limit = AdaptiveLimit("test", initial=2, maximum=4)
+
+    limit.record_success()
+    assert limit.limit == 2
+    limit.record_success()
+    assert limit.limit == 3
+    for _ in range(3):
+        limit.record_success()
+    assert limit.limit == 4
+    for _ in range(10):
+        limit.record_success()
+    assert limit.limit == 4
+
+
+def test_failure_halves_the_limit_down_to_minimum():
+    limit = AdaptiveLimit("test", initial=8, maximum=8)
+
+    limit.record_failure(FAILURE_THROTTLE)
+    assert limit.limit == 4
+    limit.record_failure()
+    limit.record_failure()
+    limit.record_failure()
+    assert limit.limit == 1
+
+
+def test_failures_within_cooldown_decrease_once(monkeypatch):
+    monkeypatch.setattr(concurrency, "DECREASE_COOLDOWN", 60)
+    limit = AdaptiveLimit("test", initial=8, maximum=8)
+
+    for _ in range(4):
+        limit.record_failure()
+
+    assert limit.limit == 4
+
+
+def test_latency_spike_decreases_by_one():
+    limit = AdaptiveLimit("test", initial=4, maximum=8)
+    limit.record_success(latency=1.0)
+    assert limit.limit == 4
+
+    limit.record_success(latency=20.0)  # 평균 1.0 -> 4.8 (> 2.5 배)
+
+    assert limit.limit == 3
+
+
+def test_acquire_waits_for_release_and_respects_stop():
+    limit = AdaptiveLimit("test", initial=1)
+    assert limit.try_acquire()
+    assert not limit.try_acquire()
+    stop = threading.Event()
+    stop.set()
+    assert limit.acquire(stop) is False
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(limit.acquire()))
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+    limit.release()
+    waiter.join(5)
+
+    assert acquired == [True]
+    assert limit.in_flight == 1
+
+
+def test_host_limits_are_independent():
+    limits = HostLimits(initial=2, maximum=4)
+    slow = limits.for_url("https://a.example/1.jpg")
+
+    slow.record_failure()
+
+    assert limits.for_url("https://a.example/2.jpg") is slow
+    assert slow.limit == 1
+    assert limits.for_url("https://b.example/1.jpg").limit == 2
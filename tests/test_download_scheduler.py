@@ -0,0 +1,125 @@
+import threading
+import time
+
+from data.models import ImageItem
+from core.download_scheduler import DownloadScheduler
+
+
+class CountingDownloader:
+    """호스트별 동시 요청 수의 최댓값과 받은 순서를 기록하는 다운로더"""
+
+    host_limits = None
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.order = []
+        self.active = {}
+        self.peak = {}
+        self.gate = threading.Event()
+        self.gate.set()
+        self.lock = threading.Lock()
+
+    def download_image(self, image, download_dir, referer, stop_event=None):
+        host = image.url.split("/")[2]
+        with self.lock:
+            self.order.append(image.url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        self.gate.wait(5)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        return True
+
+
+def images(host: str, count: int) -> list:
+    return [ImageItem(url=f"https://{host}/{i}.jpg", filename=f"{i}.jpg") for i in range(count)]
+
+
+def test_per_host_limit_caps_concurrent_requests(tmp_path):
+    downloader = CountingDownloader(delay=0.02)
+    scheduler = DownloadScheduler(downloader, max_concurrent=8, per_host=2)
+    scheduler.start()
+    try:
+        a = scheduler.submit(images("a.example", 10), str(tmp_path), "")
+        b = scheduler.submit(images("b.example", 10), str(tmp_path), "")
+        assert a.result(timeout=10) == (10, 10)
+        assert b.result(timeout=10) == (10, 10)
+    finally:
+        scheduler.shutdown()
+
+    assert downloader.peak == {"a.example": 2, "b.example": 2}
+
+
+def test_hosts_take_turns(tmp_path):
+    downloader = CountingDownloader()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1)
+    # 두 호스트의 이미지를 모두 넣어 둔 뒤 시작합니다.
+    a = scheduler.submit(images("a.example", 4), str(tmp_path), "")
+    b = scheduler.submit(images("b.example", 3), str(tmp_path), "")
+    scheduler.start()
+    try:
+        a.result(timeout=5)
+        b.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    # 먼저 넣은 에피소드가 끝날 때까지 다른 호스트를 굶기지 않습니다.
+    assert [url.split("/")[2][0] for url in downloader.order] == ["a", "b", "a", "b", "a", "b", "a"]
+
+
+def test_submit_waits_while_queue_is_full(tmp_path):
+    downloader = CountingDownloader()
+    downloader.gate.clear()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1, max_pending=4)
+    scheduler.start()
+    try:
+        scheduler.submit(images("a.example", 5), str(tmp_path), "")
+        while not downloader.order:
+            time.sleep(0.01)
+        submitted = []
+        producer = threading.Thread(
+            target=lambda: submitted.append(scheduler.submit(images("b.example", 2), str(tmp_path), "")))
+        producer.start()
+        producer.join(0.3)
+        # 대기 4장 + 2장 > 4: 자리가 날 때까지 기다립니다.
+        assert producer.is_alive()
+        assert scheduler.snapshot()["pending"] == 4
+
+        downloader.gate.set()
+        producer.join(5)
+        assert submitted[0].result(timeout=5) == (2, 2)
+    finally:
+        scheduler.shutdown()
+
+
+def test_full_queue_submit_gives_up_on_stop(tmp_path):
+    downloader = CountingDownloader()
+    downloader.gate.clear()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1, max_pending=2)
+    scheduler.start()
+    try:
+        scheduler.submit(images("a.example", 4), str(tmp_path), "")
+        stop = threading.Event()
+        stop.set()
+        assert scheduler.submit(images("b.example", 1), str(tmp_path), "", stop_event=stop) is None
+        # 상한을 넘기더라도 바로 넣는 경우 (다운로드 스레드 안에서 다시 넣을 때)
+        assert scheduler.submit(images("b.example", 1), str(tmp_path), "", block=False) is not None
+    finally:
+        downloader.gate.set()
+        scheduler.shutdown()
+
+
+def test_shutdown_fails_queued_images(tmp_path):
+    downloader = CountingDownloader()
+    downloader.gate.clear()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1)
+    scheduler.start()
+    future = scheduler.submit(images("a.example", 3), str(tmp_path), "")
+    while not downloader.order:
+        time.sleep(0.01)
+
+    threading.Timer(0.1, downloader.gate.set).start()
+    scheduler.shutdown()
+
+    assert future.result(timeout=5) == (1, 3)
@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+from data.db_repository import db
+from data.models import ImageItem
+from core.download_scheduler import DownloadScheduler
+from core.engine import CrawlerEngine
+from core.work_queue import ORDER_LATEST_FIRST, PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_BACKFILL
+
+SERIES_URL = "https://manatoki468.net/comic/900"
+
+
+def episode_url(number: int) -> str:
+    return f"https://manatoki468.net/comic/{1000 + number}"
+
+
+class RecordingDownloader:
+    """받은 순서를 기록하고, 첫 이미지는 release 될 때까지 붙잡는 다운로더"""
+
+    host_limits = None
+
+    def __init__(self):
+        self.order = []
+        self.first_started = threading.Event()
+        self.release = threading.Event()
+
+    def download_image(self, image, download_dir, referer, stop_event=None):
+        self.order.append(image.url)
+        if len(self.order) == 1:
+            self.first_started.set()
+            self.release.wait(5)
+        return True
+
+
+def images(prefix: str, count: int) -> list:
+    return [ImageItem(url=f"https://img.example/{prefix}/{i}.jpg", filename=f"{i}.jpg") for i in range(count)]
+
+
+def test_urgent_episode_images_go_before_the_backlog(tmp_path):
+    downloader = RecordingDownloader()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1)
+    scheduler.start()
+    try:
+        backlog = scheduler.submit(images("backlog", 10), str(tmp_path), "https://manatoki468.net/")
+        assert downloader.first_started.wait(5)
+        urgent = scheduler.submit(images("urgent", 2), str(tmp_path), "https://manatoki468.net/", priority=PRIORITY_URGENT)
+        downloader.release.set()
+        assert urgent.result(timeout=5) == (2, 2)
+        assert backlog.result(timeout=5) == (10, 10)
+    finally:
+        scheduler.shutdown()
+
+    # 이미 받기 시작한 첫 이미지 다음은 "지금 받기" 에피소드의 이미지
+    assert [url.split("/")[3] for url in downloader.order[1:3]] == ["urgent", "urgent"]
+
+
+def test_urgent_submit_does_not_wait_for_backpressure(tmp_path):
+    downloader = RecordingDownloader()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1, max_pending=5)
+    scheduler.start()
+    try:
+        scheduler.submit(images("backlog", 10), str(tmp_path), "https://manatoki468.net/")
+        assert downloader.first_started.wait(5)
+        stop = threading.Event()
+        stop.set()
+        # 대기열이 상한을 넘었으므로 보통 에피소드는 기다리다 중지되고, 급한 에피소드는 바로 들어갑니다.
+        assert scheduler.submit(images("normal", 1), str(tmp_path), "", stop_event=stop) is None
+        assert scheduler.submit(images("urgent", 1), str(tmp_path), "", stop_event=stop, priority=PRIORITY_URGENT) is not None
+    finally:
+        downloader.release.set()
+        scheduler.shutdown()
+
+
+class ListParser:
+    def __init__(self, episodes):
+        self.episodes = episodes
+
+    def iter_episode_urls(self, html):
+        return iter(self.episodes)
+
+    def get_title(self, html):
+        return "series"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    engine = CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False,
+                           queue_order=ORDER_LATEST_FIRST, latest_count=2)
+    engine.parser = ListParser([episode_url(n) for n in range(6, 0, -1)])
+    engine._fetch_list_page = lambda url: "<html></html>"
+    yield engine
+    db.set_db_path(old_path)
+
+
+def test_resumed_job_keeps_latest_first_order(engine):
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+    expected = [(task.url, task.priority) for task in tasks]
+    assert expected == [
+        (episode_url(6), PRIORITY_NORMAL), (episode_url(5), PRIORITY_NORMAL),
+        (episode_url(1), PRIORITY_BACKFILL), (episode_url(2), PRIORITY_BACKFILL),
+        (episode_url(3), PRIORITY_BACKFILL), (episode_url(4), PRIORITY_BACKFILL),
+    ]
+    # 최신 화 하나만 받고 중단된 실행
+    db.add_crawled_url(episode_url(6), episode_url(6), job.list_url, job.list_title, job.download_path)
+    engine.journal.episode_done(tasks[0])
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+
+    assert [(task.url, task.priority) for task in tasks] == expected[1:]
+
+
+def test_on_start_fires_when_the_first_image_is_dispatched(tmp_path):
+    downloader = RecordingDownloader()
+    scheduler = DownloadScheduler(downloader, max_concurrent=1, per_host=1)
+    scheduler.start()
+    started = []
+    try:
+        scheduler.submit(images("backlog", 3), str(tmp_path), "")
+        assert downloader.first_started.wait(5)
+        queued = scheduler.submit(images("queued", 3), str(tmp_path), "", on_start=lambda: started.append(len(downloader.order)))
+        # 앞 에피소드 뒤에서 기다리는 동안에는 다운로드 단계가 시작되지 않습니다.
+        assert started == []
+        downloader.release.set()
+        assert queued.result(timeout=5) == (3, 3)
+    finally:
+        scheduler.shutdown()
+
+    assert started == [3]
@@ -0,0 +1,131 @@
+import pytest
+
+from data.db_repository import db
+from data.models import ImageItem
+from core.concurrency import FAILURE_NOT_FOUND, FAILURE_TIMEOUT, FAILURE_THROTTLE
+from core.engine import CrawlerEngine, KNOWN_EPISODE_STOP, DEFERRED_RETRY_PASSES
+from core.work_queue import EpisodeDownload
+
+SERIES_URL = "https://manatoki468.net/comic/900"
+
+
+def episode_url(number: int) -> str:
+    return f"https://manatoki468.net/comic/{1000 + number}"
+
+
+class ListParser:
+    """목록 페이지 대신 에피소드 URL 목록(최신 화부터)을 돌려주는 파서"""
+
+    def __init__(self):
+        self.episodes = []
+
+    def iter_episode_urls(self, html):
+        return iter(self.episodes)
+
+    def get_title(self, html):
+        return "series"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    engine = CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False)
+    engine.parser = ListParser()
+    engine._fetch_list_page = lambda url: "<html></html>"
+    yield engine
+    db.set_db_path(old_path)
+
+
+def run(engine, failing=()):
+    """목록을 받아 큐에 들어간 에피소드를 처리한 것으로 치고, failing 은 재시도까지 실패한 것으로 남깁니다."""
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+    for task in tasks:
+        if task.url in failing:
+            engine.journal.episode_failed(task)
+            job.failed += 1
+        else:
+            db.add_crawled_url(task.url, task.url, job.list_url, job.list_title, job.download_path)
+            engine.journal.episode_done(task)
+    engine._complete_job(job)
+    return [task.url for task in tasks]
+
+
+def test_failed_episode_outside_scan_window_is_retried(engine):
+    engine.parser.episodes = [episode_url(n) for n in range(12, 0, -1)]
+    old_episode = episode_url(2)
+    assert old_episode in run(engine, failing={old_episode})
+
+    # 새 화가 올라온 다음 실행: 증분 확인은 KNOWN_EPISODE_STOP 개에서 멈추지만 실패한 화는 다시 큐에 들어갑니다.
+    engine.parser.episodes.insert(0, episode_url(13))
+    queued = run(engine)
+    assert 12 - 2 > KNOWN_EPISODE_STOP
+    assert queued == [episode_url(13), old_episode]
+
+    # 성공했으므로 그다음 실행에는 다시 들어가지 않습니다.
+    engine.parser.episodes.insert(0, episode_url(14))
+    assert run(engine) == [episode_url(14)]
+
+
+def test_failed_episode_is_retried_when_list_is_unchanged(engine):
+    engine.parser.episodes = [episode_url(n) for n in range(8, 0, -1)]
+    run(engine, failing={episode_url(1)})
+    assert run(engine) == [episode_url(1)]
+
+
+def download(engine, errors: list) -> EpisodeDownload:
+    """errors[i] 가 빈 문자열이면 받은 이미지, 아니면 그 종류로 실패한 이미지"""
+    engine.parser.episodes = [episode_url(1)]
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+    images = [ImageItem(url=f"https://img.example/{i}.jpg", filename=f"{i}.jpg") for i in range(len(errors))]
+    for image, error in zip(images, errors):
+        image.error = error
+    return EpisodeDownload(task=tasks[0], title="1화", images=images)
+
+
+def test_only_permanent_failures_are_committed(engine):
+    item = download(engine, [""] * 5 + [FAILURE_NOT_FOUND] * 5)
+
+    assert engine._should_commit(item, 5, 10)
+
+
+def test_transient_failures_commit_above_threshold(engine):
+    engine.commit_threshold = 0.9
+    item = download(engine, [""] * 9 + [FAILURE_TIMEOUT])
+
+    assert engine._should_commit(item, 9, 10)
+
+
+def test_transient_failures_below_threshold_keep_the_most_common_error(engine):
+    item = download(engine, [""] * 5 + [FAILURE_THROTTLE] * 3 + [FAILURE_TIMEOUT, FAILURE_NOT_FOUND])
+
+    assert not engine._should_commit(item, 5, 10)
+    assert item.task.error == FAILURE_THROTTLE
+
+
+def test_transient_failure_is_deferred_until_passes_run_out(engine):
+    task = download(engine, [FAILURE_TIMEOUT]).task
+    task.error = FAILURE_TIMEOUT
+    for deferral in range(1, DEFERRED_RETRY_PASSES + 1):
+        task.attempts = 2
+        engine._defer_or_fail(task)
+        assert engine.deferred == [task]
+        assert (task.deferrals, task.attempts, task.job.failed) == (deferral, 0, 0)
+        engine.deferred = []
+
+    engine._defer_or_fail(task)
+
+    assert engine.deferred == []
+    assert task.job.failed == 1
+    engine._complete_job(task.job)
+    assert engine.journal.failed_episodes(SERIES_URL) == [task.url]
+
+
+def test_permanent_failure_is_not_deferred(engine):
+    task = download(engine, [FAILURE_NOT_FOUND]).task
+    task.error = FAILURE_NOT_FOUND
+
+    engine._defer_or_fail(task)
+
+    assert engine.deferred == []
+    assert task.job.failed == 1
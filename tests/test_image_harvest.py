@@ -0,0 +1,77 @@
+import base64
+import json
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from data.db_repository import db
+from data.models import ImageItem
+from core.engine import CrawlerEngine
+from core.response_harvester import ResponseHarvester
+from core.work_queue import SeriesJob, EpisodeTask, EpisodeDownload
+
+
+def performance_log(url: str, request_id: str) -> list:
+    events = [
+        {"method": "Network.responseReceived", "params": {"requestId": request_id, "type": "Image",
+                                                          "response": {"url": url, "mimeType": "image/jpeg"}}},
+        {"method": "Network.loadingFinished", "params": {"requestId": request_id}},
+    ]
+    return [{"message": json.dumps({"message": event})} for event in events]
+
+
+class FakeDriver:
+    def __init__(self, images: list, lock: threading.Lock):
+        self.lock = lock
+        self.log = [entry for i, image in enumerate(images) for entry in performance_log(image.url, str(i))]
+        self.calls_with_lock_held = 0
+
+    def get_log(self, kind):
+        log, self.log = self.log, []
+        return log
+
+    def execute_cdp_cmd(self, command, params):
+        self.calls_with_lock_held += self.lock.locked()
+        return {"body": base64.b64encode(b"image").decode(), "base64Encoded": True}
+
+
+def test_harvest_takes_the_shared_lock_per_image(tmp_path):
+    images = [ImageItem(url=f"https://img.example/{i}.jpg", filename=f"{i:03d}.jpg") for i in range(3)]
+    lock = threading.Lock()
+    driver = FakeDriver(images, lock)
+    sessions = []
+
+    @contextmanager
+    def session():
+        with lock:
+            sessions.append(1)
+            yield driver
+
+    remaining = ResponseHarvester().harvest(session, images, str(tmp_path))
+
+    assert remaining == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["000.jpg", "001.jpg", "002.jpg"]
+    # 목록 읽기 1번 + 이미지마다 1번: 이미지 사이에는 락을 놓습니다.
+    assert len(sessions) == 1 + len(images)
+    assert driver.calls_with_lock_held == len(images)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    yield CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False)
+    db.set_db_path(old_path)
+
+
+def test_deferred_retry_counts_harvested_images(engine, tmp_path):
+    job = SeriesJob(target_url="https://manatoki468.net/comic/900", list_url="https://manatoki468.net/comic/900",
+                    list_title="series", download_path=str(tmp_path), referer="https://manatoki468.net/")
+    parsed = [ImageItem(url=f"https://img.example/{i}.jpg", filename=f"{i:03d}.jpg") for i in range(10)]
+    item = EpisodeDownload(task=EpisodeTask("https://manatoki468.net/comic/1001", job=job), title="1화",
+                           images=parsed[8:], harvested=8, parsed=parsed)
+
+    engine._defer_download(item)
+
+    assert item.task.images == parsed
@@ -0,0 +1,62 @@
+import pytest
+
+from data.db_repository import db
+from core.engine import CrawlerEngine
+
+
+def episode_url(number: int, mirror: int = 468) -> str:
+    return f"https://manatoki{mirror}.net/comic/{1000 + number}"
+
+
+class ListParser:
+    def __init__(self, episodes):
+        self.episodes = episodes
+
+    def iter_episode_urls(self, html):
+        return iter(self.episodes)
+
+    def get_title(self, html):
+        return "series"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    engine = CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False)
+    engine.parser = ListParser([episode_url(n) for n in range(3, 0, -1)])
+    engine._fetch_list_page = lambda url: "<html></html>"
+    yield engine
+    db.set_db_path(old_path)
+
+
+def test_resume_survives_a_mirror_domain_change(engine):
+    job, tasks = engine._prepare_series_job("https://manatoki468.net/comic/900")
+    db.add_crawled_url(tasks[0].url, "3화", job.list_url, job.list_title, job.download_path)
+    engine.journal.episode_done(tasks[0])
+    # 목록을 다시 받으면 안 됩니다: 저널에서 이어 가야 함
+    engine._fetch_list_page = lambda url: pytest.fail("list page fetched again")
+
+    job, tasks = engine._prepare_series_job("https://manatoki469.net/comic/900")
+
+    assert job.list_url == "https://manatoki469.net/comic/900"
+    assert job.referer == "https://manatoki469.net/"
+    assert [task.url for task in tasks] == [episode_url(2, 469), episode_url(1, 469)]
+
+    # 옮긴 저널 행이 새 주소로 갱신되는지
+    for task in tasks:
+        db.add_crawled_url(task.url, task.url, job.list_url, job.list_title, job.download_path)
+        engine.journal.episode_done(task)
+    assert engine.journal.resume("https://manatoki469.net/comic/900")[1] == []
+
+
+def test_failed_episodes_follow_the_new_mirror(engine):
+    job, tasks = engine._prepare_series_job("https://manatoki468.net/comic/900")
+    for task in tasks[1:]:
+        db.add_crawled_url(task.url, task.url, job.list_url, job.list_title, job.download_path)
+        engine.journal.episode_done(task)
+    engine.journal.episode_failed(tasks[0])
+    job.failed += 1
+    engine._complete_job(job)
+
+    assert engine.journal.failed_episodes("https://manatoki469.net/comic/900") == [episode_url(3, 469)]
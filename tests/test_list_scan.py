@@ -0,0 +1,117 @@
+import pytest
+
+from data.db_repository import db
+from core.engine import CrawlerEngine
+
+SERIES_URL = "https://manatoki468.net/comic/900"
+
+
+def episode_url(number: int, mirror: int = 468) -> str:
+    return f"https://manatoki{mirror}.net/comic/{1000 + number}"
+
+
+class ListParser:
+    """최신 화부터 에피소드를 내주고, 실제로 읽힌 개수를 셉니다."""
+
+    def __init__(self, episodes):
+        self.episodes = episodes
+        self.consumed = 0
+
+    def iter_episode_urls(self, html):
+        for url in self.episodes:
+            self.consumed += 1
+            yield url
+
+    def get_title(self, html):
+        return "series"
+
+
+def make_engine(tmp_path, count: int, **kwargs) -> CrawlerEngine:
+    engine = CrawlerEngine(download_path=str(tmp_path / "downloads"), persist_session=False, **kwargs)
+    engine.parser = ListParser([episode_url(n) for n in range(count, 0, -1)])
+    engine._fetch_list_page = lambda url: "<html></html>"
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+    yield
+    db.set_db_path(old_path)
+
+
+def crawl(engine, job, tasks):
+    for task in tasks:
+        db.add_crawled_url(task.url, task.url, job.list_url, job.list_title, job.download_path)
+        engine.journal.episode_done(task)
+
+
+def crawl_all(engine, job, tasks):
+    crawl(engine, job, tasks)
+    engine._complete_job(job)
+
+
+def test_unchanged_list_is_skipped_without_db_scan(tmp_path, monkeypatch):
+    engine = make_engine(tmp_path, 3)
+    crawl_all(engine, *engine._prepare_series_job(SERIES_URL))
+    monkeypatch.setattr(db, "is_url_crawled", lambda url: pytest.fail("episodes scanned"))
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+    assert tasks == []
+    # 미러 도메인만 바뀌어도 같은 목록입니다.
+    engine.parser = ListParser([episode_url(n, 469) for n in range(3, 0, -1)])
+    job, tasks = engine._prepare_series_job("https://manatoki469.net/comic/900")
+    assert tasks == []
+
+
+def test_new_episode_changes_the_fingerprint(tmp_path):
+    engine = make_engine(tmp_path, 3)
+    crawl_all(engine, *engine._prepare_series_job(SERIES_URL))
+    engine.parser = ListParser([episode_url(n) for n in range(4, 0, -1)])
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+
+    assert [task.url for task in tasks] == [episode_url(4)]
+
+
+def test_fingerprint_is_not_saved_when_episodes_failed(tmp_path):
+    engine = make_engine(tmp_path, 3)
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+    crawl(engine, job, tasks[1:])
+    engine.journal.episode_failed(tasks[0])
+    job.failed += 1
+    engine._complete_job(job)
+    assert db.get_list_fingerprint(job.list_url) is None
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+
+    # 실패한 화는 목록이 그대로여도 다시 받습니다.
+    assert [task.url for task in tasks] == [episode_url(3)]
+
+
+def mark_crawled(numbers):
+    for n in numbers:
+        db.add_crawled_url(episode_url(n), str(n), SERIES_URL, "series")
+
+
+def test_scan_stops_after_consecutive_known_episodes(tmp_path):
+    engine = make_engine(tmp_path, 30)
+    # 27화는 새로 받을 화, 1화는 예전에 빠뜨린 화 (증분 확인 범위 밖)
+    mark_crawled(n for n in range(2, 31) if n != 27)
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+
+    assert [task.url for task in tasks] == [episode_url(27)]
+    # 최신 FINGERPRINT_DEPTH 화 이후로는 목록을 더 읽지 않습니다.
+    assert engine.parser.consumed == 10
+
+
+def test_full_resync_checks_every_episode(tmp_path):
+    engine = make_engine(tmp_path, 30, full_resync=True)
+    mark_crawled(n for n in range(2, 31) if n != 27)
+
+    job, tasks = engine._prepare_series_job(SERIES_URL)
+
+    assert [task.url for task in tasks] == [episode_url(27), episode_url(1)]
+    assert engine.parser.consumed == 30
@@ -0,0 +1,99 @@
+from parser.manatoki import ManatokiParser
+
+LIST_HTML = """
+<html><body>
+<article itemprop="articleBody">
+  <div class="serial-list">
+    <ul class="list-body">
+      <li class="list-item"><div class="wr-subject">
+        <a data-href="/bookmark/1003" class="bookmark">북마크</a>
+        <a href="https://manatoki468.net/comic/1003?spage=1&amp;page=2" class="item-subject">3화</a>
+      </div></li>
+      <li class="list-item"><div class="wr-subject">
+        <a class="item-subject" data-href="/bookmark/1002" href="https://manatoki468.net/comic/1002">2화</a>
+      </div></li>
+      <li class="list-item"><div class="wr-subject">
+        <a HREF='https://manatoki468.net/comic/1001'>1화</a>
+      </div></li>
+    </ul>
+  </div>
+  <div class="list-share"><a data-href="/share/list">공유</a><a href="/board/next">다음</a></div>
+</article>
+</body></html>
+"""
+
+
+def test_iter_episode_urls_matches_get_episode_urls():
+    parser = ManatokiParser()
+
+    expected = parser.get_episode_urls(LIST_HTML)
+
+    assert expected == [
+        "https://manatoki468.net/comic/1003?spage=1&page=2",
+        "https://manatoki468.net/comic/1002",
+        "https://manatoki468.net/comic/1001",
+    ]
+    assert list(parser.iter_episode_urls(LIST_HTML)) == expected
+
+
+def episode_list(body: str, before: str = "", after: str = "") -> str:
+    return f"""
+<html><body>
+{before}
+<article itemprop="articleBody">
+  <div class="serial-list">
+{body}
+  </div>
+  <div class="recommend"><a href="https://manatoki468.net/comic/555">다른 작품</a></div>
+</article>
+{after}
+</body></html>
+"""
+
+
+EPISODES = """
+    <div class="wr-subject"><a href="https://manatoki468.net/comic/1002">2화</a></div>
+    <div class="wr-subject"><a href="https://manatoki468.net/comic/1001">1화</a></div>
+"""
+
+
+def test_serial_list_outside_the_article_is_ignored():
+    sidebar = '<div class="serial-list"><a href="https://manatoki468.net/comic/777">사이드바</a></div>'
+    source = episode_list(EPISODES, before=sidebar)
+
+    assert list(ManatokiParser().iter_episode_urls(source)) == [
+        "https://manatoki468.net/comic/1002",
+        "https://manatoki468.net/comic/1001",
+    ]
+
+
+def test_self_closing_div_does_not_extend_the_list():
+    source = episode_list('<div class="clearfix"/>' + EPISODES)
+    parser = ManatokiParser()
+
+    assert list(parser.iter_episode_urls(source)) == parser.get_episode_urls(source) == [
+        "https://manatoki468.net/comic/1002",
+        "https://manatoki468.net/comic/1001",
+    ]
+
+
+def test_unclosed_list_stops_at_the_end_of_the_article():
+    source = episode_list(EPISODES + "<div>", after='<div><a href="https://manatoki468.net/comic/888">인기</a></div>')
+
+    urls = list(ManatokiParser().iter_episode_urls(source))
+
+    assert "https://manatoki468.net/comic/888" not in urls
+    assert urls[:2] == ["https://manatoki468.net/comic/1002", "https://manatoki468.net/comic/1001"]
+
+
+def test_only_episode_links_are_yielded():
+    body = EPISODES + """
+    <div class="list-page"><a href="/board/next?page=2">다음</a><a href="javascript:share()">공유</a></div>
+"""
+    source = episode_list(body)
+    parser = ManatokiParser()
+
+    assert list(parser.iter_episode_urls(source)) == parser.get_episode_urls(source) == [
+        "https://manatoki468.net/comic/1002",
+        "https://manatoki468.net/comic/1001",
+    ]
@@ -0,0 +1,86 @@
+import sqlite3
+import time
+
+import pytest
+
+from data.db_repository import db
+from core.update_scheduler import UpdateScheduler, estimate_cadence, DAY, HOUR, DEFAULT_CADENCE, MAX_CADENCE
+
+NOW = time.time()
+
+
+def test_cadence_is_median_gap_between_updates():
+    # 하루에 몰아서 받은 백필은 업데이트 하나로 봅니다.
+    times = [NOW - 21 * DAY - n * 60 for n in range(20)] + [NOW - 14 * DAY, NOW - 7 * DAY, NOW - DAY]
+
+    assert estimate_cadence(times, NOW) == pytest.approx(7 * DAY)
+
+
+def test_cadence_defaults_to_weekly_without_history():
+    assert estimate_cadence([NOW - HOUR], NOW) == DEFAULT_CADENCE
+
+
+def test_dormant_series_is_checked_less_often():
+    times = [NOW - 100 * DAY, NOW - 99 * DAY, NOW - 98 * DAY]
+
+    assert estimate_cadence(times, NOW) == MAX_CADENCE
+
+
+@pytest.fixture
+def series(tmp_path):
+    old_path = db.db_path
+    db.set_db_path(str(tmp_path / "test.db"))
+
+    def add(name: str, gap_days: float, checked_days_ago: float = None):
+        list_url = f"https://manatoki468.net/comic/{name}"
+        for n in range(4):
+            episode = f"{list_url}0{n}"
+            db.add_crawled_url(episode, episode, list_url, name)
+            set_time("crawled_urls", "crawled_at", "url", episode, NOW - (n + 1) * gap_days * DAY)
+        if checked_days_ago is not None:
+            set_time("mana_lists", "last_checked_at", "mana_list_url", list_url, NOW - checked_days_ago * DAY)
+        return list_url
+
+    yield add
+    db.set_db_path(old_path)
+
+
+def set_time(table: str, column: str, key_column: str, key: str, epoch: float):
+    conn = sqlite3.connect(db.db_path)
+    try:
+        conn.execute(f"UPDATE {table} SET {column} = datetime(?, 'unixepoch') WHERE {key_column} = ?", (int(epoch), key))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_most_overdue_series_come_first(series):
+    weekly = series("1", gap_days=7, checked_days_ago=4)  # 3.5일 간격, x1.1
+    daily = series("2", gap_days=1, checked_days_ago=2)  # 0.5일 간격, x4
+    series("3", gap_days=7, checked_days_ago=1)  # 아직 차례가 아님
+
+    assert UpdateScheduler(runner=None).due_series(NOW) == [daily, weekly]
+
+
+def test_hourly_budget_limits_list_checks(series):
+    series("1", gap_days=7, checked_days_ago=4)
+    daily = series("2", gap_days=1, checked_days_ago=2)
+
+    assert UpdateScheduler(runner=None, list_budget=1).due_series(NOW) == [daily]
+
+    # 지난 한 시간 동안 (수동 크롤링 포함) 이미 예산만큼 확인했으면 쉽니다.
+    db.mark_list_checked(series("4", gap_days=1, checked_days_ago=2))
+    assert UpdateScheduler(runner=None, list_budget=1).due_series(NOW) == []
+
+
+def test_run_once_marks_lists_and_runs_the_batch(series):
+    daily = series("2", gap_days=1, checked_days_ago=2)
+    batches = []
+    scheduler = UpdateScheduler(runner=batches.append, is_busy=lambda: True)
+
+    assert scheduler.run_once() == 0
+    scheduler.is_busy = lambda: False
+    assert scheduler.run_once() == 1
+    assert batches == [[daily]]
+    # 방금 확인했으므로 다음 차례에는 건너뜁니다.
+    assert scheduler.run_once() == 0
@@ -0,0 +1,82 @@
+import sqlite3
+
+import pytest
+
+from data.db_repository import DBRepository, url_key
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://manatoki468.net/comic/123", "manatoki/comic/123"),
+    ("https://manatoki469.com/comic/123/", "manatoki/comic/123"),
+    ("https://www.manatoki470.net/comic/123?spage=2", "manatoki/comic/123"),
+    ("https://manatoki468.net/bbs/page.php?b=b&a=a", "manatoki/bbs/page.php?a=a&b=b"),
+    ("comic/123", "comic/123"),
+])
+def test_url_key_ignores_mirror_number_and_tld(url, key):
+    assert url_key(url) == key
+
+
+def legacy_db(path) -> None:
+    """url_key/list_key 컬럼이 생기기 전의 DB. 같은 시리즈가 도메인만 바뀌어 두 번 기록됨."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE mana_lists (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mana_list_url TEXT NOT NULL UNIQUE,
+            mana_title TEXT,
+            local_store_path TEXT
+        );
+        CREATE TABLE crawled_urls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL UNIQUE,
+            page_title TEXT,
+            list_url TEXT,
+            mana_list_id INTEGER,
+            crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO mana_lists (id, mana_list_url, mana_title, local_store_path)
+            VALUES (1, 'https://manatoki468.net/comic/900', 'series', '/old/path');
+        INSERT INTO mana_lists (id, mana_list_url, mana_title, local_store_path)
+            VALUES (2, 'https://manatoki469.net/comic/900', NULL, NULL);
+        INSERT INTO crawled_urls (url, page_title, list_url, mana_list_id)
+            VALUES ('https://manatoki468.net/comic/1001', '1화', 'https://manatoki468.net/comic/900', 1);
+        INSERT INTO crawled_urls (url, page_title, list_url, mana_list_id)
+            VALUES ('https://manatoki469.net/comic/1002', '2화', 'https://manatoki469.net/comic/900', 2);
+    """)
+    conn.commit()
+    conn.close()
+
+
+def test_migration_backfills_keys_and_merges_duplicate_lists(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    legacy_db(path)
+    repo = DBRepository(path)
+
+    # 다른 미러 도메인으로 물어봐도 기존 기록을 찾습니다.
+    assert repo.is_url_crawled("https://manatoki470.net/comic/1001")
+    assert repo.is_url_crawled("https://manatoki470.net/comic/1002")
+    assert not repo.is_url_crawled("https://manatoki470.net/comic/1003")
+
+    conn = sqlite3.connect(path)
+    try:
+        lists = conn.execute("SELECT id, mana_list_url, mana_title, local_store_path, list_key FROM mana_lists").fetchall()
+        episodes = conn.execute("SELECT url_key, mana_list_id FROM crawled_urls ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    # 최근(마지막 도메인) 행 하나만 남기고 비어 있는 값은 이전 행에서 채웁니다.
+    assert lists == [(2, "https://manatoki469.net/comic/900", "series", "/old/path", "manatoki/comic/900")]
+    assert episodes == [("manatoki/comic/1001", 2), ("manatoki/comic/1002", 2)]
+
+
+def test_same_episode_on_new_mirror_is_not_recorded_twice(tmp_path):
+    repo = DBRepository(str(tmp_path / "test.db"))
+    repo.add_crawled_url("https://manatoki468.net/comic/1001", "1화", "https://manatoki468.net/comic/900", "series")
+    repo.add_crawled_url("https://manatoki469.net/comic/1001", "1화", "https://manatoki469.net/comic/900", "series")
+
+    conn = sqlite3.connect(repo.db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM crawled_urls").fetchone() == (1,)
+        # 목록 행은 새 주소로 갱신됩니다.
+        assert conn.execute("SELECT mana_list_url FROM mana_lists").fetchall() == [("https://manatoki469.net/comic/900",)]
+    finally:
+        conn.close()
@@ -0,0 +1,125 @@
+import threading
+
+from core.work_queue import (EpisodeQueue, EpisodeTask, order_episodes, ORDER_NEWEST, ORDER_OLDEST, ORDER_LATEST_FIRST,
+                             PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_BACKFILL)
+
+
+def urls(tasks) -> list:
+    return [task.url for task in tasks]
+
+
+def drain(queue: EpisodeQueue) -> list:
+    tasks = []
+    while (task := queue.get()) is not None:
+        tasks.append(task)
+        queue.task_done()
+    return tasks
+
+
+def test_same_priority_keeps_insertion_order():
+    queue = EpisodeQueue([EpisodeTask(f"ep{n}") for n in range(5)])
+
+    assert urls(drain(queue)) == ["ep0", "ep1", "ep2", "ep3", "ep4"]
+
+
+def test_lower_priority_value_goes_first():
+    queue = EpisodeQueue([EpisodeTask("backfill", priority=PRIORITY_BACKFILL), EpisodeTask("normal")])
+    queue.put(EpisodeTask("urgent", priority=PRIORITY_URGENT))
+
+    assert urls(drain(queue)) == ["urgent", "normal", "backfill"]
+
+
+def test_retry_requeues_behind_same_priority_until_max_retries():
+    queue = EpisodeQueue([EpisodeTask("a"), EpisodeTask("b")], max_retries=2)
+    task = queue.get()
+
+    assert queue.retry(task) is True
+    queue.task_done()
+    assert urls([queue.get()]) == ["b"]
+    queue.task_done()
+    assert queue.get() is task
+    assert queue.retry(task) is True
+    queue.task_done()
+    assert queue.get() is task
+    # 세 번째 실패: 더 이상 넣지 않음
+    assert queue.retry(task) is False
+    queue.task_done()
+    assert task.attempts == 3
+    assert queue.get() is None
+    assert queue.idle()
+
+
+def test_get_waits_for_in_flight_task_that_may_come_back():
+    queue = EpisodeQueue([EpisodeTask("a")])
+    task = queue.get()
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(queue.get()))
+    waiter.start()
+    waiter.join(0.2)
+    # 처리 중인 작업이 있으므로 빈 큐라도 None 을 돌려주지 않고 기다립니다.
+    assert waiter.is_alive()
+
+    queue.retry(task)
+    queue.task_done()
+    waiter.join(5)
+
+    assert result == [task]
+
+
+def test_open_queue_waits_for_close():
+    queue = EpisodeQueue(closed=False)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(queue.get()))
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+
+    queue.put(EpisodeTask("late"))
+    waiter.join(5)
+    assert urls(result) == ["late"]
+    queue.task_done()
+
+    waiter = threading.Thread(target=lambda: result.append(queue.get()))
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+    queue.close()
+    waiter.join(5)
+    assert result[-1] is None
+
+
+def test_get_returns_none_when_stopped():
+    queue = EpisodeQueue(closed=False)
+    stop = threading.Event()
+    stop.set()
+
+    assert queue.get(stop) is None
+
+
+NEWEST_FIRST = ["ep5", "ep4", "ep3", "ep2", "ep1"]
+
+
+def test_order_newest_keeps_list_order():
+    assert order_episodes(NEWEST_FIRST, ORDER_NEWEST) == [(url, PRIORITY_NORMAL) for url in NEWEST_FIRST]
+
+
+def test_order_oldest_starts_from_first_episode():
+    assert order_episodes(NEWEST_FIRST, ORDER_OLDEST) == [(url, PRIORITY_NORMAL) for url in reversed(NEWEST_FIRST)]
+
+
+def test_order_latest_first_backfills_from_first_episode():
+    assert order_episodes(NEWEST_FIRST, ORDER_LATEST_FIRST, latest_count=2) == [
+        ("ep5", PRIORITY_NORMAL), ("ep4", PRIORITY_NORMAL),
+        ("ep1", PRIORITY_BACKFILL), ("ep2", PRIORITY_BACKFILL), ("ep3", PRIORITY_BACKFILL),
+    ]
+
+
+def test_backfill_of_one_series_waits_behind_latest_of_the_next():
+    # 배치: 시리즈 A 를 먼저 넣고 B 를 나중에 넣어도 B 의 최신 화가 A 의 백필보다 먼저
+    queue = EpisodeQueue(closed=False)
+    for prefix in ("a", "b"):
+        for url, priority in order_episodes([f"{prefix}3", f"{prefix}2", f"{prefix}1"], ORDER_LATEST_FIRST, 1):
+            queue.put(EpisodeTask(url, priority=priority))
+    queue.close()
+
+    assert urls(drain(queue)) == ["a3", "b3", "a1", "a2", "b1", "b2"]